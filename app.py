@@ -1,10 +1,26 @@
+import os
 import sys
+import time
+_start = time.perf_counter()
+
 from PyQt5.QtWidgets import QApplication
+from backend.core.structured_log import configure_logging
 from gui.main_window import MainWindow
 
 if __name__ == "__main__":
+    # LITRPG_STARTUP_REPORT=1 prints startup timings; a path ending in .json writes them there
+    report_destination = os.environ.get("LITRPG_STARTUP_REPORT")
+    startup_timer = None
+    if report_destination:
+        from gui.startup_timer import StartupTimer, print_report
+        startup_timer = StartupTimer(_start, lambda report: print_report(report, report_destination))
+        startup_timer.mark('imports')
+    # LITRPG_LOG_LEVEL sets what is kept in the log buffer; errors dump it to data/debug
+    configure_logging(dump_directory=os.path.join("data", "debug"))
     app = QApplication(sys.argv)
     main_window = MainWindow()
+    if startup_timer is not None:
+        startup_timer.mark('window_construction')
+        startup_timer.watch(main_window)
     main_window.show()
     sys.exit(app.exec_())
-
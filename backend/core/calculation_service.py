@@ -0,0 +1,160 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .calculator_context import CalculatorContext
+from .checkpoint_compare import load_checkpoint_snapshot
+from ..database.character_database import CharacterDatabase
+from ..stat_entry_utils import stat_entry_problems
+
+EMPTY_STATE = {'stats': {}, 'experience': {}, 'arts': {}, 'traits': []}
+
+
+class ServiceContext:
+    """
+    A calculator context computing the values the desktop app shows from its character graph.
+
+    The graph keeps its nodes between requests, so values whose inputs did not
+    change from the previous request are not recomputed.
+    """
+
+    def __init__(self):
+        self.context = CalculatorContext()
+        self.graph = self.context.character_graph
+
+    def compute(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        self.context.load(state)
+        # Resetting the experience does not signal, so make sure the graph has seen this state
+        self.graph.refresh()
+        stats = self.context.stats_calculator
+        experience = self.context.experience_calculator
+        arts = self.context.arts_calculator.get_arts()
+        return {
+            'level': stats.level,
+            'realm': self.graph.get('realm'),
+            'free_points': stats.free_points,
+            'train_points': stats.train_points,
+            'stats': self.graph.get('derived_stats'),
+            'primary_totals': self.graph.get('primary_totals'),
+            'energy': self.graph.get('energy'),
+            'arts': {name: self.graph.art_results(name) for name in arts},
+            'traits': {name: dict(zip(['grade', 'level', 'exp', 'max_exp'], self.graph.trait_level(name)))
+                       for name in experience.get_all_experience().get('trait', {})},
+        }
+
+
+class CalculationService:
+    """
+    Computes character results on a fixed pool of worker threads.
+
+    Qt delivers signals directly, so a calculator context only works in the
+    thread that created it: every worker builds its own ``ServiceContext``
+    when the pool starts and reuses it for every request it handles. A request
+    is ``{"state": {...}}`` or ``{"character": name}``, optionally with a
+    ``chapter`` and ``checkpoint``. Batches are split into one chunk per
+    worker, so a batch costs one dispatch per worker rather than one per request.
+    """
+
+    def __init__(self, data_directory: Optional[str] = None, workers: int = 2):
+        self.character_db = CharacterDatabase(data_directory) if data_directory else None
+        self.workers = workers
+        self.local = threading.local()
+        self.executor = None
+
+    def start(self) -> None:
+        if self.executor is not None:
+            return
+        self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="calculation",
+                                           initializer=self._init_worker)
+        # One task per worker, held at a barrier until all of them exist, so every context is built up front
+        barrier = threading.Barrier(self.workers)
+        for future in [self.executor.submit(barrier.wait) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def compute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.start()
+        return self.executor.submit(self._compute, request).result()
+
+    def compute_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Compute many requests; a request that fails gets ``{"error": message}`` in its place.
+        """
+        self.start()
+        chunk_size = max(1, -(-len(requests) // self.workers))
+        futures = [self.executor.submit(self._compute_chunk, requests[start:start + chunk_size])
+                   for start in range(0, len(requests), chunk_size)]
+        return [result for future in futures for result in future.result()]
+
+    def _init_worker(self):
+        self.local.context = ServiceContext()
+
+    def _compute_chunk(self, requests):
+        results = []
+        for request in requests:
+            try:
+                results.append(self._compute(request))
+            except ValueError as e:
+                results.append({'error': str(e)})
+        return results
+
+    def _compute(self, request):
+        try:
+            state = self.resolve_state(request)
+        except (OSError, KeyError, TypeError) as e:
+            raise ValueError(f"Cannot load character state: {type(e).__name__}: {e}")
+        try:
+            return self.local.context.compute(state)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Cannot compute character state: {type(e).__name__}: {e}")
+
+    def resolve_state(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(request, dict):
+            raise ValueError("Request must be an object")
+        if 'state' in request:
+            if not isinstance(request['state'], dict):
+                raise ValueError("'state' must be an object")
+            return self._checked_state(request['state'])
+        if 'character' not in request:
+            raise ValueError("Request needs a 'state' or a 'character'")
+        if self.character_db is None:
+            raise ValueError("No data directory configured; send a 'state' instead")
+        character = self._checked_character_name(request['character'])
+        chapter = request.get('chapter')
+        checkpoint = request.get('checkpoint')
+        if (chapter is None) != (checkpoint is None):
+            raise ValueError("Give both a chapter and a checkpoint, or neither for the current state")
+        if checkpoint is not None and (not isinstance(chapter, int) or isinstance(chapter, bool)
+                                       or not isinstance(checkpoint, str)):
+            raise ValueError("'chapter' must be an integer and 'checkpoint' a string")
+        if checkpoint is None:
+            state = self.character_db.load_character(character)
+        else:
+            state = load_checkpoint_snapshot(self.character_db, character, chapter, checkpoint)
+        if not isinstance(state, dict):
+            raise ValueError(f"Invalid state: stored data for {character} is not an object")
+        return self._checked_state(state)
+
+    def _checked_state(self, state):
+        # Sections left out start from the calculators' defaults
+        state = dict(EMPTY_STATE, **state)
+        problems = stat_entry_problems(state)
+        if problems:
+            raise ValueError(f"Invalid state: {'; '.join(problems)}")
+        return state
+
+    def _checked_character_name(self, character):
+        # Names come from the network; they must name a file directly inside the data directory
+        if not isinstance(character, str) or not character or character in ('.', '..') \
+                or '/' in character or '\\' in character:
+            raise ValueError(f"Invalid character name: {character!r}")
+        data_directory = os.path.abspath(self.character_db.data_directory)
+        path = os.path.abspath(self.character_db._get_character_file_path(character))
+        if os.path.dirname(path) != data_directory:
+            raise ValueError(f"Invalid character name: {character!r}")
+        return character
@@ -0,0 +1,55 @@
+from .stats_calculator import StatsCalculator
+from .energy_calculator import EnergyCalculator
+from .experience_calculator import ExperienceCalculator
+from .arts_calculator import ArtsCalculator
+from .traits_calculator import TraitsCalculator
+from .character_graph import CharacterGraph
+
+
+class CalculatorContext:
+    """
+    A complete set of calculators wired together the way the main window wires them.
+
+    Used wherever character state has to be recomputed without the GUI. Qt
+    signals are delivered directly, so a context must be used from the thread
+    that created it.
+    """
+
+    def __init__(self):
+        self.stats_calculator = StatsCalculator()
+        self.energy_calculator = EnergyCalculator(self.stats_calculator)
+        self.experience_calculator = ExperienceCalculator(self.stats_calculator)
+        self.arts_calculator = ArtsCalculator(self.stats_calculator, self.experience_calculator)
+        self.traits_calculator = TraitsCalculator(self.experience_calculator)
+        self.character_graph = CharacterGraph(self.stats_calculator, self.experience_calculator,
+                                              self.arts_calculator)
+        self.energy_calculator.connect_graph(self.character_graph)
+        self.experience_calculator.character_level_up.connect(self.stats_calculator.handle_level_up)
+        self.experience_calculator.character_levels_gained.connect(self.stats_calculator.handle_level_ups)
+
+    def reset(self):
+        self.stats_calculator.reset()
+        self.energy_calculator.reset()
+        self.experience_calculator.reset()
+        self.arts_calculator.reset()
+        self.traits_calculator.reset()
+
+    def load(self, state):
+        self.reset()
+        self.stats_calculator.load_stats(state.get('stats', {}))
+        self.energy_calculator.load_energy(state.get('energy', {}))
+        self.experience_calculator.load_experience(state.get('experience', {}))
+        self.arts_calculator.load_arts(state.get('arts', {}))
+        self.traits_calculator.load_traits(state.get('traits', []))
+        if 'initial_stat_index' in state:
+            self.experience_calculator.initial_stat_index = state['initial_stat_index']
+
+    def snapshot(self):
+        return {
+            "stats": self.stats_calculator.snapshot(),
+            "energy": self.energy_calculator.snapshot(),
+            "experience": self.experience_calculator.snapshot(),
+            "arts": self.arts_calculator.snapshot(),
+            "traits": self.traits_calculator.snapshot(),
+            "initial_stat_index": self.experience_calculator.initial_stat_index,
+        }
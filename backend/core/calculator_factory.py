@@ -3,7 +3,11 @@ from .energy_calculator import EnergyCalculator
 from .experience_calculator import ExperienceCalculator
 from .arts_calculator import ArtsCalculator
 from .traits_calculator import TraitsCalculator
+from .character_graph import CharacterGraph
+from .calculator_history import CalculatorHistory
+from .event_log import EventRecorder
 from ..database.character_database import CharacterDatabase
+from ..database.event_store import EventStore
 
 class CalculatorFactory:
     @staticmethod
@@ -18,7 +22,15 @@ class CalculatorFactory:
             return ExperienceCalculator(*args, **kwargs)
         elif calculator_type == "traits":
             return TraitsCalculator(*args, **kwargs)
+        elif calculator_type == "character_graph":
+            return CharacterGraph(*args, **kwargs)
+        elif calculator_type == "history":
+            return CalculatorHistory(*args, **kwargs)
+        elif calculator_type == "event_recorder":
+            return EventRecorder(*args, **kwargs)
         elif calculator_type == "character_database":
             return CharacterDatabase(*args, **kwargs)
+        elif calculator_type == "event_store":
+            return EventStore(*args, **kwargs)
         else:
             raise ValueError(f"Unknown calculator type: {calculator_type}")
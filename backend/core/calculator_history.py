@@ -0,0 +1,108 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+_MISSING = object()
+
+
+def share_structure(new, old=_MISSING):
+    """
+    Return ``new`` rebuilt to reuse every subtree of ``old`` it is equal to.
+
+    When nothing changed, ``old`` itself is returned, so consecutive history
+    entries only pay for the containers along the paths that differ. ``new``
+    must be a calculator snapshot, which is never mutated afterwards.
+    """
+    if new is old:
+        return old
+    if isinstance(new, dict):
+        old_dict = old if isinstance(old, dict) else {}
+        shared = {key: share_structure(value, old_dict.get(key, _MISSING)) for key, value in new.items()}
+        if old is not _MISSING and isinstance(old, dict) and len(shared) == len(old) and \
+                all(key in old and value is old[key] for key, value in shared.items()):
+            return old
+        return shared
+    if isinstance(new, list):
+        old_list = old if isinstance(old, list) else []
+        shared = [share_structure(value, old_list[i] if i < len(old_list) else _MISSING)
+                  for i, value in enumerate(new)]
+        if isinstance(old, list) and len(shared) == len(old) and \
+                all(value is old_value for value, old_value in zip(shared, old)):
+            return old
+        return shared
+    if old is not _MISSING and type(new) is type(old) and new == old:
+        return old
+    return new
+
+
+class CalculatorHistory(QObject):
+    history_changed = pyqtSignal(bool, bool)  # can_undo, can_redo
+
+    def __init__(self, stats_calculator, experience_calculator, arts_calculator, traits_calculator,
+                 max_steps=5000):
+        super().__init__()
+        self.stats_calculator = stats_calculator
+        self.experience_calculator = experience_calculator
+        self.arts_calculator = arts_calculator
+        self.traits_calculator = traits_calculator
+        self.max_steps = max_steps
+        self.states = []
+        self.index = -1
+        self.record_pending = False
+
+    def capture(self):
+        return {
+            "stats": self.stats_calculator.snapshot(),
+            "experience": self.experience_calculator.snapshot(),
+            "arts": self.arts_calculator.snapshot(),
+            "traits": self.traits_calculator.snapshot(),
+        }
+
+    def schedule_record(self, *args):
+        # Signal cascades emit many times per user action; record once they settle
+        if not self.record_pending:
+            self.record_pending = True
+            QTimer.singleShot(0, self.record)
+
+    def record(self):
+        self.record_pending = False
+        current = self.states[self.index] if self.index >= 0 else _MISSING
+        state = share_structure(self.capture(), current)
+        if state is current:
+            return
+
+        del self.states[self.index + 1:]
+        self.states.append(state)
+        if len(self.states) > self.max_steps:
+            del self.states[:len(self.states) - self.max_steps]
+        self.index = len(self.states) - 1
+        self.history_changed.emit(self.can_undo(), self.can_redo())
+
+    def clear(self):
+        self.states = []
+        self.index = -1
+        self.history_changed.emit(False, False)
+        self.schedule_record()
+
+    def can_undo(self):
+        return self.index > 0
+
+    def can_redo(self):
+        return self.index < len(self.states) - 1
+
+    def undo(self):
+        if self.record_pending:
+            self.record()
+        if not self.can_undo():
+            return None
+        self.index -= 1
+        self.history_changed.emit(self.can_undo(), self.can_redo())
+        # Calculators copy loaded data before writing, so the entry can be handed out as is
+        return self.states[self.index]
+
+    def redo(self):
+        if self.record_pending:
+            self.record()
+        if not self.can_redo():
+            return None
+        self.index += 1
+        self.history_changed.emit(self.can_undo(), self.can_redo())
+        return self.states[self.index]
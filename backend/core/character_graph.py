@@ -0,0 +1,109 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from .core_utils import REALM_MULTIPLIERS, calculate_art_results, calculate_energy, calculate_realm, calculate_trait_level
+from .dependency_graph import DependencyGraph
+
+
+def _art_results(art, primary_totals, mastery_level, realm):
+    try:
+        return calculate_art_results(art, primary_totals, mastery_level, realm)
+    except Exception as e:
+        print(f"Error calculating art {art.get('name')}: {str(e)}")
+        return None
+
+
+class CharacterGraph(QObject):
+    """
+    Derived character values kept up to date from the calculators.
+
+    Inputs are the derived stats and primary totals the stats calculator keeps,
+    the character level, each art definition, each art's mastery entry
+    (``mastery_exp:<name>``) and each trait's cumulative exp. Derived nodes are
+    the realm, energy pools, per-art results (``art_results:<name>``) and
+    per-trait levels (``trait_level:<name>``). After every calculator change
+    only the affected nodes are recomputed, and ``values_changed`` is emitted
+    once with the names of the nodes that changed.
+    """
+    values_changed = pyqtSignal(set)
+
+    def __init__(self, stats_calculator, experience_calculator, arts_calculator):
+        super().__init__()
+        self.stats_calculator = stats_calculator
+        self.experience_calculator = experience_calculator
+        self.arts_calculator = arts_calculator
+        self.sources = None
+        self.art_names = set()
+        self.trait_names = set()
+
+        self.graph = DependencyGraph()
+        self.graph.add_input('derived_stats', {})
+        self.graph.add_input('primary_totals', {})
+        self.graph.add_input('level', 0)
+        self.graph.add_node('realm', ['level'], calculate_realm)
+        self.graph.add_node('energy', ['primary_totals', 'realm', 'derived_stats'],
+                            lambda primary_totals, realm, derived: calculate_energy(primary_totals, realm, derived,
+                                                                                    REALM_MULTIPLIERS))
+
+        self.stats_calculator.stats_updated.connect(self.refresh)
+        self.experience_calculator.experience_updated.connect(self.refresh)
+        self.experience_calculator.experience_batch_updated.connect(self.refresh)
+        self.arts_calculator.arts_updated.connect(self.refresh)
+        self.refresh()
+
+    def refresh(self, *args):
+        stats = self.stats_calculator.snapshot()
+        experience = self.experience_calculator.snapshot()
+        arts = self.arts_calculator.snapshot()
+        sources = (stats['stats'], stats['primary_totals'], stats['level'], experience, arts)
+        # Snapshots are shared until written, so identical objects mean nothing changed
+        if self.sources is not None and all(new is old for new, old in zip(sources, self.sources)):
+            return
+        self.sources = sources
+
+        removed = set()
+        inputs = {'derived_stats': stats['stats'], 'primary_totals': stats['primary_totals'], 'level': stats['level']}
+        mastery = experience.get('mastery', {})
+        for name, art in arts.items():
+            entry = mastery.get(name, {"exp": 0, "level": 1})
+            if name not in self.art_names:
+                self.graph.add_input(f'art:{name}', art)
+                self.graph.add_input(f'mastery_exp:{name}', entry)
+                self.graph.add_node(f'mastery:{name}', [f'mastery_exp:{name}'], lambda entry: entry['level'])
+                self.graph.add_node(f'art_results:{name}', [f'art:{name}', 'primary_totals', f'mastery:{name}', 'realm'],
+                                    _art_results)
+                self.art_names.add(name)
+            inputs[f'art:{name}'] = art
+            inputs[f'mastery_exp:{name}'] = entry
+        for name in self.art_names - set(arts):
+            for node in [f'art_results:{name}', f'mastery:{name}', f'art:{name}', f'mastery_exp:{name}']:
+                self.graph.remove(node)
+            removed.update([f'art_results:{name}', f'mastery_exp:{name}'])
+        self.art_names &= set(arts)
+
+        traits = experience.get('trait', {})
+        for name, entry in traits.items():
+            if name not in self.trait_names:
+                self.graph.add_input(f'trait_exp:{name}', entry['exp'])
+                self.graph.add_node(f'trait_level:{name}', [f'trait_exp:{name}'], calculate_trait_level)
+                self.trait_names.add(name)
+            inputs[f'trait_exp:{name}'] = entry['exp']
+        for name in self.trait_names - set(traits):
+            for node in [f'trait_level:{name}', f'trait_exp:{name}']:
+                self.graph.remove(node)
+            removed.add(f'trait_level:{name}')
+        self.trait_names &= set(traits)
+
+        changed = self.graph.set_inputs(inputs) | removed
+        if changed:
+            self.values_changed.emit(changed)
+
+    def get(self, name, default=None):
+        return self.graph.get(name, default)
+
+    def art_results(self, art_name):
+        return self.graph.get(f'art_results:{art_name}')
+
+    def mastery_exp(self, art_name):
+        return self.graph.get(f'mastery_exp:{art_name}')
+
+    def trait_level(self, trait_name):
+        return self.graph.get(f'trait_level:{trait_name}')
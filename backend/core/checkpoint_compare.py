@@ -0,0 +1,107 @@
+from typing import Any, Dict, List, Optional
+
+from .core_utils import calculate_art_results, calculate_realm, derive_snapshot
+
+COMPARE_SECTIONS = ['stats', 'primary_totals', 'energy', 'experience', 'arts', 'traits']
+
+
+def load_checkpoint_snapshot(character_db, character_name: str, chapter_number: int,
+                             checkpoint_name: str) -> Dict[str, Any]:
+    # Stream only the requested chapter and stop at the first match
+    for record in character_db.iter_checkpoints(character_name, (chapter_number, chapter_number)):
+        if record.name == checkpoint_name:
+            return record.stats
+    raise ValueError(f"Checkpoint {checkpoint_name} not found in chapter {chapter_number} of {character_name}")
+
+
+def compare_checkpoints(character_db, first: tuple, second: tuple,
+                        include_unchanged: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compare two checkpoints given as ``(character, chapter, checkpoint)`` tuples.
+
+    Both snapshots are read straight from storage; the live calculators are not touched.
+    """
+    return compare_snapshots(load_checkpoint_snapshot(character_db, *first),
+                             load_checkpoint_snapshot(character_db, *second),
+                             include_unchanged)
+
+
+def compare_snapshots(old: Dict[str, Any], new: Dict[str, Any],
+                      include_unchanged: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    old_fields = flatten_snapshot(old)
+    new_fields = flatten_snapshot(new)
+    report = {section: [] for section in COMPARE_SECTIONS}
+    for section in COMPARE_SECTIONS:
+        old_section = old_fields[section]
+        new_section = new_fields[section]
+        fields = list(old_section) + [field for field in new_section if field not in old_section]
+        for field in fields:
+            old_value = old_section.get(field)
+            new_value = new_section.get(field)
+            if old_value == new_value and not include_unchanged:
+                continue
+            report[section].append({
+                'field': field,
+                'old': old_value,
+                'new': new_value,
+                'delta': _delta(old_value, new_value)
+            })
+    return report
+
+
+def flatten_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    snapshot = derive_snapshot(snapshot)
+    stats_data = snapshot.get('stats', {})
+    level = stats_data.get('level', 0)
+    primary_totals = stats_data.get('primary_totals', {})
+    mastery = snapshot.get('experience', {}).get('mastery', {})
+
+    stats = {}
+    for stat, values in stats_data.get('stats', {}).items():
+        for field, value in values.items():
+            stats[f"{stat}.{field}"] = value
+    for field in ['level', 'free_points', 'train_points']:
+        if field in stats_data:
+            stats[field] = stats_data[field]
+
+    energy = {}
+    for pool, values in snapshot.get('energy', {}).items():
+        for field, value in values.items():
+            energy[f"{pool}.{field}"] = value
+
+    experience = {}
+    for exp_type, entries in snapshot.get('experience', {}).items():
+        for identifier, values in entries.items():
+            for field, value in values.items():
+                experience[f"{exp_type}.{identifier}.{field}"] = value
+
+    arts = {}
+    for art_name, art in snapshot.get('arts', {}).items():
+        for field in ['type', 'quality', 'quality_level']:
+            arts[f"{art_name}.{field}"] = art.get(field)
+        if primary_totals:
+            mastery_level = mastery.get(art_name, {}).get('level', 1)
+            results = calculate_art_results(art, primary_totals, mastery_level, calculate_realm(level))
+            arts[f"{art_name}.final_boost"] = results['final_boost']
+
+    traits = {}
+    for trait in snapshot.get('traits', []):
+        for field in ['quality_grade', 'quality_level', 'exp']:
+            traits[f"{trait.get('name')}.{field}"] = trait.get(field)
+
+    return {
+        'stats': stats,
+        'primary_totals': dict(primary_totals),
+        'energy': energy,
+        'experience': experience,
+        'arts': arts,
+        'traits': traits
+    }
+
+
+def _delta(old_value: Any, new_value: Any) -> Optional[float]:
+    numeric = (int, float)
+    if isinstance(old_value, numeric) and isinstance(new_value, numeric) \
+            and not isinstance(old_value, bool) and not isinstance(new_value, bool):
+        return new_value - old_value
+    return None
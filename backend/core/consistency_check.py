@@ -0,0 +1,118 @@
+import math
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .calculator_context import CalculatorContext
+from ..database.character_database import CharacterDatabase
+from ..stat_entry_utils import DERIVED_STAT_FIELDS, stat_entry_problems
+
+
+def iter_character_states(data: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield ``(label, state)`` for a character's current state and every checkpoint.
+
+    States are yielded as stored, so changes to them end up in ``data``.
+    """
+    yield "current", data
+    for chapter in data.get("chapters", []):
+        for checkpoint in chapter.get("checkpoints", []):
+            yield f"chapter {chapter.get('number')} / {checkpoint.get('name')}", checkpoint.setdefault("stats", {})
+
+
+def recompute_state(context: CalculatorContext, state: Dict[str, Any]) -> Dict[str, Any]:
+    context.load(state)
+    # Loading keeps stored energy as it is; derived stats are already recomputed by load_stats
+    context.energy_calculator.calculate()
+    return context.snapshot()
+
+
+def derived_mismatches(state: Dict[str, Any], recomputed: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare the derived values stored in ``state`` with ``recomputed``.
+
+    Only values that are stored are compared, so raw snapshots have nothing to
+    mismatch. Each mismatch has the ``path`` to the stored value.
+    """
+    mismatches = []
+
+    def compare(path, stored, expected):
+        if not _same_value(stored, expected):
+            mismatches.append({'path': path, 'stored': stored, 'recomputed': expected})
+
+    stats_data = state.get('stats') or {}
+    recomputed_stats = recomputed['stats']
+    for stat, values in (stats_data.get('stats') or {}).items():
+        for field in DERIVED_STAT_FIELDS:
+            if field in values:
+                compare(['stats', 'stats', stat, field], values[field], recomputed_stats['stats'][stat][field])
+    for primary, total in (stats_data.get('primary_totals') or {}).items():
+        compare(['stats', 'primary_totals', primary], total, recomputed_stats['primary_totals'].get(primary))
+    for pool, values in (state.get('energy') or {}).items():
+        for field, value in values.items():
+            compare(['energy', pool, field], value, recomputed['energy'].get(pool, {}).get(field))
+
+    experience_level = recomputed['experience']['character']['character']['level']
+    # The stats level follows the character experience level
+    if stats_data and state.get('experience') and recomputed_stats['level'] != experience_level:
+        mismatches.append({'path': ['stats', 'level'], 'stored': recomputed_stats['level'],
+                           'recomputed': experience_level})
+    return mismatches
+
+
+def _same_value(stored: Any, expected: Any) -> bool:
+    if isinstance(stored, (int, float)) and isinstance(expected, (int, float)):
+        return math.isclose(stored, expected, rel_tol=1e-9, abs_tol=1e-9)
+    return stored == expected
+
+
+def _set_path(state: Dict[str, Any], path: List[Any], value: Any) -> None:
+    for segment in path[:-1]:
+        state = state[segment]
+    state[path[-1]] = value
+
+
+def check_character(data_directory: str, character_name: str, fix: bool = False) -> Dict[str, Any]:
+    """
+    Recompute a character's current state and checkpoints and report what does not match.
+
+    Problems are ``invalid`` (structure, see ``stat_entry_problems``), ``error``
+    (the calculators could not load the state) or ``mismatch`` (a stored
+    derived value differs from the recomputed one). With ``fix`` the
+    mismatching values are replaced, marked ``fixed``, and the character file
+    is rewritten. Opens its own database so it can run in a worker process.
+    """
+    result = {'character': character_name, 'states': 0, 'problems': [], 'fixed': 0}
+    character_db = CharacterDatabase(data_directory)
+    try:
+        data = character_db.load_character(character_name)
+    except (ValueError, OSError) as e:
+        result['problems'].append({'state': None, 'kind': 'error', 'message': str(e)})
+        return result
+
+    context = CalculatorContext()
+    for label, state in iter_character_states(data):
+        result['states'] += 1
+        for message in stat_entry_problems(state):
+            result['problems'].append({'state': label, 'kind': 'invalid', 'message': message})
+        try:
+            recomputed = recompute_state(context, state)
+            mismatches = derived_mismatches(state, recomputed)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            result['problems'].append({'state': label, 'kind': 'error',
+                                       'message': f"cannot recompute: {type(e).__name__}: {e}"})
+            continue
+        for mismatch in mismatches:
+            # The level is an input; which of the two levels is right cannot be told from the data
+            fixable = fix and mismatch['path'] != ['stats', 'level']
+            if fixable:
+                _set_path(state, mismatch['path'], mismatch['recomputed'])
+                result['fixed'] += 1
+            if mismatch['path'] == ['stats', 'level']:
+                message = f"stats.level {mismatch['stored']!r} differs from experience level {mismatch['recomputed']!r}"
+            else:
+                message = (f"{'.'.join(mismatch['path'])} stored {mismatch['stored']!r}, "
+                           f"recomputed {mismatch['recomputed']!r}")
+            result['problems'].append({'state': label, 'kind': 'mismatch', 'fixed': fixable, 'message': message})
+
+    if result['fixed']:
+        character_db.update_character(character_name, data)
+    return result
@@ -0,0 +1,26 @@
+import copy
+
+
+class CopyOnWrite:
+    """
+    Ownership tracker for a calculator's state containers.
+
+    After ``share()`` every container handed out in a snapshot is treated as
+    shared; ``writable()`` returns a private shallow copy the first time a
+    container is written to, so snapshots are O(1) to take and later writes
+    only copy the containers along the path they touch.
+    """
+
+    def __init__(self):
+        self.owned = {}
+
+    def share(self):
+        self.owned = {}
+
+    def writable(self, container):
+        if id(container) in self.owned:
+            return container
+        container = copy.copy(container)
+        # Keep a reference so the id cannot be reused by another object
+        self.owned[id(container)] = container
+        return container
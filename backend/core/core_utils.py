@@ -1,4 +1,19 @@
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+from ..stat_entry_utils import DERIVED_STAT_FIELDS, create_diff, apply_diff, validate_stat_entry
+
+PRIMARY_STATS = {
+    "Body": ["Endurance", "Vitality", "Strength", "Agility", "Dexterity"],
+    "Mind": ["Intelligence", "Memory", "Perception", "Clarity", "Focus"],
+    "Spirit": ["Adaptability", "Magnitude", "Density", "Purity", "Fortitude"]
+}
+
+REALM_MULTIPLIERS = {
+    1: 1, 2: 3, 3: 6, 4: 10, 5: 15, 6: 21, 7: 28, 8: 36, 9: 45, 10: 55
+}
+
+QUALITY_GRADES = ["Mortal Grade", "Elite Grade", "Earth Grade", "Royal Grade", "Imperial Grade",
+                  "Saint Grade", "Sky Grade", "Ascended Grade", "Transcended Grade", "Eternal Grade"]
 
 def calculate_triangular_number(n: int) -> int:
     return n * (n + 1) // 2
@@ -48,6 +63,141 @@ def calculate_adjustment_multiplier(quality: str, mastery_level: int, realm: int
     mastery_layer_num = (mastery_level - 1) // 10 + 1
     return 1 + ((realm - grade_num) / 10) + (mastery_layer_num / 10)
 
+def calculate_realm(level: int) -> int:
+    return (level - 1) // 10 + 1
+
+def calculate_secondary_stats(stats: Dict[str, Dict[str, Any]], primary_stats: Dict[str, list] = PRIMARY_STATS) -> Tuple[Dict[str, Dict[str, float]], Dict[str, float]]:
+    derived = {}
+    primary_totals = {}
+    for primary, secondary_stats in primary_stats.items():
+        total_points = sum(sum(stats[stat][cat] for cat in ['auto', 'free', 'train']) for stat in secondary_stats)
+        total_manual_auto_points = sum(stats[stat]['auto'] + stats[stat]['free'] for stat in secondary_stats)
+        primary_total = 0
+
+        for stat in secondary_stats:
+            auto = stats[stat]['auto']
+            free = stats[stat]['free']
+            train = stats[stat]['train']
+            total = auto + free + train
+
+            weight = (auto + free) / total_manual_auto_points if total_manual_auto_points > 0 else 0
+            normalized_weight = weight / sum((stats[s]['auto'] + stats[s]['free']) / total_manual_auto_points
+                                             for s in secondary_stats) if total_manual_auto_points > 0 else 0
+
+            derived[stat] = {
+                'weight': weight,
+                'constraint': (total / total_points) * 100 if total_points > 0 else 0,
+                'total': total
+            }
+            primary_total += total * normalized_weight
+
+        primary_totals[primary] = primary_total
+    return derived, primary_totals
+
+def calculate_energy(primary_totals: Dict[str, float], realm: int, stats: Dict[str, Dict[str, Any]],
+                     realm_multipliers: Dict[int, int] = REALM_MULTIPLIERS) -> Dict[str, Dict[str, int]]:
+    multiplier = realm_multipliers.get(realm, 1.0)
+    energy = {}
+    for pool, primary, factor, weight_stat in (('Lifeforce', 'Body', 100, 'Vitality'),
+                                               ('Qi', 'Spirit', 50, 'Magnitude'),
+                                               ('Essence', 'Mind', 20, 'Memory')):
+        initial = int(primary_totals[primary] * factor * multiplier)
+        adjustment = int(initial * stats[weight_stat]['weight'])
+        energy[pool] = {'initial': initial, 'adjustment': adjustment, 'final': initial + adjustment}
+    return energy
+
+@lru_cache(maxsize=1024)
+def _derive_from_raw_inputs(raw_stats: Tuple, level: int) -> Tuple[Dict, Dict, Dict]:
+    stats = {stat: {'auto': auto, 'free': free, 'train': train} for stat, auto, free, train in raw_stats}
+    derived, primary_totals = calculate_secondary_stats(stats)
+    for stat, values in derived.items():
+        stats[stat].update(values)
+    return stats, primary_totals, calculate_energy(primary_totals, calculate_realm(level), stats)
+
+def derive_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a snapshot with the derived stat, primary total and energy fields filled in.
+
+    Snapshots persisted in raw storage mode only carry the inputs; full snapshots
+    are returned unchanged. Results are cached on the raw inputs.
+    """
+    stats_data = snapshot.get('stats', {})
+    stats = stats_data.get('stats')
+    if not stats:
+        return snapshot
+    if ('primary_totals' in stats_data and snapshot.get('energy')
+            and all(field in values for values in stats.values() for field in DERIVED_STAT_FIELDS)):
+        return snapshot
+
+    raw_stats = tuple((stat, values['auto'], values['free'], values['train']) for stat, values in stats.items())
+    derived_stats, primary_totals, energy = _derive_from_raw_inputs(raw_stats, stats_data.get('level', 0))
+    result = dict(snapshot)
+    result['stats'] = dict(stats_data,
+                           stats={stat: dict(values) for stat, values in derived_stats.items()},
+                           primary_totals=dict(primary_totals))
+    result['energy'] = {pool: dict(values) for pool, values in energy.items()}
+    return result
+
+def calculate_relevant_stat(art_type: str, primary_totals: Dict[str, float]) -> float:
+    if art_type == "Martial":
+        return primary_totals["Body"]
+    elif art_type == "Spiritual":
+        return primary_totals["Spirit"]
+    elif art_type == "Psychic":
+        return primary_totals["Mind"]
+    elif art_type == "Bloodline":
+        return (primary_totals["Body"] * 0.5 +
+                primary_totals["Spirit"] * 0.3 +
+                primary_totals["Mind"] * 0.2)
+    elif art_type == "Auxiliary":
+        return (primary_totals["Mind"] * 0.5 +
+                primary_totals["Spirit"] * 0.3 +
+                primary_totals["Body"] * 0.2)
+    elif art_type == "Arcane":
+        return (primary_totals["Spirit"] * 0.5 +
+                primary_totals["Mind"] * 0.3 +
+                primary_totals["Body"] * 0.2)
+    elif art_type == "Cultivation":
+        return max(primary_totals.values())
+    else:  # Mixed
+        return sum(primary_totals.values()) / 3
+
+def calculate_art_results(art: Dict[str, Any], primary_totals: Dict[str, float], mastery_level: int, realm: int) -> Dict[str, Any]:
+    total_stat = sum(primary_totals.values())
+    relevant_stat = calculate_relevant_stat(art['type'], primary_totals)
+    ratio = relevant_stat / total_stat if total_stat != 0 else 0
+    quality_multiplier = calculate_quality_multiplier(art['quality'], art['quality_level'])
+    mastery_multiplier = calculate_mastery_multiplier(mastery_level)
+    initial_boost = quality_multiplier * mastery_multiplier * ratio
+    adjustment_multiplier = calculate_adjustment_multiplier(art['quality'], mastery_level, realm)
+    return {
+        'realm': realm,
+        'relevant_stat': relevant_stat,
+        'total_stat': total_stat,
+        'ratio': ratio,
+        'quality_multiplier': quality_multiplier,
+        'mastery_multiplier': mastery_multiplier,
+        'initial_boost': initial_boost,
+        'adjustment_multiplier': adjustment_multiplier,
+        'final_boost': initial_boost * adjustment_multiplier,
+        'mastery_level': mastery_level,
+        'mastery_layer': get_mastery_layer(mastery_level),
+        'mastery_level_in_layer': get_mastery_level(mastery_level)
+    }
+
+def calculate_trait_level(total_exp: int) -> Tuple[str, int, int, int]:
+    """
+    Return ``(grade, level, exp_into_level, level_max_exp)`` for a trait's cumulative exp.
+    """
+    accumulated_exp = 0
+    for grade_index, grade in enumerate(QUALITY_GRADES):
+        for level in range(1, 11):
+            max_exp = calculate_max_exp(grade_index * 10 + level)
+            if accumulated_exp + max_exp > total_exp:
+                return grade, level, total_exp - accumulated_exp, max_exp
+            accumulated_exp += max_exp
+    return QUALITY_GRADES[-1], 10, 0, calculate_max_exp(100)  # Max level
+
 def format_number(number: int, show_exact: bool = False) -> str:
     if show_exact:
         return f"{number:,}"
@@ -59,28 +209,3 @@ def format_number(number: int, show_exact: bool = False) -> str:
         return f"{number/1000000:.1f}M"
     else:
         return f"{number/1000000000:.1f}B"
-
-def validate_stat_entry(stat_entry: Dict[str, Any]) -> bool:
-    required_keys = ['level', 'experience', 'stats', 'arts', 'traits']
-    return all(key in stat_entry for key in required_keys)
-
-def create_diff(old_stats: Dict[str, Any], new_stats: Dict[str, Any]) -> Dict[str, Any]:
-    diff = {}
-    for key, value in new_stats.items():
-        if key not in old_stats or old_stats[key] != value:
-            if isinstance(value, dict):
-                nested_diff = create_diff(old_stats.get(key, {}), value)
-                if nested_diff:
-                    diff[key] = nested_diff
-            else:
-                diff[key] = value
-    return diff
-
-def apply_diff(base_stats: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
-    result = base_stats.copy()
-    for key, value in diff.items():
-        if isinstance(value, dict):
-            result[key] = apply_diff(result.get(key, {}), value)
-        else:
-            result[key] = value
-    return result
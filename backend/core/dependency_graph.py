@@ -0,0 +1,99 @@
+class DependencyGraph:
+    """
+    A dataflow graph of input values and derived nodes.
+
+    ``set_inputs`` recomputes, in topological order, only the nodes downstream
+    of an input whose value actually changed. A node whose recomputed value is
+    equal to the previous one stops the propagation.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.functions = {}
+        self.dependencies = {}
+        self.order = []
+        self.order_dirty = False
+        self.pending = set()
+
+    def add_input(self, name, value=None):
+        self.values[name] = value
+        self.dependencies.setdefault(name, [])
+
+    def add_node(self, name, dependencies, function):
+        self.functions[name] = function
+        self.dependencies[name] = list(dependencies)
+        self.values.setdefault(name, None)
+        self.order_dirty = True
+        # Evaluated on the next recompute even if no dependency changes
+        self.pending.add(name)
+
+    def remove(self, name):
+        self.values.pop(name, None)
+        self.functions.pop(name, None)
+        self.dependencies.pop(name, None)
+        self.pending.discard(name)
+        self.order_dirty = True
+
+    def has(self, name):
+        return name in self.dependencies
+
+    def get(self, name, default=None):
+        return self.values.get(name, default)
+
+    def set_inputs(self, inputs):
+        changed = set()
+        for name, value in inputs.items():
+            if name in self.functions:
+                raise ValueError(f"{name} is a derived node, not an input")
+            if name not in self.dependencies:
+                self.add_input(name, value)
+                changed.add(name)
+            elif not _same(self.values[name], value):
+                self.values[name] = value
+                changed.add(name)
+        return self.recompute(changed)
+
+    def recompute(self, changed=None):
+        changed = set(changed or ())
+        if not changed and not self.pending:
+            return changed
+        if self.order_dirty:
+            self.order = self._topological_order()
+            self.order_dirty = False
+
+        pending, self.pending = self.pending, set()
+        for name in self.order:
+            dependencies = self.dependencies[name]
+            if name not in pending and not any(dependency in changed for dependency in dependencies):
+                continue
+            value = self.functions[name](*[self.values.get(dependency) for dependency in dependencies])
+            if name in pending or not _same(self.values[name], value):
+                self.values[name] = value
+                changed.add(name)
+        return changed
+
+    def _topological_order(self):
+        order = []
+        state = {}
+
+        def visit(name):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Dependency cycle through {name}")
+            state[name] = 'visiting'
+            for dependency in self.dependencies.get(name, []):
+                if dependency not in self.dependencies:
+                    raise ValueError(f"{name} depends on unknown node {dependency}")
+                visit(dependency)
+            state[name] = 'done'
+            if name in self.functions:
+                order.append(name)
+
+        for name in self.functions:
+            visit(name)
+        return order
+
+
+def _same(old, new):
+    return old is new or (type(old) is type(new) and old == new)
@@ -1,5 +1,6 @@
 from PyQt5.QtCore import QObject, pyqtSignal
 from .base_calculator import BaseCalculator
+from .core_utils import REALM_MULTIPLIERS
 
 class EnergyCalculator(QObject):
     energy_updated = pyqtSignal()
@@ -7,13 +8,22 @@ class EnergyCalculator(QObject):
     def __init__(self, stats_calculator):
         super().__init__()
         self.stats_calculator = stats_calculator
-        self.realm_multipliers = {
-            1: 1, 2: 3, 3: 6, 4: 10, 5: 15, 6: 21, 7: 28, 8: 36, 9: 45, 10: 55
-        }
+        self.realm_multipliers = REALM_MULTIPLIERS
         self.lifeforce = {'initial': 0, 'adjustment': 0, 'final': 0}
         self.qi = {'initial': 0, 'adjustment': 0, 'final': 0}
         self.essence = {'initial': 0, 'adjustment': 0, 'final': 0}
-        self.stats_calculator.stats_updated.connect(self.calculate)
+        self.version = 0
+        self.character_graph = None
+
+    def connect_graph(self, character_graph):
+        # The pools are derived in the character graph; this calculator holds them for display and saving
+        self.character_graph = character_graph
+        self.character_graph.values_changed.connect(self.on_graph_changed)
+        self.calculate()
+
+    def on_graph_changed(self, changed):
+        if 'energy' in changed:
+            self.set_energy(self.character_graph.get('energy'))
 
     def reset(self):
         self.lifeforce = {'initial': 0, 'adjustment': 0, 'final': 0}
@@ -22,30 +32,20 @@ class EnergyCalculator(QObject):
         self.calculate()
 
     def calculate(self):
-        body = self.stats_calculator.primary_totals['Body']
-        mind = self.stats_calculator.primary_totals['Mind']
-        spirit = self.stats_calculator.primary_totals['Spirit']
-        
-        realm = self.stats_calculator.get_realm()
-        multiplier = self.realm_multipliers.get(realm, 1.0)
-        
-        self.lifeforce['initial'] = int(body * 100 * multiplier)
-        self.qi['initial'] = int(spirit * 50 * multiplier)
-        self.essence['initial'] = int(mind * 20 * multiplier)
-        
-        vitality_weight = self.stats_calculator.stats['Vitality']['weight']
-        magnitude_weight = self.stats_calculator.stats['Magnitude']['weight']
-        memory_weight = self.stats_calculator.stats['Memory']['weight']
-        
-        self.lifeforce['adjustment'] = int(self.lifeforce['initial'] * vitality_weight)
-        self.qi['adjustment'] = int(self.qi['initial'] * magnitude_weight)
-        self.essence['adjustment'] = int(self.essence['initial'] * memory_weight)
-        
-        self.lifeforce['final'] = self.lifeforce['initial'] + self.lifeforce['adjustment']
-        self.qi['final'] = self.qi['initial'] + self.qi['adjustment']
-        self.essence['final'] = self.essence['initial'] + self.essence['adjustment']
-        
-        self.energy_updated.emit()
+        # Replaces loaded pools with the values derived from the current stats
+        if self.character_graph is None:
+            return
+        self.character_graph.refresh()
+        self.set_energy(self.character_graph.get('energy'))
+
+    def set_energy(self, energy):
+        if energy != self.get_energy_values():
+            # Pools are replaced rather than updated so snapshots and loaded data stay untouched
+            self.lifeforce = energy['Lifeforce']
+            self.qi = energy['Qi']
+            self.essence = energy['Essence']
+            self.version += 1
+            self.energy_updated.emit()
 
     def load_energy(self, energy_data):
         if not energy_data:
@@ -53,6 +53,7 @@ class EnergyCalculator(QObject):
         self.lifeforce = energy_data.get('Lifeforce', self.lifeforce)
         self.qi = energy_data.get('Qi', self.qi)
         self.essence = energy_data.get('Essence', self.essence)
+        self.version += 1
         self.energy_updated.emit()
 
     def get_energy_values(self):
@@ -62,6 +63,9 @@ class EnergyCalculator(QObject):
             'Essence': self.essence
         }
 
+    def snapshot(self):
+        return self.get_energy_values()
+
 class BaseCalculatorImplementation(BaseCalculator):
     def calculate(self):
         pass
@@ -0,0 +1,180 @@
+from datetime import datetime
+
+from .calculator_context import CalculatorContext
+from .traits_calculator import Trait
+
+
+def encode_argument(value):
+    if isinstance(value, Trait):
+        return {"trait": dict(value.__dict__)}
+    return value
+
+
+def decode_argument(value):
+    if isinstance(value, dict) and "trait" in value:
+        return Trait(**value["trait"])
+    return value
+
+
+class EventRecorder:
+    """
+    Records every mutating calculator call as a domain event for the current character.
+
+    Calculators announce their ``@mutation`` methods through ``mutated`` once
+    the outermost call has gone through, so calls it makes on other
+    calculators (a character level-up allocating auto points, for example)
+    are replayed through the same signal connections and rejected calls are
+    left out. A snapshot is materialized every ``snapshot_interval`` events,
+    so reconstruction never replays more than ``snapshot_interval`` events.
+    When the state is replaced wholesale (loading a character or checkpoint,
+    undo), the new state becomes the base for the next event and is only
+    written once that event is recorded, so browsing without editing writes
+    nothing.
+    """
+
+    def __init__(self, stats_calculator, experience_calculator, arts_calculator, traits_calculator,
+                 event_store, snapshot_interval=100):
+        self.calculators = {
+            'stats': stats_calculator,
+            'experience': experience_calculator,
+            'arts': arts_calculator,
+            'traits': traits_calculator,
+        }
+        self.event_store = event_store
+        self.snapshot_interval = snapshot_interval
+        self.character_name = None
+        self.pending_base = None
+
+    def attach(self):
+        for target, calculator in self.calculators.items():
+            calculator.mutated.connect(
+                lambda method, args, kwargs, target=target: self.on_mutated(target, method, args, kwargs))
+
+    def on_mutated(self, target, method, args, kwargs):
+        if not self.character_name:
+            return
+        if self.pending_base is not None:
+            state, level = self.pending_base
+            self.pending_base = None
+            self.event_store.write_snapshot(self.character_name, self.event_store.event_count(self.character_name),
+                                            state, level, datetime.now().isoformat())
+        self.record_event(target, method, args, kwargs)
+
+    def set_character(self, character_name):
+        self.character_name = character_name
+        self.mark_state_replaced()
+
+    def mark_state_replaced(self):
+        # Snapshots are copy-on-write, so holding on to the base costs nothing until it is written
+        self.pending_base = (self.capture(), self.current_level()) if self.character_name else None
+
+    def current_level(self):
+        return self.calculators['experience'].get_level("character")
+
+    def capture(self):
+        return {
+            "stats": self.calculators['stats'].snapshot(),
+            "experience": self.calculators['experience'].snapshot(),
+            "arts": self.calculators['arts'].snapshot(),
+            "traits": self.calculators['traits'].snapshot(),
+            "initial_stat_index": self.calculators['experience'].initial_stat_index,
+        }
+
+    def record_event(self, target, method, args, kwargs):
+        event = {
+            "ts": datetime.now().isoformat(),
+            "type": f"{target}.{method}",
+            "args": [encode_argument(arg) for arg in args],
+            "level": self.current_level(),
+        }
+        if kwargs:
+            event["kwargs"] = {key: encode_argument(value) for key, value in kwargs.items()}
+        index = self.event_store.append_event(self.character_name, event)
+        if (index + 1) % self.snapshot_interval == 0:
+            self.record_snapshot()
+
+    def record_snapshot(self):
+        if not self.character_name:
+            return
+        self.event_store.write_snapshot(self.character_name, self.event_store.event_count(self.character_name),
+                                        self.capture(), self.current_level(), datetime.now().isoformat())
+
+    def state_at(self, index):
+        return reconstruct_state(self.event_store, self.character_name, index)
+
+    def state_at_level(self, level):
+        return reconstruct_state(self.event_store, self.character_name,
+                                 find_level_index(self.event_store, self.character_name, level))
+
+    def state_at_time(self, timestamp):
+        return reconstruct_state(self.event_store, self.character_name,
+                                 find_time_index(self.event_store, self.character_name, timestamp))
+
+
+def apply_event(context, event):
+    calculators = {
+        'stats': context.stats_calculator,
+        'experience': context.experience_calculator,
+        'arts': context.arts_calculator,
+        'traits': context.traits_calculator,
+    }
+    target, method = event["type"].split('.', 1)
+    args = [decode_argument(arg) for arg in event.get("args", [])]
+    kwargs = {key: decode_argument(value) for key, value in event.get("kwargs", {}).items()}
+    getattr(calculators[target], method)(*args, **kwargs)
+
+
+def reconstruct_state(event_store, character_name, index):
+    """
+    Return the character state before event ``index``.
+
+    Starts from the closest snapshot at or before ``index`` and replays the
+    events between them.
+    """
+    index = max(0, min(index, event_store.event_count(character_name)))
+    context = CalculatorContext()
+    offset = 0
+    position = 0
+    snapshot = event_store.latest_snapshot(character_name, index)
+    if snapshot is not None:
+        context.load(event_store.load_snapshot(character_name, snapshot["index"]))
+        offset = snapshot["offset"]
+        position = snapshot["index"]
+
+    if position < index:
+        for event in event_store.iter_events(character_name, offset):
+            apply_event(context, event)
+            position += 1
+            if position >= index:
+                break
+    return context.snapshot()
+
+
+def find_level_index(event_store, character_name, level):
+    # The most recent event that took the character to ``level``
+    found = None
+    previous_level = None
+    for event in event_store.iter_events(character_name):
+        if event["level"] == level and previous_level != level:
+            found = event["index"] + 1
+        previous_level = event["level"]
+    if found is None:
+        raise ValueError(f"Character {character_name} never reached level {level}")
+    return found
+
+
+def find_time_index(event_store, character_name, timestamp):
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+    offset = 0
+    index = 0
+    # Snapshots are written in time order, so skip straight past the older ones
+    for snapshot in event_store.list_snapshots(character_name):
+        if snapshot["ts"] <= timestamp and snapshot["index"] >= index:
+            offset = snapshot["offset"]
+            index = snapshot["index"]
+    for event in event_store.iter_events(character_name, offset):
+        if event["ts"] > timestamp:
+            break
+        index = event["index"] + 1
+    return index
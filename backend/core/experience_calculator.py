@@ -1,12 +1,17 @@
 from PyQt5.QtCore import QObject, pyqtSignal
 from .base_calculator import BaseCalculator
-from .core_utils import get_mastery_layer, get_mastery_level
+from .core_utils import get_mastery_layer, get_mastery_level, calculate_trait_level
+from .copy_on_write import CopyOnWrite
+from .mutations import mutation
 
 class ExperienceCalculator(QObject):
     experience_updated = pyqtSignal(str, str, int, int)
     level_up = pyqtSignal(str, str, int)
     character_level_up = pyqtSignal(int, str)
+    character_levels_gained = pyqtSignal(int, dict)  # new level, {primary stat: levels gained}
     max_level_reached = pyqtSignal(str, str)
+    experience_batch_updated = pyqtSignal(dict)  # {exp_type: {identifier: summary}}
+    mutated = pyqtSignal(str, object, object)  # method name, args, kwargs
     MAX_LEVEL = 100
 
     def __init__(self, stats_calculator):
@@ -20,6 +25,8 @@ class ExperienceCalculator(QObject):
         }
         self.level_up_order = ["Body", "Spirit", "Mind"]
         self.initial_stat_index = 0
+        self.copy_on_write = CopyOnWrite()
+        self.version = 0
         self.reset()
 
 
@@ -29,7 +36,9 @@ class ExperienceCalculator(QObject):
             "mastery": {},
             "trait": {},
         }
+        self.version += 1
 
+    @mutation
     def set_initial_stat(self, stat):
         if stat not in self.level_up_order:
             raise ValueError(f"Invalid initial stat: {stat}")
@@ -39,6 +48,7 @@ class ExperienceCalculator(QObject):
         char_level = self.get_level("character")
         return (self.initial_stat_index + char_level) % 3
 
+    @mutation
     def add_experience(self, exp_type, amount, identifier="character"):
         if exp_type not in self.experience:
             raise ValueError(f"Invalid experience type: {exp_type}")
@@ -47,14 +57,72 @@ class ExperienceCalculator(QObject):
             identifier = "character"
         
         if identifier not in self.experience[exp_type]:
-            self.experience[exp_type][identifier] = {"exp": 0, "level": 1}
+            self._writable_section(exp_type)[identifier] = {"exp": 0, "level": 1}
         
         return self._add_exp_and_level_up(exp_type, identifier, amount)
 
-    def _add_exp_and_level_up(self, exp_type, identifier, amount):
-        exp_data = self.experience[exp_type][identifier]
+    @mutation
+    def add_experience_batch(self, grants):
+        """
+        Apply a list of ``(exp_type, amount, identifier)`` grants and notify once.
+
+        Per-grant ``level_up`` and ``experience_updated`` signals are replaced by
+        a single ``experience_batch_updated`` carrying, for every entry touched,
+        its final exp and level, the levels gained and whether it hit the cap.
+        Trait experience is cumulative, as with ``set_experience``; the traits
+        calculator updates the matching grades and levels from the summary.
+        Character level-ups are summed per primary stat and announced once
+        through ``character_levels_gained``.
+        """
+        # The identifier may be left out of character grants, as with add_experience
+        grants = [(tuple(grant) + ("character",))[:3] for grant in grants]
+        for exp_type, amount, identifier in grants:
+            if exp_type not in self.experience:
+                raise ValueError(f"Invalid experience type: {exp_type}")
+
+        summary = {}
+        character_levels = {}
+        for exp_type, amount, identifier in grants:
+            if exp_type == "character":
+                identifier = "character"
+            entry_summary = summary.setdefault(exp_type, {}).setdefault(identifier, {"levels_gained": 0,
+                                                                                       "max_reached": False})
+            if exp_type == "trait":
+                exp = self.experience[exp_type].get(identifier, {"exp": 0})["exp"] + amount
+                _, level, _, _ = calculate_trait_level(exp)
+                self._writable_section(exp_type)[identifier] = {"exp": exp, "level": level}
+                self.version += 1
+            else:
+                if identifier not in self.experience[exp_type]:
+                    self._writable_section(exp_type)[identifier] = {"exp": 0, "level": 1}
+                max_reached = self._add_exp_and_level_up(exp_type, identifier, amount, entry_summary,
+                                                         character_levels)
+                entry_summary["max_reached"] = entry_summary["max_reached"] or max_reached
+
+        if character_levels:
+            self.character_levels_gained.emit(self.experience["character"]["character"]["level"], character_levels)
+
+        for exp_type, entries in summary.items():
+            for identifier, entry_summary in entries.items():
+                entry_summary.update(self.experience[exp_type][identifier])
+        self.experience_batch_updated.emit(summary)
+        return summary
+
+    def _writable_section(self, exp_type):
+        self.experience = self.copy_on_write.writable(self.experience)
+        self.experience[exp_type] = self.copy_on_write.writable(self.experience[exp_type])
+        return self.experience[exp_type]
+
+    def _writable_entry(self, exp_type, identifier):
+        section = self._writable_section(exp_type)
+        section[identifier] = self.copy_on_write.writable(section[identifier])
+        return section[identifier]
+
+    def _add_exp_and_level_up(self, exp_type, identifier, amount, batch_summary=None, character_levels=None):
+        exp_data = self._writable_entry(exp_type, identifier)
         original_level = exp_data["level"]
         exp_data["exp"] += amount
+        self.version += 1
         
         if amount >= 0:
             while exp_data["level"] < self.MAX_LEVEL:
@@ -62,39 +130,50 @@ class ExperienceCalculator(QObject):
                 if exp_data["exp"] >= max_exp:
                     exp_data["exp"] -= max_exp
                     exp_data["level"] += 1
-                    self.level_up.emit(exp_type, identifier, exp_data["level"])
+                    if batch_summary is None:
+                        self.level_up.emit(exp_type, identifier, exp_data["level"])
+                    else:
+                        batch_summary["levels_gained"] += 1
                     if exp_type == "character" and identifier == "character":
                         current_stat_index = (self.initial_stat_index + exp_data["level"] - 1) % 3
                         current_stat = self.level_up_order[current_stat_index]
-                        self.character_level_up.emit(exp_data["level"], current_stat)
+                        if character_levels is None:
+                            self.character_level_up.emit(exp_data["level"], current_stat)
+                        else:
+                            character_levels[current_stat] = character_levels.get(current_stat, 0) + 1
                 else:
                     break
             
             if exp_data["level"] == self.MAX_LEVEL:
                 exp_data["exp"] = min(exp_data["exp"], self.calculate_max_exp(self.MAX_LEVEL) - 1)
-                if original_level != self.MAX_LEVEL:
+                if original_level != self.MAX_LEVEL and batch_summary is None:
                     self.max_level_reached.emit(exp_type, identifier)
 
-        next_level_exp = self.calculate_max_exp(exp_data["level"])
-        self.experience_updated.emit(exp_type, identifier, exp_data["exp"], next_level_exp)
+        if batch_summary is None:
+            next_level_exp = self.calculate_max_exp(exp_data["level"])
+            self.experience_updated.emit(exp_type, identifier, exp_data["exp"], next_level_exp)
         return exp_data["level"] == self.MAX_LEVEL and amount > 0
 
+    @mutation
     def set_experience(self, exp_type, amount, identifier):
         if exp_type not in self.experience:
             raise ValueError(f"Invalid experience type: {exp_type}")
         
         if exp_type == "trait":
-            self.experience[exp_type][identifier] = {"exp": amount, "level": 1}
+            self._writable_section(exp_type)[identifier] = {"exp": amount, "level": 1}
+            self.version += 1
             self.experience_updated.emit(exp_type, identifier, amount, self.calculate_max_exp(1))
         else:
             raise ValueError(f"set_experience is only supported for traits")
 
+    @mutation
     def remove_experience(self, exp_type, identifier):
         if exp_type not in self.experience:
             raise ValueError(f"Invalid experience type: {exp_type}")
         
         if identifier in self.experience[exp_type]:
-            del self.experience[exp_type][identifier]
+            del self._writable_section(exp_type)[identifier]
+            self.version += 1
             self.experience_updated.emit(exp_type, identifier, 0, 0)
 
     def calculate_max_exp(self, level):
@@ -137,6 +216,8 @@ class ExperienceCalculator(QObject):
             self.reset()
             return
         self.experience = experience_data
+        self.copy_on_write.share()
+        self.version += 1
         self.experience_updated.emit("character", "character", 
                                      self.experience["character"]["character"]["exp"], 
                                      self.calculate_max_exp(self.experience["character"]["character"]["level"]))
@@ -144,6 +225,10 @@ class ExperienceCalculator(QObject):
     def get_all_experience(self):
         return self.experience
 
+    def snapshot(self):
+        self.copy_on_write.share()
+        return self.experience
+
 class BaseCalculatorImplementation(BaseCalculator):
     def calculate(self):
         pass
@@ -0,0 +1,172 @@
+import functools
+import importlib
+import inspect
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+
+# (module, class, method, io) for every instrumented hot path; io is "read" or
+# "write" for methods whose file I/O is recorded (see _io_size)
+HOT_PATHS = [
+    ('backend.core.stats_calculator', 'StatsCalculator', 'calculate', None),
+    ('backend.core.character_graph', 'CharacterGraph', 'refresh', None),
+    ('backend.core.calculator_history', 'CalculatorHistory', 'record', None),
+    ('backend.database.character_database', 'CharacterDatabase', 'load_character', 'read'),
+    ('backend.database.character_database', 'CharacterDatabase', 'update_character', 'write'),
+    ('backend.database.character_database', 'CharacterDatabase', '_save_character_data', 'write'),
+    ('backend.database.event_store', 'EventStore', 'append_event', 'write'),
+    ('backend.database.event_store', 'EventStore', 'write_snapshot', 'write'),
+    ('gui.components.stats_component', 'StatsComponent', 'update_display', None),
+    ('gui.components.energy_component', 'EnergyComponent', 'update_display', None),
+    ('gui.components.experience_component', 'ExperienceComponent', 'update_display', None),
+    ('gui.components.arts_component', 'ArtsComponent', 'update_display', None),
+    ('gui.components.traits_component', 'TraitsComponent', 'update_display', None),
+    ('gui.components.character_progression_component', 'CharacterProgressionComponent', 'update_display', None),
+    ('gui.components.checkpoint_compare_component', 'CheckpointCompareComponent', 'update_display', None),
+]
+
+
+class CallStats:
+    def __init__(self, max_samples):
+        self.samples = deque(maxlen=max_samples)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+        self.samples.clear()
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def summary(self):
+        samples = sorted(self.samples)
+
+        def percentile(fraction):
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))] * 1000
+
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(percentile(0.50), 3),
+            'p90_ms': round(percentile(0.90), 3),
+            'p99_ms': round(percentile(0.99), 3),
+            'max_ms': round(samples[-1] * 1000, 3) if samples else 0.0,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+        }
+
+
+class Instrumentation:
+    """
+    Call counts, latencies and file I/O for the hot paths in ``HOT_PATHS``.
+
+    Nothing is patched until ``install()``, so an uninstrumented session runs
+    the original methods. Install before the calculators are created: slots
+    connected earlier keep pointing at the unwrapped methods. Once installed,
+    ``enabled`` pauses or resumes recording.
+    """
+
+    def __init__(self, hot_paths=HOT_PATHS, max_samples=4096):
+        self.hot_paths = hot_paths
+        self.max_samples = max_samples
+        self.stats = {}
+        self.originals = []
+        self.enabled = False
+
+    @property
+    def installed(self):
+        return bool(self.originals)
+
+    def install(self):
+        if self.installed:
+            return
+        for module_name, class_name, method_name, io in self.hot_paths:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            original = cls.__dict__[method_name]
+            setattr(cls, method_name, self._wrap(f"{class_name}.{method_name}", original, io))
+            self.originals.append((cls, method_name, original))
+        self.enabled = True
+
+    def uninstall(self):
+        for cls, method_name, original in reversed(self.originals):
+            setattr(cls, method_name, original)
+        self.originals = []
+        self.enabled = False
+
+    def _wrap(self, name, function, io):
+        stats = self.stats.setdefault(name, CallStats(self.max_samples))
+        max_args = positional_limit(function, bound=True)
+
+        @functools.wraps(function)
+        def instrumented(instance, *args, **kwargs):
+            if max_args is not None and len(args) > max_args:
+                args = args[:max_args]
+            if not self.enabled:
+                return function(instance, *args, **kwargs)
+            start = time.perf_counter()
+            result = None
+            try:
+                result = function(instance, *args, **kwargs)
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                stats.count += 1
+                stats.total += elapsed
+                stats.samples.append(elapsed)
+                if io == 'read':
+                    stats.bytes_read += _io_size(name, instance, args, result)
+                elif io == 'write':
+                    stats.bytes_written += _io_size(name, instance, args, result)
+        return instrumented
+
+    def reset(self):
+        # Cleared in place: connected slots still hold wrappers bound to these objects
+        for stats in self.stats.values():
+            stats.reset()
+
+    def snapshot(self):
+        return {name: stats.summary() for name, stats in self.stats.items()}
+
+    def dump(self, path):
+        report = {
+            'generated_at': datetime.now().isoformat(),
+            'enabled': self.enabled,
+            'hot_paths': self.snapshot(),
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+
+def positional_limit(function, bound=False):
+    """
+    Positional arguments ``function`` accepts, or None when it takes ``*args``.
+
+    Qt drops the signal arguments a slot does not accept, so wrappers around
+    slots trim their arguments to this limit on the slot's behalf. ``bound``
+    leaves ``self`` out of the count.
+    """
+    code = getattr(function, '__code__', None)
+    if code is None or code.co_flags & inspect.CO_VARARGS:
+        return None
+    return code.co_argcount - (1 if bound else 0)
+
+
+def _io_size(name, instance, args, result):
+    try:
+        if name == 'EventStore.append_event':
+            # The stored line is the event with the index append_event returned
+            return len(json.dumps(dict(args[1], index=result), separators=(',', ':')).encode('utf-8')) + 1
+        if name == 'EventStore.write_snapshot':
+            return os.path.getsize(instance._snapshot_path(args[0], args[1]))
+        return os.path.getsize(instance._get_character_file_path(args[0]))
+    except (IndexError, TypeError, ValueError, OSError):
+        return 0
+
+
+instrumentation = Instrumentation()
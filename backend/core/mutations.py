@@ -0,0 +1,32 @@
+import functools
+import threading
+
+_calls = threading.local()
+
+
+def mutation(function=None, returns_status=False):
+    """
+    Mark a calculator method as a recorded state change.
+
+    When the outermost marked call completes, the calculator emits
+    ``mutated(method_name, args, kwargs)``. Marked calls it makes on other
+    calculators, directly or through signals, belong to that change and are
+    not announced on their own. A call that raises is not announced, nor is
+    one returning False from a method marked ``returns_status`` (one that
+    reports whether the change was accepted).
+    """
+    if function is None:
+        return functools.partial(mutation, returns_status=returns_status)
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        depth = getattr(_calls, 'depth', 0)
+        _calls.depth = depth + 1
+        try:
+            result = function(self, *args, **kwargs)
+        finally:
+            _calls.depth = depth
+        if depth == 0 and not (returns_status and result is False):
+            self.mutated.emit(function.__name__, list(args), dict(kwargs))
+        return result
+    return wrapper
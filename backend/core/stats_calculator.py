@@ -1,17 +1,20 @@
 from PyQt5.QtCore import QObject, pyqtSignal
 from .base_calculator import BaseCalculator
+from .core_utils import PRIMARY_STATS, calculate_realm, calculate_secondary_stats
+from .copy_on_write import CopyOnWrite
+from .mutations import mutation
 
 class StatsCalculator(QObject):
     stats_updated = pyqtSignal()
+    mutated = pyqtSignal(str, object, object)  # method name, args, kwargs
 
     def __init__(self):
         super().__init__()
         self.base_calculator = BaseCalculatorImplementation()
-        self.primary_stats = {
-            "Body": ["Endurance", "Vitality", "Strength", "Agility", "Dexterity"],
-            "Mind": ["Intelligence", "Memory", "Perception", "Clarity", "Focus"],
-            "Spirit": ["Adaptability", "Magnitude", "Density", "Purity", "Fortitude"]
-        }
+        self.primary_stats = {primary: list(stats) for primary, stats in PRIMARY_STATS.items()}
+        self.copy_on_write = CopyOnWrite()
+        # Bumped whenever the stats change so callers can tell whether anything needs saving
+        self.version = 0
         self.reset()
 
     def reset(self):
@@ -21,34 +24,26 @@ class StatsCalculator(QObject):
         self.free_points = 0
         self.train_points = 0
         self.level = 0
+        self.version += 1
         self.calculate()
 
     def calculate(self):
-        for primary, secondary_stats in self.primary_stats.items():
-            total_points = sum(sum(self.stats[stat][cat] for cat in ['auto', 'free', 'train']) for stat in secondary_stats)
-            total_manual_auto_points = sum(self.stats[stat]['auto'] + self.stats[stat]['free'] for stat in secondary_stats)
-            primary_total = 0
-
-            for stat in secondary_stats:
-                auto = self.stats[stat]['auto']
-                free = self.stats[stat]['free']
-                train = self.stats[stat]['train']
-                total = auto + free + train
-
-                weight = (auto + free) / total_manual_auto_points if total_manual_auto_points > 0 else 0
-                normalized_weight = weight / sum((self.stats[s]['auto'] + self.stats[s]['free']) / total_manual_auto_points
-                                                 for s in secondary_stats) if total_manual_auto_points > 0 else 0
-
-                self.stats[stat]['weight'] = weight
-                self.stats[stat]['total'] = total
-                self.stats[stat]['constraint'] = (total / total_points) * 100 if total_points > 0 else 0
-
-                primary_total += total * normalized_weight
-
-            self.primary_totals[primary] = primary_total
+        derived, primary_totals = calculate_secondary_stats(self.stats, self.primary_stats)
+        changed = False
+        for stat, values in derived.items():
+            if any(self.stats[stat].get(key) != value for key, value in values.items()):
+                self._writable_stat(stat).update(values)
+                changed = True
+        if primary_totals != self.primary_totals:
+            self.primary_totals = self.copy_on_write.writable(self.primary_totals)
+            self.primary_totals.update(primary_totals)
+            changed = True
         
+        if changed:
+            self.version += 1
         self.stats_updated.emit()
 
+    @mutation(returns_status=True)
     def update(self, stat, category, change):
         if category == 'free':
             if self.free_points - change < 0 or self.stats[stat][category] + change < 0:
@@ -59,24 +54,72 @@ class StatsCalculator(QObject):
                 return False
             self.train_points -= change
         
-        self.stats[stat][category] += change
+        self._writable_stat(stat)[category] += change
+        self.version += 1
         self.calculate()
         return True
 
+    @mutation(returns_status=True)
+    def allocate(self, plan):
+        """
+        Apply ``{stat: {category: change}}`` for the free and train categories in one step.
+
+        The whole plan is validated against the point pools before anything is
+        written, and the stats are recomputed once.
+        """
+        pool_changes = {'free': 0, 'train': 0}
+        for stat, changes in plan.items():
+            if stat not in self.stats:
+                raise ValueError(f"Unknown stat: {stat}")
+            for category, change in changes.items():
+                if category not in pool_changes:
+                    raise ValueError(f"Cannot allocate to {category} points")
+                # bool is an int subclass but never a meaningful point count
+                if not isinstance(change, int) or isinstance(change, bool):
+                    raise ValueError(f"{stat} {category} change must be a whole number, got {change!r}")
+                if self.stats[stat][category] + change < 0:
+                    raise ValueError(f"{stat} {category} points cannot go below zero")
+                pool_changes[category] += change
+        if pool_changes['free'] > self.free_points:
+            raise ValueError(f"Not enough free points: {pool_changes['free']} needed, {self.free_points} available")
+        if pool_changes['train'] > self.train_points:
+            raise ValueError(f"Not enough train points: {pool_changes['train']} needed, {self.train_points} available")
+
+        for stat, changes in plan.items():
+            for category, change in changes.items():
+                if change:
+                    self._writable_stat(stat)[category] += change
+        self.free_points -= pool_changes['free']
+        self.train_points -= pool_changes['train']
+        self.version += 1
+        self.calculate()
+        return True
+
+    @mutation
     def handle_level_up(self, new_level, primary):
-        levels_gained = new_level - self.level
-        for _ in range(levels_gained):
-            for stat in self.primary_stats[primary]:
-                self.stats[stat]['auto'] += 1
-            
-            self.free_points += 5
-            self.train_points += 5
+        self.handle_level_ups(new_level, {primary: new_level - self.level})
+
+    @mutation
+    def handle_level_ups(self, new_level, levels_by_primary):
+        for primary, levels_gained in levels_by_primary.items():
+            for _ in range(levels_gained):
+                for stat in self.primary_stats[primary]:
+                    self._writable_stat(stat)['auto'] += 1
+                
+                self.free_points += 5
+                self.train_points += 5
 
         self.level = new_level
+        self.version += 1
         self.calculate()
 
+    def _writable_stat(self, stat):
+        self.stats = self.copy_on_write.writable(self.stats)
+        self.stats[stat] = self.copy_on_write.writable(self.stats[stat])
+        return self.stats[stat]
+
     def get_realm(self):
-        return (self.level - 1) // 10 + 1
+        return calculate_realm(self.level)
 
     def load_stats(self, stats_data):
         if not stats_data:
@@ -87,6 +130,9 @@ class StatsCalculator(QObject):
         self.free_points = stats_data.get('free_points', self.free_points)
         self.train_points = stats_data.get('train_points', self.train_points)
         self.level = stats_data.get('level', self.level)
+        # The caller keeps its dicts; copy them before the first write
+        self.copy_on_write.share()
+        self.version += 1
         self.calculate()
         self.stats_updated.emit()
 
@@ -99,6 +145,16 @@ class StatsCalculator(QObject):
             'level': self.level
         }
 
+    def snapshot(self):
+        """
+        Return the current stats as an immutable snapshot in O(1).
+
+        The calculator copies any container it writes to afterwards, so the
+        snapshot stays consistent; callers must not mutate it.
+        """
+        self.copy_on_write.share()
+        return self.get_stats()
+
 class BaseCalculatorImplementation(BaseCalculator):
     def calculate(self):
         pass
@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import sys
+from collections import deque
+from datetime import datetime
+
+CONSOLE_FORMAT = "%(levelname)s %(name)s: %(message)s"
+
+
+class StructuredEvent:
+    """
+    A log message made of an event name and fields, rendered only when a handler formats it.
+
+    Field values may be callables; they are called only once a handler accepts
+    the record, so expensive details cost nothing for events that are filtered out.
+    """
+    __slots__ = ('event', 'fields')
+
+    def __init__(self, event, fields):
+        self.event = event
+        self.fields = fields
+
+    def resolved_fields(self):
+        return {key: value() if callable(value) else value for key, value in self.fields.items()}
+
+    def __str__(self):
+        fields = self.resolved_fields()
+        if not fields:
+            return self.event
+        return f"{self.event} " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+
+
+class StructuredLogger:
+    """
+    ``logger.info("checkpoint_saved", character=name, chapter=3)``
+
+    The level check happens before anything else, so a disabled call only
+    costs the method call and the keyword arguments.
+    """
+
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+
+    def log(self, level, event, **fields):
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, StructuredEvent(event, fields), stacklevel=2)
+
+    def debug(self, event, **fields):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(StructuredEvent(event, fields), stacklevel=2)
+
+    def info(self, event, **fields):
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(StructuredEvent(event, fields), stacklevel=2)
+
+    def warning(self, event, **fields):
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(StructuredEvent(event, fields), stacklevel=2)
+
+    def error(self, event, **fields):
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(StructuredEvent(event, fields), stacklevel=2)
+
+
+def get_logger(name):
+    return StructuredLogger(name)
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the most recent ``capacity`` records unformatted in memory.
+
+    Records are formatted only by ``dump``, but callable fields are resolved as
+    records arrive so a dump shows the state at logging time. When
+    ``dump_directory`` is set, an ERROR record dumps the buffer, including the
+    error itself, to ``<dump_directory>/log-<timestamp>.jsonl``.
+    """
+
+    def __init__(self, capacity=500, dump_directory=None, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = deque(maxlen=capacity)
+        self.dump_directory = dump_directory
+
+    def emit(self, record):
+        if isinstance(record.msg, StructuredEvent):
+            record.msg = StructuredEvent(record.msg.event, record.msg.resolved_fields())
+        self.records.append(record)
+        if record.levelno >= logging.ERROR and self.dump_directory:
+            self.dump_to_directory()
+
+    def dump(self, stream):
+        for record in list(self.records):
+            stream.write(json.dumps(record_to_dict(record), default=str) + '\n')
+
+    def dump_to_directory(self, directory=None):
+        directory = directory or self.dump_directory
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"log-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.jsonl")
+        try:
+            with open(path, 'w') as f:
+                self.dump(f)
+        except OSError as e:
+            print(f"Error dumping the log buffer: {str(e)}")
+            return None
+        return path
+
+
+def find_ring_buffer(logger=None):
+    for handler in (logger or logging.getLogger()).handlers:
+        if isinstance(handler, RingBufferHandler):
+            return handler
+    return None
+
+
+def record_to_dict(record):
+    entry = {
+        'time': datetime.fromtimestamp(record.created).isoformat(),
+        'level': record.levelname,
+        'logger': record.name,
+    }
+    if isinstance(record.msg, StructuredEvent):
+        entry['event'] = record.msg.event
+        entry.update(record.msg.resolved_fields())
+    else:
+        entry['message'] = record.getMessage()
+    if record.exc_info:
+        entry['exception'] = logging.Formatter().formatException(record.exc_info)
+    return entry
+
+
+def configure_logging(level=None, capacity=500, dump_directory=None, console_level=logging.WARNING):
+    """
+    Route logging into a ring buffer and the console.
+
+    ``level`` (default ``LITRPG_LOG_LEVEL`` or INFO) decides which events are
+    created at all and kept in the buffer; only ``console_level`` and above are
+    printed. Uncaught exceptions are logged as errors, which dumps the buffer;
+    with the hook installed PyQt no longer aborts on an exception in a slot.
+    Returns the ring buffer handler.
+    """
+    level = level or os.environ.get("LITRPG_LOG_LEVEL", "INFO")
+    level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+    if not isinstance(level, int):
+        level = logging.INFO
+    root = logging.getLogger()
+    root.setLevel(min(level, console_level))
+
+    ring_buffer = RingBufferHandler(capacity, dump_directory, level)
+    root.addHandler(ring_buffer)
+    console = logging.StreamHandler()
+    console.setLevel(console_level)
+    console.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    root.addHandler(console)
+
+    previous_hook = sys.excepthook
+
+    def log_uncaught(exc_type, exc_value, exc_traceback):
+        logging.getLogger("uncaught").error(StructuredEvent("uncaught_exception", {'type': exc_type.__name__}),
+                                            exc_info=(exc_type, exc_value, exc_traceback))
+        # The console handler has already printed the traceback
+        if previous_hook is not sys.__excepthook__:
+            previous_hook(exc_type, exc_value, exc_traceback)
+
+    sys.excepthook = log_uncaught
+    return ring_buffer
@@ -1,62 +1,82 @@
 from PyQt5.QtCore import QObject, pyqtSignal
 from .base_calculator import BaseCalculator
-from .core_utils import calculate_max_exp
+from .core_utils import calculate_max_exp, calculate_trait_level
+from .copy_on_write import CopyOnWrite
+from .mutations import mutation
 
 class Trait:
-    def __init__(self, name, quality_grade, quality_level=1):
+    def __init__(self, name, quality_grade, quality_level=1, exp=0, notes=""):
         self.name = name
         self.quality_grade = quality_grade
         self.quality_level = quality_level
-        self.exp = 0
-        self.notes = ""
+        self.exp = exp
+        self.notes = notes
 
 class TraitsCalculator(QObject):
     traits_updated = pyqtSignal()
     exp_updated = pyqtSignal(int, int, int)  # trait_index, current_exp, max_exp
+    mutated = pyqtSignal(str, object, object)  # method name, args, kwargs
 
     def __init__(self, experience_calculator):
         super().__init__()
         self.base_calculator = BaseCalculatorImplementation()
         self.experience_calculator = experience_calculator
         self.traits = []
+        self.copy_on_write = CopyOnWrite()
+        self.version = 0
+        self.experience_calculator.experience_batch_updated.connect(self.apply_experience_batch)
 
     def reset(self):
         self.traits = []
+        self.version += 1
         self.traits_updated.emit()
 
     def create_trait(self, name, quality_grade, quality_level):
         return Trait(name, quality_grade, quality_level)
 
+    @mutation
     def add_trait(self, trait):
         if isinstance(trait, Trait):
             # Check if a trait with the same name already exists
             existing_trait_index = next((index for index, t in enumerate(self.traits) if t.name == trait.name), None)
             if existing_trait_index is not None:
                 # Replace the existing trait
-                self.traits[existing_trait_index] = trait
+                self._writable_traits()[existing_trait_index] = trait
             else:
                 # Add new trait
-                self.traits.append(trait)
+                self._writable_traits().append(trait)
+            self.version += 1
             self.traits_updated.emit()
 
+    @mutation
     def remove_trait(self, index):
         if 0 <= index < len(self.traits):
-            del self.traits[index]
+            del self._writable_traits()[index]
+            self.version += 1
             self.traits_updated.emit()
 
+    @mutation
     def update_trait(self, index, **kwargs):
         if 0 <= index < len(self.traits):
-            trait = self.traits[index]
+            trait = self._writable_trait(index)
             for key, value in kwargs.items():
                 setattr(trait, key, value)
+            self.version += 1
             self.traits_updated.emit()
 
-    def get_traits(self):
+    def _writable_traits(self):
+        self.traits = self.copy_on_write.writable(self.traits)
         return self.traits
 
+    def _writable_trait(self, index):
+        traits = self._writable_traits()
+        traits[index] = self.copy_on_write.writable(traits[index])
+        return traits[index]
+
+    @mutation
     def add_experience(self, trait_index, amount):
         if 0 <= trait_index < len(self.traits):
-            trait = self.traits[trait_index]
+            trait = self._writable_trait(trait_index)
             trait.exp += amount
             max_exp = calculate_max_exp(trait.quality_level)
             
@@ -68,9 +88,30 @@ class TraitsCalculator(QObject):
             if trait.quality_level == 10:
                 trait.exp = min(trait.exp, max_exp - 1)
             
+            self.version += 1
             self.exp_updated.emit(trait_index, trait.exp, max_exp)
             self.traits_updated.emit()
 
+    def apply_experience_batch(self, summary):
+        # Batched trait grants only touch the cumulative exp; bring the grade, level and exp in line once
+        changed = False
+        for name, entry in summary.get("trait", {}).items():
+            index = next((index for index, trait in enumerate(self.traits) if trait.name == name), None)
+            if index is None:
+                continue
+            grade, level, exp, _ = calculate_trait_level(entry["exp"])
+            trait = self.traits[index]
+            if (trait.quality_grade, trait.quality_level, trait.exp) != (grade, level, exp):
+                trait = self._writable_trait(index)
+                trait.quality_grade = grade
+                trait.quality_level = level
+                trait.exp = exp
+                changed = True
+        if changed:
+            self.version += 1
+            self.traits_updated.emit()
+
+    @mutation
     def add_experience_percent(self, trait_index, percent):
         if 0 <= trait_index < len(self.traits):
             trait = self.traits[trait_index]
@@ -82,11 +123,17 @@ class TraitsCalculator(QObject):
         if not traits_data:
             return
         self.traits = [Trait(**trait_dict) for trait_dict in traits_data]
+        self.version += 1
         self.traits_updated.emit()
 
     def get_traits(self):
         return [trait.__dict__ for trait in self.traits]
 
+    def snapshot(self):
+        # Trait objects are copied before they are modified, so their dicts can be shared
+        self.copy_on_write.share()
+        return self.get_traits()
+
 class BaseCalculatorImplementation(BaseCalculator):
     def calculate(self):
         pass
@@ -0,0 +1,188 @@
+import asyncio
+import functools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from .character_database import CharacterDatabase, CheckpointRecord
+
+# Checkpoints pulled from the file per executor round trip in iter_checkpoints
+CHECKPOINT_CHUNK_SIZE = 16
+
+
+class CharacterLock:
+    """
+    Many readers or one writer for a single character file.
+
+    Waiting writers block new readers, so a stream of reads cannot starve a write.
+    """
+
+    def __init__(self):
+        self.condition = asyncio.Condition()
+        self.readers = 0
+        self.writer_active = False
+        self.waiting_writers = 0
+
+    @asynccontextmanager
+    async def read(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: not self.writer_active and not self.waiting_writers)
+            self.readers += 1
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.readers -= 1
+                self.condition.notify_all()
+
+    @asynccontextmanager
+    async def write(self):
+        async with self.condition:
+            self.waiting_writers += 1
+            try:
+                await self.condition.wait_for(lambda: not self.writer_active and not self.readers)
+            finally:
+                self.waiting_writers -= 1
+            self.writer_active = True
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.writer_active = False
+                self.condition.notify_all()
+
+
+class AsyncCharacterDatabase:
+    """
+    Asyncio facade over ``CharacterDatabase``.
+
+    Every file operation runs on a bounded thread pool, so the event loop never
+    blocks on disk. Writes to one character are serialized and exclusive with
+    reads of that character, which keeps read-modify-write updates such as
+    ``add_checkpoint`` from losing each other's changes; reads of a character
+    run concurrently, and different characters never wait on each other.
+
+    Concurrent ``load_character`` calls for one character share a single
+    file read, so the returned dict is shared between those callers and must
+    not be modified in place, as with ``CheckpointCache``.
+    """
+
+    def __init__(self, character_database: Union[CharacterDatabase, str], max_workers: int = 8):
+        if isinstance(character_database, str):
+            character_database = CharacterDatabase(character_database)
+        self.character_database = character_database
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="character-db")
+        self.locks = defaultdict(CharacterLock)
+        self.pending_loads = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+    async def _run(self, function, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self.executor,
+                                                                functools.partial(function, *args, **kwargs))
+
+    async def _read(self, character_name: str, function, *args, **kwargs):
+        async with self.locks[character_name].read():
+            return await self._run(function, character_name, *args, **kwargs)
+
+    async def _write(self, character_name: str, function, *args, **kwargs):
+        async with self.locks[character_name].write():
+            return await self._run(function, character_name, *args, **kwargs)
+
+    async def get_character_list(self) -> List[str]:
+        return await self._run(self.character_database.get_character_list)
+
+    async def create_character(self, character_name: str) -> None:
+        await self._write(character_name, self.character_database.create_character)
+
+    async def load_character(self, character_name: str) -> Dict:
+        load = self.pending_loads.get(character_name)
+        if load is None or load.done():
+            load = asyncio.ensure_future(self._read(character_name, self.character_database.load_character))
+            self.pending_loads[character_name] = load
+            load.add_done_callback(functools.partial(self._forget_load, character_name))
+        # One cancelled caller must not cancel the read for the others
+        return await asyncio.shield(load)
+
+    def _forget_load(self, character_name, load):
+        if self.pending_loads.get(character_name) is load:
+            del self.pending_loads[character_name]
+
+    async def update_character(self, character_name: str, data: Dict) -> None:
+        await self._write(character_name, self.character_database.update_character, data)
+
+    async def add_chapter(self, character_name: str, chapter_number: int, start_section: str, end_section: str) -> None:
+        await self._write(character_name, self.character_database.add_chapter, chapter_number, start_section,
+                          end_section)
+
+    async def add_checkpoint(self, character_name: str, chapter_number: int, checkpoint_name: str, stats: Dict) -> None:
+        await self._write(character_name, self.character_database.add_checkpoint, chapter_number, checkpoint_name,
+                          stats)
+
+    async def update_checkpoint(self, character_name: str, chapter_number: int, checkpoint_name: str, stats: Dict,
+                                partial: bool = False) -> None:
+        await self._write(character_name, self.character_database.update_checkpoint, chapter_number,
+                          checkpoint_name, stats, partial)
+
+    async def get_character_data(self, character_name: str, chapter_number: int = None,
+                                 checkpoint_name: str = None) -> Dict:
+        return await self._read(character_name, self.character_database.get_character_data, chapter_number,
+                                checkpoint_name)
+
+    async def remove_character(self, character_name: str) -> None:
+        await self._write(character_name, self.character_database.remove_character)
+
+    async def remove_chapter(self, character_name: str, chapter_number: int) -> None:
+        await self._write(character_name, self.character_database.remove_chapter, chapter_number)
+
+    async def remove_checkpoint(self, character_name: str, chapter_number: int, checkpoint_name: str) -> None:
+        await self._write(character_name, self.character_database.remove_checkpoint, chapter_number, checkpoint_name)
+
+    async def iter_checkpoints(self, character_name: str,
+                               chapter_range: Optional[Tuple[Optional[int], Optional[int]]] = None
+                               ) -> AsyncIterator[CheckpointRecord]:
+        """
+        Stream a character's checkpoints, parsed incrementally on the executor.
+
+        The character is read-locked until the iteration finishes, so writes to
+        it wait for slow consumers; finish or close the iterator promptly.
+        """
+        async with self.locks[character_name].read():
+            # Creating the generator does no I/O; the file is opened by the first chunk
+            records = self.character_database.iter_checkpoints(character_name, chapter_range)
+            try:
+                while True:
+                    chunk = await self._run(_next_chunk, records, CHECKPOINT_CHUNK_SIZE)
+                    for record in chunk:
+                        yield record
+                    if len(chunk) < CHECKPOINT_CHUNK_SIZE:
+                        break
+            finally:
+                try:
+                    records.close()
+                except ValueError:
+                    # A cancelled consumer left a chunk running on the executor; the file closes with the generator
+                    pass
+
+    async def iter_all_checkpoints(self, chapter_range: Optional[Tuple[Optional[int], Optional[int]]] = None
+                                   ) -> AsyncIterator[CheckpointRecord]:
+        for character_file in await self.get_character_list():
+            async for record in self.iter_checkpoints(character_file[:-len('.json')], chapter_range):
+                yield record
+
+
+def _next_chunk(iterator, size: int) -> List:
+    chunk = []
+    for item in iterator:
+        chunk.append(item)
+        if len(chunk) >= size:
+            break
+    return chunk
@@ -1,11 +1,22 @@
 import json
 import os
-from typing import Dict, List, Union
+from collections import namedtuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
+from .json_stream import JsonStreamReader
+from .database_utils import STORAGE_MODES, strip_derived_fields
+
+CheckpointRecord = namedtuple('CheckpointRecord', ['character', 'chapter', 'name', 'timestamp', 'stats'])
 
 class CharacterDatabase:
-    def __init__(self, data_directory: str):
+    def __init__(self, data_directory: str, storage_mode: str = "full"):
+        if storage_mode not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage_mode}")
         self.data_directory = data_directory
+        # "raw" persists only calculator inputs; derived values are recomputed on load
+        self.storage_mode = storage_mode
+        # character -> ((mtime_ns, size), names); rewrites through this instance also drop the entry
+        self.checkpoint_name_cache = {}
         os.makedirs(data_directory, exist_ok=True)
 
     def get_character_list(self) -> List[str]:
@@ -53,6 +64,8 @@ class CharacterDatabase:
         
         current_data = self.load_character(character_name)
         current_data.update(data)
+        current_data = self._prepare_snapshot(current_data)
+        self.checkpoint_name_cache.pop(character_name, None)
         
         with open(file_path, 'w') as f:
             json.dump(current_data, f, indent=2)
@@ -80,7 +93,7 @@ class CharacterDatabase:
         new_checkpoint = {
             "name": checkpoint_name,
             "timestamp": datetime.now().isoformat(),
-            "stats": stats
+            "stats": self._prepare_snapshot(stats)
         }
         
         chapter["checkpoints"].append(new_checkpoint)
@@ -105,12 +118,101 @@ class CharacterDatabase:
         
         return checkpoint
 
+    def iter_checkpoints(self, character_name: str,
+                         chapter_range: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Iterator[CheckpointRecord]:
+        """
+        Lazily yield the checkpoints of a character, parsing the file incrementally.
+
+        ``chapter_range`` is an inclusive ``(first, last)`` pair of chapter numbers;
+        either bound may be None. Only one checkpoint is decoded at a time.
+        """
+        for number, checkpoint in self._walk_checkpoints(character_name, chapter_range, JsonStreamReader.read_value):
+            yield self._make_checkpoint_record(character_name, number, checkpoint)
+
+    def checkpoint_names(self, character_name: str) -> Dict[int, List[str]]:
+        """
+        Map each chapter number to its checkpoint names, in file order.
+
+        Checkpoint stats are skipped while scanning, so no snapshot is kept, and
+        the result is reused until the character file changes.
+        """
+        file_path = self._get_character_file_path(character_name)
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            raise ValueError(f"Character {character_name} does not exist")
+        key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self.checkpoint_name_cache.get(character_name)
+        if cached is None or cached[0] != key:
+            names = {}
+            for number, checkpoint in self._walk_checkpoints(character_name, None, self._read_checkpoint_name):
+                names.setdefault(number, []).append(checkpoint.get("name"))
+            cached = self.checkpoint_name_cache[character_name] = (key, names)
+        return {number: list(names) for number, names in cached[1].items()}
+
+    @staticmethod
+    def _read_checkpoint_name(reader: JsonStreamReader) -> Dict:
+        checkpoint = {}
+        for key in reader.iter_object():
+            if key == "name":
+                checkpoint["name"] = reader.read_value()
+            else:
+                reader.skip_value()
+        return checkpoint
+
+    def _walk_checkpoints(self, character_name: str, chapter_range: Optional[Tuple[Optional[int], Optional[int]]],
+                          read_checkpoint) -> Iterator[Tuple[int, Dict]]:
+        file_path = self._get_character_file_path(character_name)
+        if not os.path.exists(file_path):
+            raise ValueError(f"Character {character_name} does not exist")
+
+        def in_range(number):
+            if chapter_range is None:
+                return True
+            first, last = chapter_range
+            return (first is None or number >= first) and (last is None or number <= last)
+
+        with open(file_path, 'r') as f:
+            reader = JsonStreamReader(f)
+            for key in reader.iter_object():
+                if key != "chapters":
+                    reader.skip_value()
+                    continue
+                for _ in reader.iter_array():
+                    number = None
+                    pending = []
+                    for chapter_key in reader.iter_object():
+                        if chapter_key == "number":
+                            number = reader.read_value()
+                        elif chapter_key == "checkpoints" and (number is None or in_range(number)):
+                            for _ in reader.iter_array():
+                                checkpoint = read_checkpoint(reader)
+                                if number is None:
+                                    # "number" normally precedes "checkpoints"; hold on until it is known
+                                    pending.append(checkpoint)
+                                else:
+                                    yield number, checkpoint
+                        else:
+                            reader.skip_value()
+                    if pending and in_range(number):
+                        for checkpoint in pending:
+                            yield number, checkpoint
+
+    def iter_all_checkpoints(self, chapter_range: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Iterator[CheckpointRecord]:
+        for character_file in self.get_character_list():
+            yield from self.iter_checkpoints(character_file[:-len('.json')], chapter_range)
+
+    def _make_checkpoint_record(self, character_name: str, chapter_number: int, checkpoint: Dict) -> CheckpointRecord:
+        return CheckpointRecord(character_name, chapter_number, checkpoint.get("name"),
+                                checkpoint.get("timestamp", ""), checkpoint.get("stats", {}))
+
     def remove_character(self, character_name: str) -> None:
         file_path = self._get_character_file_path(character_name)
         if not os.path.exists(file_path):
             raise ValueError(f"Character {character_name} does not exist")
         
         os.remove(file_path)
+        self.checkpoint_name_cache.pop(character_name, None)
 
     def remove_chapter(self, character_name: str, chapter_number: int) -> None:
         data = self.load_character(character_name)
@@ -131,12 +233,22 @@ class CharacterDatabase:
     def _get_character_file_path(self, character_name: str) -> str:
         return os.path.join(self.data_directory, f"{character_name}.json")
 
+    def _prepare_snapshot(self, snapshot: Dict) -> Dict:
+        if self.storage_mode == "raw":
+            return strip_derived_fields(snapshot)
+        return snapshot
+
     def _save_character_data(self, character_name: str, data: Dict) -> None:
         file_path = self._get_character_file_path(character_name)
+        self.checkpoint_name_cache.pop(character_name, None)
         with open(file_path, 'w') as f:
             json.dump(data, f, indent=2)
 
-    def update_checkpoint(self, character_name: str, chapter_number: int, checkpoint_name: str, stats: Dict) -> None:
+    def update_checkpoint(self, character_name: str, chapter_number: int, checkpoint_name: str, stats: Dict,
+                          partial: bool = False) -> None:
+        """
+        Replace the stats of a checkpoint, or with ``partial`` only the sections present in ``stats``.
+        """
         data = self.load_character(character_name)
         
         chapter = next((c for c in data["chapters"] if c["number"] == chapter_number), None)
@@ -147,7 +259,10 @@ class CharacterDatabase:
         if not checkpoint:
             raise ValueError(f"Checkpoint {checkpoint_name} not found in chapter {chapter_number}")
         
-        checkpoint["stats"] = stats
+        if partial:
+            checkpoint["stats"] = dict(checkpoint.get("stats", {}), **self._prepare_snapshot(stats))
+        else:
+            checkpoint["stats"] = self._prepare_snapshot(stats)
         checkpoint["timestamp"] = datetime.now().isoformat()
         
         self._save_character_data(character_name, data)
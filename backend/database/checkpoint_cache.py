@@ -0,0 +1,116 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from .character_database import CharacterDatabase
+
+
+class CheckpointCache:
+    """
+    LRU cache of decoded checkpoint snapshots with background neighbour prefetch.
+
+    Cached snapshots are shared with every caller; the calculators copy loaded
+    data before writing to it, so they are never modified in place.
+    """
+
+    def __init__(self, character_db: CharacterDatabase, capacity: int = 128, prefetch_radius: int = 2):
+        self.character_db = character_db
+        self.capacity = capacity
+        self.prefetch_radius = prefetch_radius
+        self.entries = OrderedDict()
+        self.pending = {}
+        # Write counters per character, chapter and checkpoint scope; a load only stores if none moved meanwhile
+        self.generations = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-prefetch")
+
+    def get(self, character_name: str, chapter_number: int, checkpoint_name: str) -> Dict:
+        key = (character_name, chapter_number, checkpoint_name)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+            future = self.pending.get(key)
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                pass
+            with self.lock:
+                if key in self.entries:
+                    return self.entries[key]
+
+        with self.lock:
+            generations = {checkpoint_name: self._generation(key)}
+        self._load(character_name, chapter_number, [checkpoint_name], generations)
+        with self.lock:
+            if key in self.entries:
+                return self.entries[key]
+        raise ValueError(f"Checkpoint {checkpoint_name} not found in chapter {chapter_number}")
+
+    def prefetch_neighbours(self, character_name: str, chapter_number: int, checkpoint_names: list, index: int) -> None:
+        first = max(0, index - self.prefetch_radius)
+        neighbours = checkpoint_names[first:index + self.prefetch_radius + 1]
+        self.prefetch(character_name, chapter_number, [name for name in neighbours if name != checkpoint_names[index]])
+
+    def prefetch(self, character_name: str, chapter_number: int, checkpoint_names: Iterable[str]) -> None:
+        with self.lock:
+            missing = [name for name in checkpoint_names
+                       if (character_name, chapter_number, name) not in self.entries
+                       and (character_name, chapter_number, name) not in self.pending]
+            if not missing:
+                return
+            generations = {name: self._generation((character_name, chapter_number, name)) for name in missing}
+            future = self.executor.submit(self._load, character_name, chapter_number, missing, generations)
+            for name in missing:
+                self.pending[(character_name, chapter_number, name)] = future
+
+    def invalidate(self, character_name: str, chapter_number: Optional[int] = None,
+                   checkpoint_name: Optional[str] = None) -> None:
+        """
+        Drop cached snapshots of a character, one of its chapters, or a single checkpoint.
+        """
+        scope = tuple(part for part in (character_name, chapter_number, checkpoint_name) if part is not None)
+        with self.lock:
+            # Loads of this scope already in flight were started before the write and must not be stored
+            self.generations[scope] = self.generations.get(scope, 0) + 1
+            for key in list(self.entries):
+                if key[:len(scope)] == scope:
+                    del self.entries[key]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generations[()] = self.generations.get((), 0) + 1
+            self.entries.clear()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+
+    def _generation(self, key: tuple) -> tuple:
+        return tuple(self.generations.get(key[:length], 0) for length in range(len(key) + 1))
+
+    def _load(self, character_name: str, chapter_number: int, checkpoint_names: list, generations: Dict) -> None:
+        wanted = set(checkpoint_names)
+        try:
+            # One streaming pass over the chapter decodes all requested checkpoints
+            for record in self.character_db.iter_checkpoints(character_name, (chapter_number, chapter_number)):
+                if record.name in wanted:
+                    self._store((character_name, chapter_number, record.name), record.stats,
+                                generations[record.name])
+                    wanted.discard(record.name)
+                    if not wanted:
+                        break
+        finally:
+            with self.lock:
+                for name in checkpoint_names:
+                    self.pending.pop((character_name, chapter_number, name), None)
+
+    def _store(self, key: tuple, snapshot: Dict, generation: tuple) -> None:
+        with self.lock:
+            if generation != self._generation(key):
+                return
+            self.entries[key] = snapshot
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
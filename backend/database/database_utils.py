@@ -1,36 +1,23 @@
 import json
 from typing import Dict, Any
+# Stat entry validation and diffing are shared with the calculators; re-exported for existing callers
+from ..stat_entry_utils import (DERIVED_STAT_FIELDS, LIST_KEY_FIELDS, RAW_STAT_FIELDS, STAT_ENTRY_SECTIONS,
+                                REQUIRED_STAT_ENTRY_SECTIONS, validate_stat_entry, stat_entry_problems,
+                                create_diff, apply_diff, create_patch, apply_patch)
 
-def validate_stat_entry(stat_entry: Dict[str, Any]) -> bool:
-    """
-    Validate the structure of a stat entry.
-    """
-    required_keys = ['level', 'experience', 'stats', 'arts', 'traits']
-    return all(key in stat_entry for key in required_keys)
-
-def create_diff(old_stats: Dict[str, Any], new_stats: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Create a diff between two stat entries.
-    """
-    diff = {}
-    for key, value in new_stats.items():
-        if key not in old_stats or old_stats[key] != value:
-            if isinstance(value, dict):
-                nested_diff = create_diff(old_stats.get(key, {}), value)
-                if nested_diff:
-                    diff[key] = nested_diff
-            else:
-                diff[key] = value
-    return diff
+STORAGE_MODES = ['full', 'raw']
 
-def apply_diff(base_stats: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+def strip_derived_fields(snapshot: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Apply a diff to a base stat entry.
+    Drop the values the calculators can recompute from a snapshot, keeping only raw inputs.
     """
-    result = base_stats.copy()
-    for key, value in diff.items():
-        if isinstance(value, dict):
-            result[key] = apply_diff(result.get(key, {}), value)
-        else:
-            result[key] = value
+    result = {key: value for key, value in snapshot.items() if key != 'energy'}
+    stats_data = snapshot.get('stats')
+    if isinstance(stats_data, dict):
+        result['stats'] = {key: value for key, value in stats_data.items() if key != 'primary_totals'}
+        if isinstance(stats_data.get('stats'), dict):
+            result['stats']['stats'] = {
+                stat: {key: value for key, value in values.items() if key not in DERIVED_STAT_FIELDS}
+                for stat, values in stats_data['stats'].items()
+            }
     return result
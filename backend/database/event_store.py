@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class EventStore:
+    """
+    Append-only per-character event logs with materialized snapshots.
+
+    Each character gets ``events/<name>/`` containing ``events.jsonl`` (one
+    event per line), ``snapshot-<index>.json`` files holding the full state
+    before event ``index``, and ``snapshots.jsonl``, an index of the snapshots
+    with the byte offset of event ``index`` so replay can seek straight to it.
+    """
+
+    def __init__(self, data_directory: str):
+        self.data_directory = os.path.join(data_directory, "events")
+        self.counts = {}
+        os.makedirs(self.data_directory, exist_ok=True)
+
+    def event_count(self, character_name: str) -> int:
+        if character_name not in self.counts:
+            count = 0
+            path = self._events_path(character_name)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    count = sum(1 for _ in f)
+            self.counts[character_name] = count
+        return self.counts[character_name]
+
+    def append_event(self, character_name: str, event: Dict[str, Any]) -> int:
+        index = self.event_count(character_name)
+        event = dict(event, index=index)
+        os.makedirs(self._character_directory(character_name), exist_ok=True)
+        with open(self._events_path(character_name), 'ab') as f:
+            f.write(json.dumps(event, separators=(',', ':')).encode('utf-8') + b'\n')
+        self.counts[character_name] = index + 1
+        return index
+
+    def write_snapshot(self, character_name: str, index: int, state: Dict[str, Any],
+                       level: int, timestamp: str) -> None:
+        os.makedirs(self._character_directory(character_name), exist_ok=True)
+        with open(self._snapshot_path(character_name, index), 'w') as f:
+            json.dump(state, f)
+        offset = 0
+        if os.path.exists(self._events_path(character_name)):
+            offset = os.path.getsize(self._events_path(character_name))
+        entry = {"index": index, "offset": offset, "level": level, "ts": timestamp}
+        with open(self._snapshot_index_path(character_name), 'a') as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+    def list_snapshots(self, character_name: str) -> List[Dict[str, Any]]:
+        path = self._snapshot_index_path(character_name)
+        if not os.path.exists(path):
+            return []
+        entries = {}
+        with open(path, 'r') as f:
+            for line in f:
+                entry = json.loads(line)
+                # A snapshot rewritten at the same index replaces the earlier one
+                entries[entry["index"]] = entry
+        return sorted(entries.values(), key=lambda entry: entry["index"])
+
+    def latest_snapshot(self, character_name: str, index: int) -> Optional[Dict[str, Any]]:
+        candidates = [entry for entry in self.list_snapshots(character_name) if entry["index"] <= index]
+        return candidates[-1] if candidates else None
+
+    def load_snapshot(self, character_name: str, index: int) -> Dict[str, Any]:
+        path = self._snapshot_path(character_name, index)
+        if not os.path.exists(path):
+            raise ValueError(f"No snapshot at event {index} for character {character_name}")
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def iter_events(self, character_name: str, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        path = self._events_path(character_name)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                yield json.loads(line)
+
+    def remove_character(self, character_name: str) -> None:
+        self.counts.pop(character_name, None)
+        shutil.rmtree(self._character_directory(character_name), ignore_errors=True)
+
+    def _character_directory(self, character_name: str) -> str:
+        return os.path.join(self.data_directory, character_name)
+
+    def _events_path(self, character_name: str) -> str:
+        return os.path.join(self._character_directory(character_name), "events.jsonl")
+
+    def _snapshot_index_path(self, character_name: str) -> str:
+        return os.path.join(self._character_directory(character_name), "snapshots.jsonl")
+
+    def _snapshot_path(self, character_name: str, index: int) -> str:
+        return os.path.join(self._character_directory(character_name), f"snapshot-{index}.json")
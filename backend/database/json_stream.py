@@ -0,0 +1,100 @@
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+_NON_WHITESPACE = re.compile(r'\S')
+
+
+class JsonStreamReader:
+    """
+    Incremental reader for a JSON document stored in a text file.
+
+    Containers can be walked with ``iter_object``/``iter_array`` without
+    decoding them whole; the caller must consume each yielded member with
+    ``read_value`` or ``skip_value`` before advancing the iterator. Only the
+    value currently being decoded is held in memory.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = 65536):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        # Grow reads with the pending value so re-decoding stays linear overall
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected '{char}' but found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self) -> None:
+        self.read_value()
+
+    def _next_member(self, closing: str) -> bool:
+        char = self.peek()
+        if char == ',':
+            self.pos += 1
+            return True
+        if char == closing:
+            self.pos += 1
+            return False
+        raise ValueError(f"Malformed JSON: expected ',' or '{closing}' but found '{char or 'end of file'}'")
+
+    def iter_object(self) -> Iterator[str]:
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(':')
+            yield key
+            if not self._next_member('}'):
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield None
+            if not self._next_member(']'):
+                return
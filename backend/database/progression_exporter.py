@@ -0,0 +1,225 @@
+import csv
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from array import array
+from typing import Iterable, Iterator, List, Optional
+
+from .character_database import CharacterDatabase, CheckpointRecord
+from ..core.core_utils import PRIMARY_STATS, calculate_art_results, calculate_realm, derive_snapshot
+
+STAT_COMPONENTS = ['auto', 'free', 'train', 'weight', 'constraint', 'total']
+ENERGY_POOLS = ['Lifeforce', 'Qi', 'Essence']
+TEXT_COLUMNS = ['character', 'checkpoint', 'timestamp']
+
+
+class ProgressionExporter:
+    """
+    Export the checkpoint history of one or many characters as columnar data.
+
+    Checkpoints are read through ``CharacterDatabase.iter_checkpoints`` and every
+    writer streams rows out as they are produced, so memory stays bounded by
+    ``chunk_size`` rows no matter how many checkpoints the characters have.
+    """
+
+    def __init__(self, character_db: CharacterDatabase, chunk_size: int = 4096):
+        self.character_db = character_db
+        self.chunk_size = chunk_size
+
+    def iter_checkpoints(self, character_names: Optional[Iterable[str]] = None) -> Iterator[CheckpointRecord]:
+        if character_names is None:
+            return self.character_db.iter_all_checkpoints()
+        return (record for character_name in character_names
+                for record in self.character_db.iter_checkpoints(character_name))
+
+    def get_columns(self, art_names: List[str]) -> List[str]:
+        columns = TEXT_COLUMNS[:1] + ['chapter'] + TEXT_COLUMNS[1:] + ['level', 'free_points', 'train_points']
+        for secondary_stats in PRIMARY_STATS.values():
+            for stat in secondary_stats:
+                columns.extend(f"{stat}.{component}" for component in STAT_COMPONENTS)
+        columns.extend(f"primary.{primary}" for primary in PRIMARY_STATS)
+        columns.extend(f"energy.{pool}" for pool in ENERGY_POOLS)
+        columns.extend(f"art.{art_name}.final_boost" for art_name in art_names)
+        return columns
+
+    def build_row(self, record: CheckpointRecord, art_names: List[str]) -> List:
+        snapshot = derive_snapshot(record.stats)
+        stats_data = snapshot.get("stats", {})
+        stats = stats_data.get("stats", {})
+        primary_totals = stats_data.get("primary_totals", {})
+        energy = snapshot.get("energy", {})
+        level = stats_data.get("level", 0)
+
+        row = [record.character, record.chapter, record.name, record.timestamp,
+               level, stats_data.get("free_points", math.nan), stats_data.get("train_points", math.nan)]
+        for secondary_stats in PRIMARY_STATS.values():
+            for stat in secondary_stats:
+                values = stats.get(stat, {})
+                row.extend(values.get(component, math.nan) for component in STAT_COMPONENTS)
+        row.extend(primary_totals.get(primary, math.nan) for primary in PRIMARY_STATS)
+        row.extend(energy.get(pool, {}).get('final', math.nan) for pool in ENERGY_POOLS)
+
+        arts = snapshot.get("arts", {})
+        mastery = snapshot.get("experience", {}).get("mastery", {})
+        realm = calculate_realm(level)
+        for art_name in art_names:
+            art = arts.get(art_name)
+            if art is None or len(primary_totals) != len(PRIMARY_STATS):
+                row.append(math.nan)
+                continue
+            mastery_level = mastery.get(art_name, {}).get("level", 1)
+            row.append(calculate_art_results(art, primary_totals, mastery_level, realm)['final_boost'])
+        return row
+
+    def iter_rows(self, art_names: List[str], character_names: Optional[Iterable[str]] = None,
+                  discover_arts: bool = False) -> Iterator[List]:
+        """
+        Yield one row per checkpoint, in a single pass over the characters.
+
+        With ``discover_arts`` every art a record has that is not in ``art_names``
+        yet is appended to it before the row is built, so the list ends up
+        holding every art in first-seen order. A row only covers the arts known
+        when it was built; its missing art columns are at the end.
+        """
+        known = set(art_names)
+        for record in self.iter_checkpoints(character_names):
+            if discover_arts:
+                for art_name in record.stats.get("arts", {}):
+                    if art_name not in known:
+                        known.add(art_name)
+                        art_names.append(art_name)
+            yield self.build_row(record, art_names)
+
+    def export_csv(self, file_path: str, character_names: Optional[Iterable[str]] = None,
+                   art_names: Optional[List[str]] = None) -> int:
+        """
+        Write a header and one row per checkpoint to ``file_path``.
+
+        Without ``art_names`` the art columns are discovered while streaming;
+        rows are then spooled to a temporary file until the header is known.
+        """
+        discover_arts = art_names is None
+        art_names = [] if discover_arts else list(art_names)
+        row_count = 0
+        with open(file_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            if not discover_arts:
+                writer.writerow(self.get_columns(art_names))
+                for row in self.iter_rows(art_names, character_names):
+                    writer.writerow(row)
+                    row_count += 1
+                return row_count
+
+            with tempfile.TemporaryFile('w+', newline='') as spool:
+                spool_writer = csv.writer(spool)
+                for row in self.iter_rows(art_names, character_names, discover_arts=True):
+                    spool_writer.writerow(row)
+                    row_count += 1
+                columns = self.get_columns(art_names)
+                writer.writerow(columns)
+                spool.seek(0)
+                missing = [math.nan] * len(art_names)
+                for row in csv.reader(spool):
+                    writer.writerow(row + missing[:len(columns) - len(row)])
+        return row_count
+
+    def export_npz(self, file_path: str, character_names: Optional[Iterable[str]] = None,
+                   art_names: Optional[List[str]] = None) -> int:
+        """
+        Write one array per column into a NumPy ``.npz`` archive.
+
+        Columns are spooled to per-column temporary files in chunks and then
+        streamed into the archive, so NumPy itself is not needed to write it.
+        Without ``art_names`` the art columns are discovered while streaming and
+        earlier rows are filled with NaN.
+        """
+        discover_arts = art_names is None
+        art_names = [] if discover_arts else list(art_names)
+        columns = self.get_columns(art_names)
+        spool_dir = tempfile.mkdtemp(prefix="progression_export_")
+        try:
+            spools = [_ColumnSpool(os.path.join(spool_dir, str(i)), column in TEXT_COLUMNS)
+                      for i, column in enumerate(columns)]
+            row_count = 0
+            for row in self.iter_rows(art_names, character_names, discover_arts):
+                while len(spools) < len(row):
+                    spool = _ColumnSpool(os.path.join(spool_dir, str(len(spools))), False)
+                    spool.fill(math.nan, row_count, self.chunk_size)
+                    spools.append(spool)
+                for spool, value in zip(spools, row):
+                    spool.append(value)
+                row_count += 1
+                if row_count % self.chunk_size == 0:
+                    for spool in spools:
+                        spool.flush()
+
+            columns = self.get_columns(art_names)
+            with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as archive:
+                for column, spool in zip(columns, spools):
+                    spool.flush()
+                    with archive.open(f"{column}.npy", 'w', force_zip64=True) as entry:
+                        spool.write_npy(entry, row_count)
+            return row_count
+        finally:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+
+
+class _ColumnSpool:
+    # The file is only open while a chunk is written, so wide exports do not run out of file handles
+    def __init__(self, path: str, is_text: bool):
+        self.path = path
+        self.is_text = is_text
+        self.max_length = 1
+        self.buffer = [] if is_text else array('d')
+        open(path, 'w').close()
+
+    def append(self, value):
+        if self.is_text:
+            value = str(value)
+            self.max_length = max(self.max_length, len(value))
+            self.buffer.append(json.dumps(value))
+        else:
+            self.buffer.append(float(value))
+
+    def fill(self, value, count: int, chunk_size: int):
+        for start in range(0, count, chunk_size):
+            for _ in range(min(chunk_size, count - start)):
+                self.append(value)
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        if self.is_text:
+            with open(self.path, 'a') as f:
+                f.writelines(line + '\n' for line in self.buffer)
+            self.buffer = []
+        else:
+            if sys.byteorder == 'big':
+                self.buffer.byteswap()
+            with open(self.path, 'ab') as f:
+                self.buffer.tofile(f)
+            self.buffer = array('d')
+
+    def write_npy(self, entry, row_count: int):
+        descr = f"<U{self.max_length}" if self.is_text else "<f8"
+        entry.write(_npy_header(descr, row_count))
+        if self.is_text:
+            with open(self.path, 'r') as f:
+                for line in f:
+                    entry.write(json.loads(line).ljust(self.max_length, '\0').encode('utf-32-le'))
+        else:
+            with open(self.path, 'rb') as f:
+                shutil.copyfileobj(f, entry)
+
+
+def _npy_header(descr: str, row_count: int) -> bytes:
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({row_count},), }}"
+    # Version 1.0 header: magic, version, little-endian length, then padding to 64 bytes
+    padding = 64 - (10 + len(header) + 1) % 64
+    header = (header + ' ' * padding + '\n').encode('latin1')
+    return b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header
@@ -0,0 +1,212 @@
+import copy
+from typing import Dict, Any, List, Union
+
+DERIVED_STAT_FIELDS = ['weight', 'constraint', 'total']
+LIST_KEY_FIELDS = ['name', 'number']
+RAW_STAT_FIELDS = ['auto', 'free', 'train']
+# Energy is derived and dropped in raw storage mode, so it is the only optional section
+STAT_ENTRY_SECTIONS = {'stats': dict, 'energy': dict, 'experience': dict, 'arts': dict, 'traits': list}
+REQUIRED_STAT_ENTRY_SECTIONS = ['stats', 'experience', 'arts', 'traits']
+
+def validate_stat_entry(stat_entry: Dict[str, Any]) -> bool:
+    """
+    Validate the structure of a stat entry.
+    """
+    return not stat_entry_problems(stat_entry)
+
+def stat_entry_problems(stat_entry: Any) -> List[str]:
+    """
+    Describe what is wrong with the structure of a stat entry; empty when it is valid.
+
+    A stat entry is a character's current state or a checkpoint's ``stats``:
+    calculator sections keyed by name, with the level inside ``stats``. Empty
+    sections are valid, the calculators start from their defaults.
+    """
+    if not isinstance(stat_entry, dict):
+        return ["entry is not an object"]
+    problems = []
+    for section, section_type in STAT_ENTRY_SECTIONS.items():
+        if section not in stat_entry:
+            if section in REQUIRED_STAT_ENTRY_SECTIONS:
+                problems.append(f"missing section '{section}'")
+        elif stat_entry[section] and not isinstance(stat_entry[section], section_type):
+            problems.append(f"section '{section}' should be {'a list' if section_type is list else 'an object'}")
+
+    stats_data = stat_entry.get('stats')
+    if stats_data and isinstance(stats_data, dict):
+        if not isinstance(stats_data.get('level'), int):
+            problems.append("stats has no integer 'level'")
+        stats = stats_data.get('stats', {})
+        if not isinstance(stats, dict):
+            problems.append("stats.stats should be an object")
+        else:
+            for stat, values in stats.items():
+                if not isinstance(values, dict) or any(not isinstance(values.get(key), (int, float))
+                                                       for key in RAW_STAT_FIELDS):
+                    problems.append(f"stat '{stat}' needs numeric {', '.join(RAW_STAT_FIELDS)}")
+
+    experience = stat_entry.get('experience')
+    if experience and isinstance(experience, dict):
+        character = experience.get('character')
+        character = character.get('character') if isinstance(character, dict) else None
+        if not isinstance(character, dict) or not all(key in character for key in ['exp', 'level']):
+            problems.append("experience has no character exp and level")
+
+    traits = stat_entry.get('traits')
+    if traits and isinstance(traits, list):
+        for index, trait in enumerate(traits):
+            if not isinstance(trait, dict) or 'name' not in trait:
+                problems.append(f"trait {index} has no name")
+    return problems
+
+def create_diff(old_stats: Dict[str, Any], new_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create a diff between two stat entries.
+    """
+    diff = {}
+    for key, value in new_stats.items():
+        if key not in old_stats or old_stats[key] != value:
+            if isinstance(value, dict):
+                nested_diff = create_diff(old_stats.get(key, {}), value)
+                if nested_diff:
+                    diff[key] = nested_diff
+            else:
+                diff[key] = value
+    return diff
+
+def apply_diff(base_stats: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply a diff to a base stat entry.
+    """
+    result = base_stats.copy()
+    for key, value in diff.items():
+        if isinstance(value, dict):
+            result[key] = apply_diff(result.get(key, {}), value)
+        else:
+            result[key] = value
+    return result
+
+def create_patch(old_stats: Any, new_stats: Any) -> List[Dict[str, Any]]:
+    """
+    Create a list of path-addressed operations turning ``old_stats`` into ``new_stats``.
+
+    Path segments are dict keys, list indexes, or ``{key_field: value}`` selectors
+    for lists of records keyed by one of ``LIST_KEY_FIELDS`` (traits and
+    checkpoints by name, chapters by number). Operations are ``set``,
+    ``remove`` and ``insert`` (for new keyed records, with their final index).
+    Unlike ``create_diff`` it records removals and keyed list changes. Values
+    are deep copies, so the patch does not alias ``new_stats``.
+    """
+    operations = []
+    _diff_value(old_stats, new_stats, [], operations)
+    return operations
+
+def _diff_value(old: Any, new: Any, path: List, operations: List[Dict[str, Any]]) -> None:
+    # The C-level equality check prunes unchanged subtrees before recursing in Python
+    if old is new or (type(old) is type(new) and old == new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                operations.append({"op": "remove", "path": path + [key]})
+        for key, value in new.items():
+            if key not in old:
+                operations.append({"op": "set", "path": path + [key], "value": copy.deepcopy(value)})
+            else:
+                _diff_value(old[key], value, path + [key], operations)
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, operations)
+    else:
+        operations.append({"op": "set", "path": path, "value": copy.deepcopy(new)})
+
+def _diff_list(old: List, new: List, path: List, operations: List[Dict[str, Any]]) -> None:
+    key_field = _list_key_field(old, new)
+    if key_field is None:
+        if len(old) != len(new):
+            operations.append({"op": "set", "path": path, "value": copy.deepcopy(new)})
+            return
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            _diff_value(old_item, new_item, path + [index], operations)
+        return
+
+    old_items = {item[key_field]: item for item in old}
+    new_keys = {item[key_field] for item in new}
+    kept_in_old_order = [item[key_field] for item in old if item[key_field] in new_keys]
+    kept_in_new_order = [item[key_field] for item in new if item[key_field] in old_items]
+    if kept_in_old_order != kept_in_new_order:
+        # Reordered records are rare; replacing the list keeps the format simple
+        operations.append({"op": "set", "path": path, "value": copy.deepcopy(new)})
+        return
+
+    for key in old_items:
+        if key not in new_keys:
+            operations.append({"op": "remove", "path": path + [{key_field: key}]})
+    for index, item in enumerate(new):
+        key = item[key_field]
+        if key in old_items:
+            _diff_value(old_items[key], item, path + [{key_field: key}], operations)
+        else:
+            operations.append({"op": "insert", "path": path + [{key_field: key}], "index": index,
+                               "value": copy.deepcopy(item)})
+
+def _list_key_field(old: List, new: List) -> Union[str, None]:
+    items = old + new
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for key_field in LIST_KEY_FIELDS:
+        if all(key_field in item for item in items) and \
+                len({item[key_field] for item in old}) == len(old) and \
+                len({item[key_field] for item in new}) == len(new):
+            return key_field
+    return None
+
+def apply_patch(base_stats: Any, patch: List[Dict[str, Any]], in_place: bool = False) -> Any:
+    """
+    Apply operations from ``create_patch`` to a base stat entry.
+
+    Unless ``in_place`` is set, only the containers along each operation's path
+    are copied and everything else is shared with ``base_stats``. Set and
+    inserted values are deep-copied, so the result does not alias the patch.
+    """
+    root = base_stats
+    copied = {}
+
+    def writable(container):
+        if in_place or id(container) in copied:
+            return container
+        container = copy.copy(container)
+        copied[id(container)] = container
+        return container
+
+    for operation in patch:
+        path = operation["path"]
+        if not path:
+            root = copy.deepcopy(operation["value"])
+            continue
+        root = writable(root)
+        parent = root
+        for segment in path[:-1]:
+            index = _resolve_segment(parent, segment)
+            parent[index] = writable(parent[index])
+            parent = parent[index]
+
+        segment = path[-1]
+        if operation["op"] == "insert":
+            parent.insert(operation["index"], copy.deepcopy(operation["value"]))
+        elif operation["op"] == "remove":
+            del parent[_resolve_segment(parent, segment)]
+        elif operation["op"] == "set":
+            index = segment if isinstance(parent, dict) else _resolve_segment(parent, segment)
+            parent[index] = copy.deepcopy(operation["value"])
+        else:
+            raise ValueError(f"Unknown patch operation: {operation['op']}")
+    return root
+
+def _resolve_segment(container: Any, segment: Any) -> Any:
+    if isinstance(segment, dict):
+        (key_field, key), = segment.items()
+        for index, item in enumerate(container):
+            if item.get(key_field) == key:
+                return index
+        raise ValueError(f"No item with {key_field} {key!r} in list")
+    return segment
@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend.database.character_database import CharacterDatabase
+from backend.database.async_character_database import AsyncCharacterDatabase
+
+HEARTBEAT_INTERVAL = 0.005
+
+
+class SlowStorageDatabase(CharacterDatabase):
+    """Adds a fixed delay to every file access, standing in for a network share or a slow disk."""
+
+    def __init__(self, data_directory, latency):
+        super().__init__(data_directory)
+        self.latency = latency
+
+    def load_character(self, character_name):
+        time.sleep(self.latency)
+        return super().load_character(character_name)
+
+    def iter_checkpoints(self, character_name, chapter_range=None):
+        time.sleep(self.latency)
+        yield from super().iter_checkpoints(character_name, chapter_range)
+
+    def _save_character_data(self, character_name, data):
+        time.sleep(self.latency)
+        super()._save_character_data(character_name, data)
+
+
+class BlockingDatabase:
+    """The plain database called straight from coroutines, as a tool would without the facade."""
+
+    def __init__(self, character_database):
+        self.character_database = character_database
+
+    async def load_character(self, character_name):
+        return self.character_database.load_character(character_name)
+
+    async def add_checkpoint(self, character_name, chapter_number, checkpoint_name, stats):
+        self.character_database.add_checkpoint(character_name, chapter_number, checkpoint_name, stats)
+
+    async def iter_checkpoints(self, character_name, chapter_range=None):
+        for record in self.character_database.iter_checkpoints(character_name, chapter_range):
+            yield record
+
+
+def create_sample_data(data_directory, characters, checkpoints):
+    db = CharacterDatabase(data_directory)
+    stats = {"stats": {"stats": {f"Stat{i}": {"auto": i, "free": 0, "train": 0} for i in range(15)},
+                       "level": 10, "free_points": 0, "train_points": 0},
+             "experience": {}, "arts": {}, "traits": []}
+    for index in range(characters):
+        name = f"Character{index}"
+        db.create_character(name)
+        db.add_chapter(name, 1, "", "")
+        for checkpoint in range(checkpoints):
+            db.add_checkpoint(name, 1, f"cp{checkpoint}", stats)
+    return stats
+
+
+async def client(database, operations, write_ratio, stats, seed, writes):
+    rng = random.Random(seed)
+    characters = sorted(writes)
+    for index in range(operations):
+        character = rng.choice(characters)
+        if rng.random() < write_ratio:
+            await database.add_checkpoint(character, 1, f"client{seed}-{index}", stats)
+            writes[character] += 1
+        elif index % 4 == 3:
+            async for _ in database.iter_checkpoints(character):
+                pass
+        else:
+            await database.load_character(character)
+
+
+async def heartbeat(lags, stop):
+    # How late the loop wakes up is how long something blocked it
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(time.perf_counter() - start - HEARTBEAT_INTERVAL)
+
+
+async def run_scenario(database, clients, operations, write_ratio, stats, writes):
+    lags = []
+    stop = asyncio.Event()
+    monitor = asyncio.ensure_future(heartbeat(lags, stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(database, operations, write_ratio, stats, seed, writes) for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+    return elapsed, lags
+
+
+def lost_writes(data_directory, checkpoints, writes):
+    db = CharacterDatabase(data_directory)
+    return sum(checkpoints + count - len(db.get_character_data(character, 1)['checkpoints'])
+               for character, count in writes.items())
+
+
+def run(mode, clients, args):
+    with tempfile.TemporaryDirectory() as data_directory:
+        stats = create_sample_data(data_directory, args.characters, args.checkpoints)
+        writes = {f"Character{index}": 0 for index in range(args.characters)}
+        storage = SlowStorageDatabase(data_directory, args.storage_latency_ms / 1000)
+
+        async def scenario():
+            if mode == "blocking":
+                return await run_scenario(BlockingDatabase(storage), clients, args.operations, args.write_ratio,
+                                          stats, writes)
+            async with AsyncCharacterDatabase(storage, args.workers) as database:
+                return await run_scenario(database, clients, args.operations, args.write_ratio, stats, writes)
+
+        elapsed, lags = asyncio.run(scenario())
+        lost = lost_writes(data_directory, args.checkpoints, writes)
+    lags.sort()
+    operations = clients * args.operations
+    return {
+        'mode': mode,
+        'clients': clients,
+        'operations': operations,
+        'operations_per_second': round(operations / elapsed, 1),
+        'loop_lag_p99_ms': round(lags[min(len(lags) - 1, int(0.99 * len(lags)))] * 1000, 2) if lags else 0.0,
+        'loop_lag_max_ms': round(lags[-1] * 1000, 2) if lags else 0.0,
+        'lost_writes': lost,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput and event loop lag of the async character database "
+                                                 "with concurrent clients")
+    parser.add_argument("--characters", type=int, default=8, help="characters in the sample data")
+    parser.add_argument("--checkpoints", type=int, default=40, help="checkpoints per character")
+    parser.add_argument("--operations", type=int, default=40, help="operations per client")
+    parser.add_argument("--clients", default="1,4,16,32", help="comma-separated concurrent client counts")
+    parser.add_argument("--workers", type=int, default=8, help="executor threads")
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="share of operations that add a checkpoint")
+    parser.add_argument("--storage-latency-ms", type=float, default=0.0,
+                        help="delay added to every file access, to model slow or network storage")
+    parser.add_argument("--export", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'mode':<10}{'clients':>8}{'ops/s':>9}{'speedup':>9}{'lag p99 ms':>12}{'lag max ms':>12}{'lost':>6}")
+    for mode in ["blocking", "async"]:
+        first = None
+        for clients in [int(value) for value in args.clients.split(',')]:
+            row = run(mode, clients, args)
+            first = first or row
+            row['speedup'] = round(row['operations_per_second'] / first['operations_per_second'], 2)
+            rows.append(row)
+            print(f"{mode:<10}{clients:8d}{row['operations_per_second']:9.0f}{row['speedup']:9.2f}"
+                  f"{row['loop_lag_p99_ms']:12.2f}{row['loop_lag_max_ms']:12.2f}{row['lost_writes']:6d}")
+
+    if args.export:
+        with open(args.export, 'w') as f:
+            json.dump({'workers': args.workers, 'write_ratio': args.write_ratio,
+                       'storage_latency_ms': args.storage_latency_ms, 'scenarios': rows}, f, indent=2)
+    sys.exit(1 if any(row['lost_writes'] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
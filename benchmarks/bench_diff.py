@@ -0,0 +1,78 @@
+import copy
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.stat_entry_utils import create_diff, apply_diff, create_patch, apply_patch
+
+
+def build_character(chapters, checkpoints, traits, arts, seed=0):
+    rng = random.Random(seed)
+
+    def snapshot():
+        return {
+            "stats": {"stats": {f"Stat{i}": {"auto": rng.randint(1, 50), "free": rng.randint(0, 9), "train": 0,
+                                             "weight": rng.random(), "constraint": rng.random() * 100, "total": 1}
+                                for i in range(15)},
+                      "free_points": 0, "train_points": 0, "level": rng.randint(1, 100)},
+            "experience": {"mastery": {f"Art{i}": {"exp": rng.randint(0, 999), "level": 1} for i in range(arts)}},
+            "arts": {f"Art{i}": {"name": f"Art{i}", "type": "Martial", "quality": "Earth Grade",
+                                 "quality_level": 3, "notes": "x" * 40} for i in range(arts)},
+            "traits": [{"name": f"Trait{i}", "quality_grade": "Mortal Grade", "quality_level": 1,
+                        "exp": rng.randint(0, 999), "notes": "y" * 40} for i in range(traits)],
+        }
+
+    character = snapshot()
+    character["chapters"] = [{"number": c, "start_section": "", "end_section": "",
+                              "checkpoints": [dict(name=f"cp{k}", timestamp="", stats=snapshot())
+                                              for k in range(checkpoints)]}
+                             for c in range(chapters)]
+    return character
+
+
+def mutate(character):
+    changed = copy.deepcopy(character)
+    changed["traits"][len(changed["traits"]) // 2]["exp"] += 10
+    del changed["traits"][0]
+    changed["arts"].pop("Art0")
+    changed["chapters"][-1]["checkpoints"].append(copy.deepcopy(changed["chapters"][0]["checkpoints"][0]))
+    changed["chapters"][-1]["checkpoints"][-1]["name"] = "new"
+    changed["chapters"][1]["checkpoints"][0]["stats"]["stats"]["level"] += 1
+    return changed
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    old = build_character(chapters=40, checkpoints=25, traits=200, arts=50)
+    new = mutate(old)
+    repeat = 5
+
+    legacy_ms, legacy = timed(lambda: create_diff(old, new), repeat)
+    keyed_ms, keyed = timed(lambda: create_patch(old, new), repeat)
+    legacy_apply_ms, _ = timed(lambda: apply_diff(old, legacy), repeat)
+    keyed_apply_ms, patched = timed(lambda: apply_patch(old, keyed), repeat)
+    assert patched == new
+
+    print(f"character size:         {len(json.dumps(old)) / 1024:.0f} KiB")
+    print(f"create_diff:           {legacy_ms:8.2f} ms  {len(json.dumps(legacy)) / 1024:8.1f} KiB"
+          "  (cannot express the removed trait or art)")
+    print(f"create_patch:          {keyed_ms:8.2f} ms  {len(json.dumps(keyed)) / 1024:8.1f} KiB  {len(keyed)} ops")
+    print(f"apply_diff:            {legacy_apply_ms:8.2f} ms")
+    print(f"apply_patch (copy):    {keyed_apply_ms:8.2f} ms")
+    target = copy.deepcopy(old)
+    in_place_ms, _ = timed(lambda: apply_patch(target, keyed, in_place=True), 1)
+    print(f"apply_patch (in place):{in_place_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
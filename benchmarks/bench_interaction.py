@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def create_sample_data(data_directory):
+    from backend.database.character_database import CharacterDatabase
+    db = CharacterDatabase(data_directory)
+    db.create_character("Sample")
+    for chapter in range(1, 4):
+        db.add_chapter("Sample", chapter, "", "")
+        for checkpoint in range(10):
+            db.add_checkpoint("Sample", chapter, f"cp{checkpoint}", {"stats": {"level": chapter * 10 + checkpoint, "train_points": 1000}})
+
+
+def wait_until_settled(monitor, timeout=5.0):
+    from PyQt5.QtTest import QTest
+    deadline = time.perf_counter() + timeout
+    while monitor.busy and time.perf_counter() < deadline:
+        QTest.qWait(5)
+
+
+def click_item(list_widget, row):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtTest import QTest
+    item = list_widget.item(row)
+    QTest.mouseClick(list_widget.viewport(), Qt.LeftButton, pos=list_widget.visualItemRect(item).center())
+
+
+def run(actions):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtTest import QTest
+    from gui.main_window import MainWindow
+    from gui.latency_monitor import LatencyMonitor
+
+    window = MainWindow()
+    window.show()
+    QTest.qWait(50)
+    monitor = LatencyMonitor(window.debug_tools.action_monitor, settle_ms=100, parent=window)
+    monitor.install()
+    progression = window.progression_component
+
+    click_item(progression.character_list, 0)
+    wait_until_settled(monitor)
+    click_item(progression.chapter_list, 0)
+    wait_until_settled(monitor)
+    for index in range(actions):
+        click_item(progression.checkpoint_list, index % progression.checkpoint_list.count())
+        wait_until_settled(monitor)
+
+    QTest.mouseClick(progression.lock_checkbox, Qt.LeftButton)
+    wait_until_settled(monitor)
+    # Lock mode enables the tabs but also locks the panels, so unlock the panel before each input
+    for _ in range(actions):
+        window.stats_component.set_locked(False)
+        # Rows are rebuilt when the stats change, so look the button up every time
+        QTest.mouseClick(window.stats_component.stat_widgets["Vitality"]["train_plus"], Qt.LeftButton)
+        wait_until_settled(monitor)
+
+    window.arts_calculator.add_art("Fist", "Martial", "Mortal Grade", 1, "")
+    window.tab_widget.setCurrentIndex(1)
+    arts = window.tab_components["arts"]
+    QTest.qWait(50)
+    click_item(arts.art_list, 0)
+    wait_until_settled(monitor)
+    for index in range(actions):
+        arts.set_locked(False)
+        QTest.keyClick(arts.quality_level_spin, Qt.Key_Up if index % 2 == 0 else Qt.Key_Down)
+        wait_until_settled(monitor)
+
+    monitor.finish_action()
+    return window, monitor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure input-to-paint latency of the main panels")
+    parser.add_argument("--actions", type=int, default=20, help="actions per panel")
+    parser.add_argument("--export", help="also write the latency report to this JSON file")
+    args = parser.parse_args()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # The run happens in a scratch directory; resolve the export path against the caller's first
+    export_path = os.path.abspath(args.export) if args.export else None
+    from PyQt5.QtWidgets import QApplication
+    # Held for the whole run: the window is torn down if the QApplication is collected
+    app = QApplication(sys.argv)
+
+    original_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_directory:
+        create_sample_data(os.path.join(work_directory, "data"))
+        os.chdir(work_directory)
+        try:
+            window, monitor = run(args.actions)
+            summary = monitor.summary()
+        finally:
+            os.chdir(original_directory)
+
+    if export_path:
+        with open(export_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+    failed = False
+    print(f"{'action':<14}{'count':>6}{'p50 ms':>9}{'p90 ms':>9}{'max ms':>9}{'budget':>8}")
+    for action_type, entry in summary.items():
+        budget = entry.get('budget_ms')
+        status = "" if entry.get('within_budget', True) else "  OVER BUDGET"
+        failed = failed or bool(status)
+        print(f"{action_type:<14}{entry['count']:6d}{entry['p50_ms']:9.1f}{entry['p90_ms']:9.1f}{entry['max_ms']:9.1f}"
+              f"{'-' if budget is None else budget:>8}{status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
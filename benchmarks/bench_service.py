@@ -0,0 +1,150 @@
+import argparse
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def build_state(seed):
+    from backend.core.calculator_context import CalculatorContext
+    context = CalculatorContext()
+    context.experience_calculator.add_experience("character", 2000 + seed * 500)
+    for index, art_type in enumerate(["Martial", "Spiritual", "Psychic", "Arcane"]):
+        name = f"Art{index}"
+        context.arts_calculator.add_art(name, art_type, "Earth Grade", 1 + (seed + index) % 9, "")
+        context.experience_calculator.add_experience("mastery", 300 * (index + 1), name)
+    for index in range(3):
+        context.experience_calculator.add_experience("trait", 1000 * (seed + index + 1), f"Trait{index}")
+    return json.loads(json.dumps(context.snapshot()))
+
+
+def create_sample_data(data_directory, states):
+    from backend.database.character_database import CharacterDatabase
+    db = CharacterDatabase(data_directory)
+    db.create_character("Sample")
+    db.update_character("Sample", states[0])
+    db.add_chapter("Sample", 1, "", "")
+    for index, state in enumerate(states):
+        db.add_checkpoint("Sample", 1, f"cp{index}", state)
+
+
+def make_requests(states, count, by_name):
+    if by_name:
+        return [{'character': 'Sample', 'chapter': 1, 'checkpoint': f"cp{index % len(states)}"}
+                for index in range(count)]
+    return [{'state': states[index % len(states)]} for index in range(count)]
+
+
+def run_clients(port, clients, requests, batch_size):
+    """Send ``requests`` from ``clients`` keep-alive connections; returns latencies and elapsed seconds."""
+    bodies = [json.dumps(requests[start] if batch_size == 1 else {'batch': requests[start:start + batch_size]})
+              for start in range(0, len(requests), batch_size)]
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def client(client_bodies):
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        local_latencies = []
+        for body in client_bodies:
+            start = time.perf_counter()
+            try:
+                connection.request("POST", "/compute", body, {'Content-Type': 'application/json'})
+                response = connection.getresponse()
+                payload = json.loads(response.read())
+            except OSError as e:
+                errors.append(str(e))
+                connection.close()
+                continue
+            local_latencies.append(time.perf_counter() - start)
+            if response.status != 200 or 'error' in payload or any('error' in result
+                                                                     for result in payload.get('results', [])):
+                errors.append(payload)
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+
+    threads = [threading.Thread(target=client, args=(bodies[index::clients],)) for index in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start, errors
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput and latency of the calculation service under local load")
+    parser.add_argument("--requests", type=int, default=400, help="character computations per scenario")
+    parser.add_argument("--workers", type=int, default=2, help="calculator contexts in the service pool")
+    parser.add_argument("--clients", default="1,4,16", help="comma-separated concurrent client counts")
+    parser.add_argument("--batch-sizes", default="1,20", help="comma-separated batch sizes")
+    parser.add_argument("--export", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    from backend.core.calculation_service import ServiceContext
+    from server import create_server
+    states = [build_state(seed) for seed in range(20)]
+
+    # In-process baseline: the calculator work alone, without HTTP or the pool
+    context = ServiceContext()
+    start = time.perf_counter()
+    for index in range(args.requests):
+        context.compute(states[index % len(states)])
+    direct_rate = args.requests / (time.perf_counter() - start)
+    print(f"direct compute: {direct_rate:.0f} characters/s")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as data_directory:
+        create_sample_data(data_directory, states)
+        server = create_server(port=0, data_directory=data_directory, workers=args.workers)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+        try:
+            print(f"{'source':<8}{'clients':>8}{'batch':>7}{'chars/s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+                  f"{'errors':>8}")
+            for by_name in [False, True]:
+                requests = make_requests(states, args.requests, by_name)
+                for clients in [int(value) for value in args.clients.split(',')]:
+                    for batch_size in [int(value) for value in args.batch_sizes.split(',')]:
+                        latencies, elapsed, errors = run_clients(port, clients, requests, batch_size)
+                        row = {
+                            'source': 'name' if by_name else 'state',
+                            'clients': clients,
+                            'batch_size': batch_size,
+                            'characters_per_second': round(len(requests) / elapsed, 1),
+                            'p50_ms': round(percentile(latencies, 0.5) * 1000, 3),
+                            'p90_ms': round(percentile(latencies, 0.9) * 1000, 3),
+                            'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+                            'errors': len(errors),
+                        }
+                        rows.append(row)
+                        print(f"{row['source']:<8}{clients:8d}{batch_size:7d}{row['characters_per_second']:10.0f}"
+                              f"{row['p50_ms']:9.2f}{row['p90_ms']:9.2f}{row['p99_ms']:9.2f}{row['errors']:8d}")
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.service.close()
+
+    if args.export:
+        with open(args.export, 'w') as f:
+            json.dump({'direct_characters_per_second': round(direct_rate, 1), 'workers': args.workers,
+                       'scenarios': rows}, f, indent=2)
+    sys.exit(1 if any(row['errors'] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
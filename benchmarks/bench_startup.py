@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Cumulative milliseconds from process start; a median above these is a regression.
+# About 1.5x the medians measured offscreen (86/169/196/212 ms); re-baseline when startup changes on purpose
+THRESHOLDS_MS = {
+    'imports': 130,
+    'window_construction': 255,
+    'first_paint': 295,
+    'first_character_loaded': 320,
+}
+
+
+def create_sample_data(data_directory):
+    from backend.database.character_database import CharacterDatabase
+    db = CharacterDatabase(data_directory)
+    db.create_character("Sample")
+    for chapter in range(1, 6):
+        db.add_chapter("Sample", chapter, "", "")
+        for checkpoint in range(10):
+            db.add_checkpoint("Sample", chapter, f"cp{checkpoint}", {"stats": {"level": chapter * 10 + checkpoint}})
+
+
+def run_child():
+    start = time.perf_counter()
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    from gui.main_window import MainWindow
+    from gui.startup_timer import StartupTimer
+
+    def finish(report):
+        print(json.dumps(report))
+        QApplication.instance().quit()
+
+    timer = StartupTimer(start, finish)
+    timer.mark('imports')
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    timer.mark('window_construction')
+    timer.watch(window)
+    window.show()
+
+    def select_character():
+        if 'first_paint' not in timer.marks:
+            QTimer.singleShot(1, select_character)
+            return
+        progression = window.progression_component
+        progression.on_character_selected(progression.character_list.item(0))
+
+    QTimer.singleShot(0, select_character)
+    app.exec_()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start of the main window")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child()
+        return
+
+    with tempfile.TemporaryDirectory() as work_directory:
+        create_sample_data(os.path.join(work_directory, "data"))
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"),
+                   PYTHONPATH=ROOT)
+        reports = []
+        for _ in range(args.runs):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"], cwd=work_directory,
+                                    env=env, capture_output=True, text=True, check=True).stdout
+            reports.append(json.loads(output.strip().splitlines()[-1]))
+
+    failed = False
+    print(f"{'phase':<26}{'median ms':>10}{'limit ms':>10}")
+    for phase, limit in THRESHOLDS_MS.items():
+        median = statistics.median(report[phase] for report in reports)
+        status = "" if median <= limit else "  REGRESSION"
+        failed = failed or median > limit
+        print(f"{phase:<26}{median:10.1f}{limit:10d}{status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Hot paths whose calls count as recomputation
+RECOMPUTE_PATHS = ['StatsCalculator.calculate', 'CharacterGraph.refresh']
+# A slower median only counts as a regression when it is also this much slower
+WALL_TIME_FLOOR_MS = 5.0
+
+
+def settle(app, window):
+    """Process events until the action's deferred work is done; returns the time spent processing."""
+    busy = 0.0
+    while True:
+        start = time.perf_counter()
+        app.processEvents()
+        busy += time.perf_counter() - start
+        timers = [window.refresh_scheduler.timer, window.progression_component.scrub_timer]
+        if not any(timer.isActive() for timer in timers) and not window.history.record_pending:
+            return busy
+        time.sleep(0.001)
+
+
+def counter_deltas(before, after):
+    deltas = {}
+    for name, summary in after.items():
+        previous = before.get(name, {})
+        for key in ['count', 'bytes_read', 'bytes_written']:
+            change = summary[key] - previous.get(key, 0)
+            if change:
+                deltas.setdefault(name, {})[key] = change
+    return deltas
+
+
+def replay(session_path, data_directory):
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+    from gui.session_recorder import read_session
+
+    header, entries = read_session(session_path)
+    app = QApplication.instance() or QApplication(sys.argv)
+    # Dialogs would block a headless run; keep their messages with the action instead
+    messages = []
+    for name in ['warning', 'information', 'critical']:
+        setattr(QMessageBox, name, staticmethod(lambda parent, title, text, *args, **kwargs: messages.append(text)))
+
+    original_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_directory:
+        shutil.copytree(data_directory or header['data_directory'], os.path.join(work_directory, "data"))
+        os.chdir(work_directory)
+        try:
+            return replay_entries(app, entries, messages)
+        finally:
+            os.chdir(original_directory)
+
+
+def replay_entries(app, entries, messages):
+    from backend.core.instrumentation import instrumentation
+    from gui.session_recorder import replay_action
+
+    instrumentation.install()
+    from gui.main_window import MainWindow
+    window = MainWindow()
+    window.show()
+    settle(app, window)
+
+    results = []
+    for index, entry in enumerate(entries):
+        before = instrumentation.snapshot()
+        del messages[:]
+        start = time.perf_counter()
+        error = None
+        try:
+            replay_action(window, entry['action'], entry['params'])
+        except (ValueError, KeyError, IndexError, AttributeError, StopIteration) as e:
+            error = str(e) or type(e).__name__
+        busy = time.perf_counter() - start
+        busy += settle(app, window)
+        wall = time.perf_counter() - start
+        deltas = counter_deltas(before, instrumentation.snapshot())
+        results.append({
+            'index': index,
+            'action': entry['action'],
+            'params': entry['params'],
+            'wall_ms': round(wall * 1000, 3),
+            'busy_ms': round(busy * 1000, 3),
+            'recomputes': sum(deltas.get(name, {}).get('count', 0) for name in RECOMPUTE_PATHS),
+            'bytes_read': sum(delta.get('bytes_read', 0) for delta in deltas.values()),
+            'bytes_written': sum(delta.get('bytes_written', 0) for delta in deltas.values()),
+            'calls': {name: delta['count'] for name, delta in deltas.items() if 'count' in delta},
+            'messages': list(messages),
+            'error': error,
+        })
+    window.hide()
+    return results
+
+
+def summarize(results):
+    summary = {}
+    for result in results:
+        summary.setdefault(result['action'], []).append(result)
+    return {action: {
+        'count': len(entries),
+        'median_wall_ms': round(statistics.median(entry['wall_ms'] for entry in entries), 3),
+        'total_busy_ms': round(sum(entry['busy_ms'] for entry in entries), 3),
+        'recomputes': sum(entry['recomputes'] for entry in entries),
+        'bytes_read': sum(entry['bytes_read'] for entry in entries),
+        'bytes_written': sum(entry['bytes_written'] for entry in entries),
+        'errors': sum(1 for entry in entries if entry['error']),
+    } for action, entries in summary.items()}
+
+
+def regressions(summary, baseline, tolerance):
+    found = []
+    for action, entry in summary.items():
+        previous = baseline.get(action)
+        if previous is None:
+            continue
+        if entry['recomputes'] > previous['recomputes']:
+            found.append(f"{action}: {entry['recomputes']} recomputes, baseline {previous['recomputes']}")
+        limit = max(previous['median_wall_ms'] * tolerance, previous['median_wall_ms'] + WALL_TIME_FLOOR_MS)
+        if entry['median_wall_ms'] > limit:
+            found.append(f"{action}: median {entry['median_wall_ms']:.1f} ms, baseline "
+                         f"{previous['median_wall_ms']:.1f} ms")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded UI session headlessly and report its cost")
+    parser.add_argument("session", help="session file recorded with LITRPG_RECORD_SESSION")
+    parser.add_argument("--data", help="data directory to replay against (copied first); "
+                                       "defaults to the one the session was recorded with")
+    parser.add_argument("--report", help="write the per-action report to this JSON file")
+    parser.add_argument("--baseline", help="report from an earlier run; exit 1 on regressions against it")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed median wall time ratio to the baseline")
+    args = parser.parse_args()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    # The replay runs from a scratch directory; resolve every path against the caller's first
+    session_path = os.path.abspath(args.session)
+    data_directory = os.path.abspath(args.data) if args.data else None
+    report_path = os.path.abspath(args.report) if args.report else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    results = replay(session_path, data_directory)
+    summary = summarize(results)
+
+    print(f"{'#':>4} {'action':<34}{'wall ms':>9}{'busy ms':>9}{'recomp':>7}{'read KB':>9}{'write KB':>9}")
+    for result in results:
+        note = f"  {result['error']}" if result['error'] else ""
+        print(f"{result['index']:>4} {result['action']:<34}{result['wall_ms']:9.1f}{result['busy_ms']:9.1f}"
+              f"{result['recomputes']:7d}{result['bytes_read'] / 1024:9.1f}{result['bytes_written'] / 1024:9.1f}{note}")
+
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump({'session': session_path, 'summary': summary, 'actions': results}, f, indent=2)
+
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)['summary']
+        found = regressions(summary, baseline, args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}")
+        sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
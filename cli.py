@@ -0,0 +1,73 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from backend.core.consistency_check import check_character
+from backend.database.character_database import CharacterDatabase
+
+
+def run_checks(data_directory, characters, fix, jobs, progress):
+    results = []
+    if jobs == 1:
+        for character in characters:
+            results.append(check_character(data_directory, character, fix))
+            progress(len(results), len(characters), results[-1])
+        return results
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(check_character, data_directory, character, fix) for character in characters]
+        for future in as_completed(futures):
+            results.append(future.result())
+            progress(len(results), len(characters), results[-1])
+    return sorted(results, key=lambda result: characters.index(result['character']))
+
+
+def print_progress(done, total, result):
+    fixed = f", {result['fixed']} fixed" if result['fixed'] else ""
+    print(f"[{done}/{total}] {result['character']}: {result['states']} states, "
+          f"{len(result['problems'])} problems{fixed}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute and validate every character in a data directory")
+    parser.add_argument("data_directory", nargs="?", default="data", help="directory with the character files")
+    parser.add_argument("--character", action="append", help="only check this character (repeatable)")
+    parser.add_argument("--fix", action="store_true", help="rewrite stored derived values that do not match")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--report", help="also write the results to this JSON file")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data_directory):
+        parser.error(f"{args.data_directory} is not a directory")
+    characters = sorted(name[:-len('.json')] for name in CharacterDatabase(args.data_directory).get_character_list())
+    if args.character:
+        missing = [name for name in args.character if name not in characters]
+        if missing:
+            parser.error(f"Unknown character: {', '.join(missing)}")
+        characters = [name for name in characters if name in args.character]
+
+    progress = (lambda done, total, result: None) if args.quiet else print_progress
+    results = run_checks(args.data_directory, characters, args.fix, max(1, min(args.jobs, len(characters) or 1)),
+                         progress)
+
+    unresolved = 0
+    for result in results:
+        for problem in result['problems']:
+            state = f" [{problem['state']}]" if problem['state'] else ""
+            fixed = " (fixed)" if problem.get('fixed') else ""
+            print(f"{result['character']}{state} {problem['kind']}: {problem['message']}{fixed}")
+            unresolved += not problem.get('fixed')
+    print(f"{len(results)} characters, {sum(result['states'] for result in results)} states, "
+          f"{sum(len(result['problems']) for result in results)} problems, "
+          f"{sum(result['fixed'] for result in results)} values fixed")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(results, f, indent=2)
+    sys.exit(1 if unresolved else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from PyQt5.QtCore import QObject, QEvent, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QWidget, QAbstractButton
+from gui.components.base_component import BaseComponent
+
+INPUT_EVENTS = {QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.KeyPress}
+
+
+class ActionMonitor(QObject):
+    """
+    Application-wide event filter that marks the start of each user action.
+
+    Qt offers an input event to the target widget and then to each parent that
+    does not accept it, so ``action_started`` is emitted once per input event,
+    for the first widget that sees it, with a readable label and the name of
+    the component the widget belongs to.
+    """
+    action_started = pyqtSignal(object, str, str)  # widget, label, component
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.last_event = None
+        self.last_widget = None
+        self.installed = False
+
+    def install(self):
+        if not self.installed:
+            QApplication.instance().installEventFilter(self)
+            self.installed = True
+
+    def uninstall(self):
+        if self.installed:
+            QApplication.instance().removeEventFilter(self)
+            self.installed = False
+
+    def eventFilter(self, obj, event):
+        if event.type() in INPUT_EVENTS and isinstance(obj, QWidget):
+            key = (event.type(), event.timestamp())
+            if not self.is_propagation(obj, key):
+                self.last_event = key
+                self.last_widget = obj
+                component = owning_component(obj)
+                self.action_started.emit(obj, describe_widget(obj, component), component)
+        return False
+
+    def is_propagation(self, widget, key):
+        if key != self.last_event or self.last_widget is None or widget is self.last_widget:
+            return False
+        try:
+            return widget.isAncestorOf(self.last_widget)
+        except RuntimeError:
+            # The previous target has been deleted
+            return False
+
+
+def owning_component(widget):
+    parent = widget
+    while parent is not None:
+        if isinstance(parent, BaseComponent):
+            return type(parent).__name__
+        parent = parent.parentWidget()
+    return type(widget.window()).__name__
+
+
+def describe_widget(widget, component):
+    # Qt's internal children (qt_scrollarea_viewport, qt_spinbox_lineedit, ...) stand for their parent
+    while widget.objectName().startswith('qt_') and widget.parentWidget() is not None:
+        widget = widget.parentWidget()
+    label = widget.objectName()
+    if not label and isinstance(widget, QAbstractButton):
+        label = widget.text()
+    label = f"{type(widget).__name__} '{label}'" if label else type(widget).__name__
+    return f"{component} > {label}"
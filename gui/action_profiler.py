@@ -0,0 +1,124 @@
+import cProfile
+import os
+import re
+import tracemalloc
+from datetime import datetime
+from PyQt5.QtCore import QObject, QTimer
+
+# Allocations from the profilers themselves are left out of the reports
+ALLOCATION_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+]
+
+
+class ActionProfiler(QObject):
+    """
+    Runs each user action under cProfile and, optionally, tracemalloc.
+
+    An action starts at an input reported by the ``ActionMonitor`` and ends at
+    the next input or once ``settle_ms`` have passed, which lets deferred
+    work such as scheduled redraws land in the same profile. Every action
+    writes ``<n>-<action>.pstats`` into a per-session, timestamped
+    subdirectory of ``output_directory`` and, when allocations are tracked,
+    ``<n>-<action>.allocations.txt`` with the lines that allocated the most
+    memory and the peak traced memory during the action. Profiling can be
+    switched on and off at any time.
+    """
+
+    def __init__(self, action_monitor, output_directory, settle_ms=1000, top_allocations=25, parent=None):
+        super().__init__(parent)
+        self.action_monitor = action_monitor
+        self.output_directory = output_directory
+        # Created with the first report so every session keeps its own numbering
+        self.session_directory = None
+        self.top_allocations = top_allocations
+        self.enabled = False
+        self.track_allocations = False
+        self.started_tracemalloc = False
+        self.current = None
+        self.action_count = 0
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(settle_ms)
+        self.settle_timer.timeout.connect(self.finish_action)
+
+    def set_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self.action_monitor.action_started.connect(self.on_action_started)
+            self.action_monitor.install()
+        else:
+            self.action_monitor.action_started.disconnect(self.on_action_started)
+            self.finish_action()
+            self.stop_tracemalloc()
+
+    def set_track_allocations(self, track_allocations):
+        # Takes effect from the next action
+        self.track_allocations = track_allocations
+        if not track_allocations and self.current is None:
+            self.stop_tracemalloc()
+
+    def on_action_started(self, widget, label, component):
+        self.finish_action()
+        self.begin_action(label)
+
+    def begin_action(self, label):
+        self.action_count += 1
+        start_snapshot = None
+        if self.track_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracemalloc = True
+            start_snapshot = tracemalloc.take_snapshot().filter_traces(ALLOCATION_FILTERS)
+            tracemalloc.reset_peak()
+        elif self.started_tracemalloc:
+            self.stop_tracemalloc()
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler (an IDE or python -m cProfile) is already active
+            print(f"Error starting the action profiler: {str(e)}")
+            return
+        self.current = {'label': label, 'profile': profile, 'start_snapshot': start_snapshot,
+                        'index': self.action_count}
+        self.settle_timer.start()
+
+    def finish_action(self):
+        self.settle_timer.stop()
+        action, self.current = self.current, None
+        if action is None:
+            return None
+        action['profile'].disable()
+        if self.session_directory is None:
+            self.session_directory = os.path.join(self.output_directory,
+                                                  datetime.now().strftime("%Y%m%d-%H%M%S-%f"))
+        os.makedirs(self.session_directory, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9]+', '-', action['label']).strip('-')[:60] or "action"
+        base_path = os.path.join(self.session_directory, f"{action['index']:04d}-{slug}")
+        action['profile'].dump_stats(base_path + ".pstats")
+        if action['start_snapshot'] is not None and tracemalloc.is_tracing():
+            self.write_allocations(action, base_path + ".allocations.txt")
+        return base_path + ".pstats"
+
+    def write_allocations(self, action, path):
+        snapshot = tracemalloc.take_snapshot().filter_traces(ALLOCATION_FILTERS)
+        differences = snapshot.compare_to(action['start_snapshot'], 'lineno')
+        current, peak = tracemalloc.get_traced_memory()
+        with open(path, 'w') as f:
+            f.write(f"Action: {action['label']}\n")
+            f.write(f"Recorded: {datetime.now().isoformat()}\n")
+            f.write(f"Traced memory: {current / 1024:.1f} KiB, peak during the action {peak / 1024:.1f} KiB\n\n")
+            f.write(f"Top {self.top_allocations} allocation changes by line:\n")
+            for difference in differences[:self.top_allocations]:
+                f.write(f"{difference}\n")
+
+    def stop_tracemalloc(self):
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
@@ -9,18 +9,18 @@ from .component_utils import (ClickableLabel, create_progress_bar_style,
 from backend.core.core_utils import format_number
 
 class ArtsComponent(BaseComponent):
-    def __init__(self, arts_calculator, experience_calculator, stats_calculator, parent=None):
+    def __init__(self, arts_calculator, experience_calculator, stats_calculator, character_graph, parent=None):
         self.arts_calculator = arts_calculator
         self.experience_calculator = experience_calculator
         self.stats_calculator = stats_calculator
+        self.character_graph = character_graph
         self.selected_art = None
         self.is_locked = True
         self.show_exact_numbers = False
         super().__init__(parent)
 
-        self.arts_calculator.calculation_updated.connect(self.update_results_display)
-        self.stats_calculator.stats_updated.connect(self.recalculate)
-        self.experience_calculator.experience_updated.connect(self.update_mastery_display)
+        # Art results and mastery come from the character graph, which reports every stat, mastery or art change
+        self.character_graph.values_changed.connect(self.on_graph_changed)
         
     def init_ui(self):
         main_layout = QHBoxLayout(self)
@@ -227,7 +227,7 @@ class ArtsComponent(BaseComponent):
     def update_art_list(self):
         self.art_list.clear()
         for art_name, art in self.arts_calculator.arts.items():
-            results = self.arts_calculator.calculate(art_name)
+            results = self.character_graph.art_results(art_name)
             if results:
                 mastery_layer = results.get('mastery_layer', 'Unknown')
                 mastery_level_in_layer = results.get('mastery_level_in_layer', 'Unknown')
@@ -238,9 +238,17 @@ class ArtsComponent(BaseComponent):
     
     def recalculate(self):
         if self.selected_art:
-            results = self.arts_calculator.calculate(self.selected_art)
+            results = self.character_graph.art_results(self.selected_art)
             if results:
                 self.update_results_display(results)
+
+    def on_graph_changed(self, changed):
+        if not self.selected_art:
+            return
+        if f"art_results:{self.selected_art}" in changed:
+            self.recalculate()
+        if f"mastery_exp:{self.selected_art}" in changed:
+            self.update_mastery_display()
     
     def update_results_display(self, results):
         if not results:
@@ -268,10 +276,7 @@ class ArtsComponent(BaseComponent):
 
     def update_display(self):
         self.update_art_list()
-        if self.selected_art:
-            results = self.arts_calculator.calculate(self.selected_art)
-            if results:
-                self.update_results_display(results)
+        self.recalculate()
         self.update_mastery_display()
         self.update_ui_state()
 
@@ -283,7 +288,7 @@ class ArtsComponent(BaseComponent):
         if not self.selected_art:
             return
 
-        mastery_exp = self.experience_calculator.get_experience("mastery", self.selected_art)
+        mastery_exp = self.character_graph.mastery_exp(self.selected_art) or {"exp": 0, "level": 1}
         level = mastery_exp['level']
         current_exp = mastery_exp['exp']
         max_exp = self.experience_calculator.calculate_max_exp(level)
@@ -319,7 +324,6 @@ class ArtsComponent(BaseComponent):
                 input_widget.setStyleSheet("border: 2px solid red;")
             else:
                 input_widget.setStyleSheet("")
-            self.recalculate()
             self.update_mastery_display()
         except ValueError:
             print("Invalid input for experience. Please enter a valid number.")
@@ -346,7 +350,6 @@ class ArtsComponent(BaseComponent):
                 input_widget.setStyleSheet("border: 2px solid red;")
             else:
                 input_widget.setStyleSheet("")
-            self.recalculate()
             self.update_mastery_display()
         except ValueError:
             print("Invalid input for percentage. Please enter a valid number.")
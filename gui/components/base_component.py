@@ -3,6 +3,7 @@ from PyQt5.QtWidgets import QWidget
 class BaseComponent(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.refresh_scheduler = None
         self.init_ui()
 
     def init_ui(self):
@@ -11,3 +12,16 @@ class BaseComponent(QWidget):
     def update_display(self):
         pass
 
+    def set_locked(self, locked):
+        pass
+
+    def set_refresh_scheduler(self, scheduler):
+        self.refresh_scheduler = scheduler
+
+    def request_update(self):
+        # Without a scheduler the component renders immediately
+        if self.refresh_scheduler is None:
+            self.update_display()
+        else:
+            self.refresh_scheduler.mark_dirty(self)
+
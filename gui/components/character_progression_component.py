@@ -1,16 +1,18 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
                              QPushButton, QListWidget, QGroupBox, QFormLayout, 
-                             QMessageBox, QInputDialog, QListWidgetItem, QCheckBox)
-from PyQt5.QtCore import pyqtSignal, Qt
+                             QMessageBox, QInputDialog, QListWidgetItem, QCheckBox, QSlider)
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
 from PyQt5.QtGui import QColor
-import logging
 from .base_component import BaseComponent
+from backend.core.structured_log import get_logger
+from backend.database.checkpoint_cache import CheckpointCache
 
 class CharacterProgressionComponent(BaseComponent):
     character_selected = pyqtSignal(str)
     chapter_selected = pyqtSignal(int)
     checkpoint_selected = pyqtSignal(dict)
     lock_state_changed = pyqtSignal(bool)
+    character_removed = pyqtSignal(str)
 
     def __init__(self, character_database, stats_calculator, energy_calculator, 
                  arts_calculator, traits_calculator, experience_calculator, parent=None):
@@ -25,9 +27,13 @@ class CharacterProgressionComponent(BaseComponent):
         self.current_checkpoint = None
         self.is_locked = False
         self.lock_checkbox = None
+        self.checkpoint_cache = CheckpointCache(character_database)
+        self.checkpoint_names = []
+        self.pending_scrub_index = None
+        # Calculator versions last known to match each save target on disk
+        self.saved_versions = {}
         
-        logging.basicConfig(level=logging.DEBUG)
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         
         super().__init__(parent)
 
@@ -93,6 +99,19 @@ class CharacterProgressionComponent(BaseComponent):
         checkpoint_button_layout.addWidget(self.save_checkpoint_btn)
         checkpoint_layout.addLayout(checkpoint_button_layout)
 
+        # Timeline scrubber over the chapter's checkpoints
+        scrubber_layout = QHBoxLayout()
+        self.scrubber = QSlider(Qt.Horizontal)
+        self.scrubber.setRange(0, 0)
+        self.scrubber.valueChanged.connect(self.on_scrubber_moved)
+        self.scrubber_label = QLabel("")
+        scrubber_layout.addWidget(self.scrubber)
+        scrubber_layout.addWidget(self.scrubber_label)
+        checkpoint_layout.addLayout(scrubber_layout)
+        self.scrub_timer = QTimer(self)
+        self.scrub_timer.setSingleShot(True)
+        self.scrub_timer.timeout.connect(self.apply_scrub)
+
         layout.addWidget(checkpoint_group)
 
         # Rename "Lock Editing" to "Lock"
@@ -155,7 +174,7 @@ class CharacterProgressionComponent(BaseComponent):
             self.save_current_state(auto_save=True)
 
         self.current_character = item.text()
-        self.logger.debug(f"Character selected: {self.current_character}")
+        self.logger.debug("character_selected", character=self.current_character)
         self.current_chapter = None
         self.current_checkpoint = None
         self.character_selected.emit(self.current_character)
@@ -171,7 +190,9 @@ class CharacterProgressionComponent(BaseComponent):
             self.save_current_state(auto_save=True)
 
         self.current_chapter = int(item.text().split()[-1])
-        self.logger.debug(f"Chapter selected: {self.current_chapter}")
+        # The previous checkpoint belongs to the old chapter
+        self.current_checkpoint = None
+        self.logger.debug("chapter_selected", character=self.current_character, chapter=self.current_chapter)
         self.chapter_selected.emit(self.current_chapter)
         self.update_chapter_list()
         self.update_checkpoint_list()
@@ -204,19 +225,56 @@ class CharacterProgressionComponent(BaseComponent):
 
     def update_checkpoint_list(self):
         self.checkpoint_list.clear()
+        self.checkpoint_names = []
         if not self.current_character or self.current_chapter is None:
+            self.update_scrubber()
             return
 
         character_data = self.character_db.load_character(self.current_character)
         chapter = next((c for c in character_data.get("chapters", []) if c["number"] == self.current_chapter), None)
         if chapter:
             for checkpoint in chapter.get("checkpoints", []):
+                self.checkpoint_names.append(checkpoint["name"])
                 item = QListWidgetItem(checkpoint["name"])
                 if checkpoint["name"] == self.current_checkpoint:
                     item.setBackground(QColor(173, 216, 230))  # Light blue background for selected checkpoint
                 self.checkpoint_list.addItem(item)
         
-        self.logger.debug(f"Updated checkpoint list. Items: {[self.checkpoint_list.item(i).text() for i in range(self.checkpoint_list.count())]}")
+        self.logger.debug("checkpoint_list_updated", chapter=self.current_chapter,
+                          checkpoints=lambda: [self.checkpoint_list.item(i).text()
+                                               for i in range(self.checkpoint_list.count())])
+        self.update_scrubber()
+
+    def update_scrubber(self):
+        self.scrubber.blockSignals(True)
+        self.scrubber.setRange(0, max(len(self.checkpoint_names) - 1, 0))
+        if self.current_checkpoint in self.checkpoint_names:
+            self.scrubber.setValue(self.checkpoint_names.index(self.current_checkpoint))
+        self.scrubber.blockSignals(False)
+        self.scrubber.setEnabled(len(self.checkpoint_names) > 1 and not self.is_locked)
+        position = self.scrubber.value() + 1 if self.checkpoint_names else 0
+        self.scrubber_label.setText(f"{position}/{len(self.checkpoint_names)}")
+
+    def on_scrubber_moved(self, index):
+        # Coalesce slider bursts so only the latest position is loaded
+        self.pending_scrub_index = index
+        self.scrubber_label.setText(f"{index + 1}/{len(self.checkpoint_names)}")
+        self.scrub_timer.start(0)
+
+    def apply_scrub(self):
+        index = self.pending_scrub_index
+        self.pending_scrub_index = None
+        if self.is_locked or index is None or not 0 <= index < len(self.checkpoint_names):
+            return
+        checkpoint_name = self.checkpoint_names[index]
+        if checkpoint_name == self.current_checkpoint:
+            return
+        if self.current_checkpoint:
+            self.save_current_state(auto_save=True)
+        self.select_checkpoint(checkpoint_name)
+        for i in range(self.checkpoint_list.count()):
+            item = self.checkpoint_list.item(i)
+            item.setBackground(QColor(173, 216, 230) if item.text() == checkpoint_name else QColor(0, 0, 0, 0))
 
     def add_chapter(self):
         if not self.current_character:
@@ -226,7 +284,9 @@ class CharacterProgressionComponent(BaseComponent):
         chapter_number, ok = QInputDialog.getInt(self, "Add Chapter", "Chapter number:")
         if not ok:
             return
+        self.create_chapter(chapter_number)
 
+    def create_chapter(self, chapter_number):
         try:
             self.character_db.add_chapter(self.current_character, chapter_number, "", "")
             self.update_chapter_list()
@@ -236,39 +296,50 @@ class CharacterProgressionComponent(BaseComponent):
             QMessageBox.warning(self, "Error", str(e))
 
     def add_checkpoint(self):
-        self.logger.debug(f"Attempting to add checkpoint. Current character: {self.current_character}, Current chapter: {self.current_chapter}")
+        self.logger.debug("add_checkpoint_requested", character=self.current_character, chapter=self.current_chapter)
         if self.current_character is None or self.current_chapter is None:
             QMessageBox.warning(self, "Error", "Please select a character and chapter first.")
-            self.logger.warning("Attempted to add checkpoint without character or chapter selected")
+            self.logger.warning("add_checkpoint_without_selection")
             return
 
         checkpoint_name, ok = QInputDialog.getText(self, "Add Checkpoint", "Checkpoint name:")
         if not ok or not checkpoint_name.strip():
             return
+        self.create_checkpoint(checkpoint_name)
 
+    def create_checkpoint(self, checkpoint_name):
         stats = self.gather_current_stats()
 
         try:
             self.character_db.add_checkpoint(self.current_character, self.current_chapter, checkpoint_name, stats)
+            self.checkpoint_cache.invalidate(self.current_character, self.current_chapter, checkpoint_name)
             self.update_checkpoint_list()
             self.select_checkpoint(checkpoint_name)
-            self.logger.info(f"Checkpoint '{checkpoint_name}' added successfully for character '{self.current_character}' in chapter {self.current_chapter}")
+            self.logger.info("checkpoint_added", character=self.current_character, chapter=self.current_chapter,
+                             checkpoint=checkpoint_name)
             QMessageBox.information(self, "Success", f"Checkpoint '{checkpoint_name}' added successfully.")
         except ValueError as e:
             QMessageBox.warning(self, "Error", str(e))
-            self.logger.error(f"Error adding checkpoint: {str(e)}")
+            self.logger.error("checkpoint_add_failed", character=self.current_character, error=str(e))
 
     def select_checkpoint(self, checkpoint_name):
         self.current_checkpoint = checkpoint_name
-        self.logger.debug(f"Checkpoint selected: {self.current_checkpoint}")
+        self.logger.debug("checkpoint_selected", checkpoint=self.current_checkpoint)
         checkpoint_data = self.load_checkpoint_data(self.current_checkpoint)
         self.checkpoint_selected.emit(checkpoint_data)
+        if checkpoint_data:
+            self.mark_saved(self.current_checkpoint_source())
         self.update_ui_state()
 
         # Update the checkpoint list selection
         items = self.checkpoint_list.findItems(checkpoint_name, Qt.MatchExactly)
         if items:
             self.checkpoint_list.setCurrentItem(items[0])
+        if checkpoint_name in self.checkpoint_names:
+            index = self.checkpoint_names.index(checkpoint_name)
+            self.update_scrubber()
+            self.checkpoint_cache.prefetch_neighbours(self.current_character, self.current_chapter,
+                                                      self.checkpoint_names, index)
 
     def remove_character(self):
         if not self.current_character:
@@ -282,6 +353,9 @@ class CharacterProgressionComponent(BaseComponent):
         if reply == QMessageBox.Yes:
             try:
                 self.character_db.remove_character(self.current_character)
+                self.checkpoint_cache.invalidate(self.current_character)
+                self.character_removed.emit(self.current_character)
+                self.saved_versions.clear()
                 self.current_character = None
                 self.current_chapter = None
                 self.current_checkpoint = None
@@ -305,6 +379,8 @@ class CharacterProgressionComponent(BaseComponent):
         if reply == QMessageBox.Yes:
             try:
                 self.character_db.remove_chapter(self.current_character, self.current_chapter)
+                self.checkpoint_cache.invalidate(self.current_character, self.current_chapter)
+                self.saved_versions.clear()
                 self.current_chapter = None
                 self.current_checkpoint = None
                 self.update_chapter_list()
@@ -325,6 +401,8 @@ class CharacterProgressionComponent(BaseComponent):
         if reply == QMessageBox.Yes:
             try:
                 self.character_db.remove_checkpoint(self.current_character, self.current_chapter, self.current_checkpoint)
+                self.checkpoint_cache.invalidate(self.current_character, self.current_chapter, self.current_checkpoint)
+                self.saved_versions.clear()
                 self.current_checkpoint = None
                 self.update_checkpoint_list()
                 self.update_ui_state()
@@ -337,7 +415,9 @@ class CharacterProgressionComponent(BaseComponent):
         character_data = self.character_db.load_character(self.current_character)
         self.reset_all_calculators()
         self.update_all_calculators(character_data)
-        self.logger.debug(f"Loaded character data: {character_data}")
+        self.mark_saved((self.current_character, None, None))
+        self.logger.debug("character_loaded", character=self.current_character,
+                          sections=lambda: sorted(character_data))
         
         # Reset chapter and checkpoint selection
         self.current_chapter = None
@@ -358,7 +438,8 @@ class CharacterProgressionComponent(BaseComponent):
         self.arts_calculator.load_arts(data.get('arts', {}))
         self.traits_calculator.load_traits(data.get('traits', []))
         
-        self.logger.debug(f"Updated free points: {self.stats_calculator.free_points}, train points: {self.stats_calculator.train_points}")
+        self.logger.debug("calculators_updated", free_points=self.stats_calculator.free_points,
+                          train_points=self.stats_calculator.train_points)
 
     def reset_all_calculators(self):
         self.stats_calculator.reset()
@@ -367,51 +448,81 @@ class CharacterProgressionComponent(BaseComponent):
         self.arts_calculator.reset()
         self.traits_calculator.reset()
 
-    def gather_current_stats(self):
+    def section_calculators(self):
         return {
-            "stats": self.stats_calculator.get_stats(),
-            "energy": self.energy_calculator.get_energy_values(),
-            "experience": self.experience_calculator.get_all_experience(),
-            "arts": self.arts_calculator.get_arts(),
-            "traits": self.traits_calculator.get_traits(),
+            "stats": self.stats_calculator,
+            "energy": self.energy_calculator,
+            "experience": self.experience_calculator,
+            "arts": self.arts_calculator,
+            "traits": self.traits_calculator,
         }
 
+    def gather_current_stats(self, sections=None):
+        # Copy-on-write snapshots: consistent without deep-copying the character
+        return {section: calculator.snapshot() for section, calculator in self.section_calculators().items()
+                if sections is None or section in sections}
+
+    def current_checkpoint_source(self):
+        return (self.current_character, self.current_chapter, self.current_checkpoint)
+
+    def mark_saved(self, source):
+        self.saved_versions[source] = {section: calculator.version
+                                       for section, calculator in self.section_calculators().items()}
+
+    def changed_sections(self, source):
+        saved = self.saved_versions.get(source)
+        if saved is None:
+            return list(self.section_calculators())
+        return [section for section, calculator in self.section_calculators().items()
+                if calculator.version != saved[section]]
+
     def save_current_state(self, auto_save=False):
         if not self.current_character or self.current_chapter is None or not self.current_checkpoint:
             return
 
-        stats = self.gather_current_stats()
-
         try:
             if auto_save:
-                self.character_db.update_checkpoint(self.current_character, self.current_chapter, self.current_checkpoint, stats)
-                self.logger.info(f"Auto-saved checkpoint '{self.current_checkpoint}' for character '{self.current_character}' in chapter {self.current_chapter}")
+                source = self.current_checkpoint_source()
+                sections = self.changed_sections(source)
+                if not sections:
+                    self.logger.debug("auto_save_skipped", checkpoint=self.current_checkpoint)
+                    return
+                stats = self.gather_current_stats(sections)
+                self.character_db.update_checkpoint(self.current_character, self.current_chapter, self.current_checkpoint,
+                                                    stats, partial=True)
+                self.checkpoint_cache.invalidate(self.current_character, self.current_chapter,
+                                                 self.current_checkpoint)
+                self.mark_saved(source)
+                self.logger.info("checkpoint_auto_saved", character=self.current_character, chapter=self.current_chapter,
+                                 checkpoint=self.current_checkpoint, sections=sorted(sections))
             else:
                 checkpoint_name, ok = QInputDialog.getText(self, "Save Current State", "Checkpoint name:")
                 if ok and checkpoint_name.strip():
+                    stats = self.gather_current_stats()
                     self.character_db.add_checkpoint(self.current_character, self.current_chapter, checkpoint_name, stats)
+                    self.checkpoint_cache.invalidate(self.current_character, self.current_chapter, checkpoint_name)
                     self.current_checkpoint = checkpoint_name
+                    self.mark_saved(self.current_checkpoint_source())
                     self.update_checkpoint_list()
                     QMessageBox.information(self, "Success", f"Checkpoint '{checkpoint_name}' saved successfully.")
-                    self.logger.info(f"Checkpoint '{checkpoint_name}' saved successfully for character '{self.current_character}' in chapter {self.current_chapter}")
+                    self.logger.info("checkpoint_saved", character=self.current_character, chapter=self.current_chapter,
+                                     checkpoint=checkpoint_name)
             self.update_ui_state()
         except Exception as e:
             QMessageBox.warning(self, "Error", str(e))
-            self.logger.error(f"Error saving checkpoint: {str(e)}")
+            self.logger.error("checkpoint_save_failed", character=self.current_character, error=str(e))
 
     def load_checkpoint_data(self, checkpoint_name):
         if not self.current_character or self.current_chapter is None:
             return {}
 
         try:
-            checkpoint_data = self.character_db.get_character_data(
-                self.current_character, self.current_chapter, checkpoint_name
-            )
-            if checkpoint_data and 'stats' in checkpoint_data:
-                self.update_all_calculators(checkpoint_data['stats'])
-                return checkpoint_data['stats']
+            checkpoint_stats = self.checkpoint_cache.get(self.current_character, self.current_chapter, checkpoint_name)
+            if checkpoint_stats is not None:
+                self.update_all_calculators(checkpoint_stats)
+                return checkpoint_stats
             else:
-                self.logger.warning(f"Invalid checkpoint data for {checkpoint_name}")
+                self.logger.warning("invalid_checkpoint_data", checkpoint=checkpoint_name)
                 return {}
         except ValueError as e:
             QMessageBox.warning(self, "Error", str(e))
@@ -451,7 +562,7 @@ class CharacterProgressionComponent(BaseComponent):
         self.lock_state_changed.emit(self.is_locked and has_character and has_chapter and has_checkpoint)
 
     def handle_level_up(self, new_level, primary_stat):
-        self.logger.debug(f"Handling level up to {new_level}, primary stat: {primary_stat}")
+        self.logger.debug("level_up", level=new_level, primary_stat=primary_stat)
         self.stats_calculator.handle_level_up(new_level, primary_stat)
         self.energy_calculator.calculate()
         self.update_display()
@@ -459,13 +570,18 @@ class CharacterProgressionComponent(BaseComponent):
 
     def save_current_character_data(self):
         if self.current_character and not self.is_locked:
-            current_data = self.gather_current_stats()
+            source = (self.current_character, None, None)
+            sections = self.changed_sections(source)
+            if not sections:
+                return
+            current_data = self.gather_current_stats(sections)
             try:
                 self.character_db.update_character(self.current_character, current_data)
-                self.logger.info(f"Character '{self.current_character}' data saved successfully.")
+                self.mark_saved(source)
+                self.logger.info("character_saved", character=self.current_character, sections=sorted(sections))
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to save character data: {str(e)}")
-                self.logger.error(f"Error saving character data: {str(e)}")
+                self.logger.error("character_save_failed", character=self.current_character, error=str(e))
 
     def update_display(self):
         self.update_character_list()
@@ -0,0 +1,140 @@
+from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton,
+                             QTreeWidget, QTreeWidgetItem, QGroupBox, QCheckBox, QMessageBox)
+from .base_component import BaseComponent
+from backend.core.checkpoint_compare import COMPARE_SECTIONS, compare_checkpoints
+
+
+class CheckpointCompareComponent(BaseComponent):
+    def __init__(self, character_db, parent=None):
+        self.character_db = character_db
+        self.selectors = []
+        super().__init__(parent)
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        selectors_layout = QHBoxLayout()
+        for title in ["Checkpoint A", "Checkpoint B"]:
+            group = QGroupBox(title)
+            group_layout = QHBoxLayout(group)
+            selector = {
+                'character': QComboBox(),
+                'chapter': QComboBox(),
+                'checkpoint': QComboBox(),
+                'checkpoints': {}
+            }
+            for key in ['character', 'chapter', 'checkpoint']:
+                group_layout.addWidget(QLabel(f"{key.capitalize()}:"))
+                group_layout.addWidget(selector[key])
+            selector['character'].currentTextChanged.connect(lambda _, s=selector: self.on_character_changed(s))
+            selector['chapter'].currentTextChanged.connect(lambda _, s=selector: self.on_chapter_changed(s))
+            self.selectors.append(selector)
+            selectors_layout.addWidget(group)
+        layout.addLayout(selectors_layout)
+
+        button_layout = QHBoxLayout()
+        self.refresh_button = QPushButton("Refresh")
+        self.refresh_button.clicked.connect(self.refresh_characters)
+        self.show_unchanged_checkbox = QCheckBox("Show unchanged fields")
+        self.compare_button = QPushButton("Compare")
+        self.compare_button.clicked.connect(self.compare)
+        button_layout.addWidget(self.refresh_button)
+        button_layout.addWidget(self.show_unchanged_checkbox)
+        button_layout.addStretch(1)
+        button_layout.addWidget(self.compare_button)
+        layout.addLayout(button_layout)
+
+        self.result_tree = QTreeWidget()
+        self.result_tree.setHeaderLabels(["Field", "A", "B", "Delta"])
+        layout.addWidget(self.result_tree)
+
+        self.refresh_characters()
+
+    def refresh_characters(self):
+        names = [f.replace('.json', '') for f in self.character_db.get_character_list()]
+        for selector in self.selectors:
+            current = selector['character'].currentText()
+            selector['character'].blockSignals(True)
+            selector['character'].clear()
+            selector['character'].addItems(names)
+            if current in names:
+                selector['character'].setCurrentText(current)
+            selector['character'].blockSignals(False)
+            self.on_character_changed(selector)
+
+    def on_character_changed(self, selector):
+        character_name = selector['character'].currentText()
+        checkpoints = {}
+        if character_name:
+            # Names only; snapshots are fetched when comparing
+            checkpoints = self.character_db.checkpoint_names(character_name)
+        selector['checkpoints'] = checkpoints
+        selector['chapter'].blockSignals(True)
+        selector['chapter'].clear()
+        selector['chapter'].addItems([str(number) for number in checkpoints])
+        selector['chapter'].blockSignals(False)
+        self.on_chapter_changed(selector)
+
+    def on_chapter_changed(self, selector):
+        chapter = selector['chapter'].currentText()
+        selector['checkpoint'].clear()
+        if chapter:
+            selector['checkpoint'].addItems(selector['checkpoints'].get(int(chapter), []))
+
+    def selected_checkpoint(self, selector):
+        character_name = selector['character'].currentText()
+        chapter = selector['chapter'].currentText()
+        checkpoint_name = selector['checkpoint'].currentText()
+        if not (character_name and chapter and checkpoint_name):
+            return None
+        return character_name, int(chapter), checkpoint_name
+
+    def compare(self):
+        first, second = (self.selected_checkpoint(selector) for selector in self.selectors)
+        if first is None or second is None:
+            QMessageBox.warning(self, "Error", "Please select two checkpoints to compare.")
+            return
+        try:
+            report = compare_checkpoints(self.character_db, first, second,
+                                         self.show_unchanged_checkbox.isChecked())
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+        self.render_report(report)
+
+    def render_report(self, report):
+        # Build every item first and attach them in one pass
+        section_items = []
+        for section in COMPARE_SECTIONS:
+            rows = report.get(section, [])
+            section_item = QTreeWidgetItem([f"{section.replace('_', ' ').title()} ({len(rows)})"])
+            section_item.addChildren([
+                QTreeWidgetItem([row['field'], self.format_value(row['old']),
+                                 self.format_value(row['new']), self.format_delta(row['delta'])])
+                for row in rows
+            ])
+            section_items.append(section_item)
+
+        self.result_tree.setUpdatesEnabled(False)
+        self.result_tree.clear()
+        self.result_tree.addTopLevelItems(section_items)
+        for section_item in section_items:
+            section_item.setExpanded(section_item.childCount() > 0)
+        self.result_tree.setUpdatesEnabled(True)
+
+    def format_value(self, value):
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return str(value)
+
+    def format_delta(self, delta):
+        if delta is None:
+            return ""
+        if isinstance(delta, float):
+            return f"{delta:+.4f}"
+        return f"{delta:+d}"
+
+    def update_display(self):
+        self.refresh_characters()
@@ -13,6 +13,54 @@ class ClickableLabel(QLabel):
         if event.button() == Qt.LeftButton:
             self.clicked.emit()
 
+class RenderCache:
+    """
+    Remembers what was last rendered into each widget.
+
+    Setters only touch a widget when its value differs from the previous
+    render, so a refresh costs as much as the widgets that actually changed.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    def _changed(self, widget, key, value):
+        cache_key = (id(widget), key)
+        if cache_key in self.values and self.values[cache_key] == value:
+            return False
+        self.values[cache_key] = value
+        return True
+
+    def set_text(self, widget, text):
+        if self._changed(widget, 'text', text):
+            widget.setText(text)
+
+    def set_enabled(self, widget, enabled):
+        if self._changed(widget, 'enabled', enabled):
+            widget.setEnabled(enabled)
+
+    def set_property(self, widget, name, value):
+        # Dynamic properties drive stylesheet selectors; re-polish only this widget
+        if self._changed(widget, name, value):
+            widget.setProperty(name, value)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def clear(self):
+        self.values = {}
+
+def value_range(value, low, high):
+    if value < low:
+        return "low"
+    if value > high:
+        return "high"
+    return ""
+
+RANGE_STYLE = """
+    QLabel[range="low"] { color: maroon; }
+    QLabel[range="high"] { color: red; }
+"""
+
 def create_progress_bar_style():
     return """
         QProgressBar {
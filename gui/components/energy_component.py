@@ -1,10 +1,12 @@
 from PyQt5.QtWidgets import QVBoxLayout, QLabel, QHBoxLayout
 from .base_component import BaseComponent
+from .component_utils import RenderCache
 
 class EnergyComponent(BaseComponent):
     def __init__(self, calculator, parent=None):
         self.calculator = calculator
         self.is_locked = False
+        self.render_cache = RenderCache()
         super().__init__(parent)
 
     def init_ui(self):
@@ -21,13 +23,13 @@ class EnergyComponent(BaseComponent):
         
         layout.addLayout(energy_layout)
         
-        self.calculator.energy_updated.connect(self.update_display)
+        self.calculator.energy_updated.connect(self.request_update)
 
     def update_display(self):
         energy_values = self.calculator.get_energy_values()
-        self.lifeforce_label.setText(f"Lifeforce: {energy_values['Lifeforce']['initial']} + {energy_values['Lifeforce']['adjustment']} = {energy_values['Lifeforce']['final']}")
-        self.qi_label.setText(f"Qi: {energy_values['Qi']['initial']} + {energy_values['Qi']['adjustment']} = {energy_values['Qi']['final']}")
-        self.essence_label.setText(f"Essence: {energy_values['Essence']['initial']} + {energy_values['Essence']['adjustment']} = {energy_values['Essence']['final']}")
+        for name, label in [('Lifeforce', self.lifeforce_label), ('Qi', self.qi_label), ('Essence', self.essence_label)]:
+            pool = energy_values[name]
+            self.render_cache.set_text(label, f"{name}: {pool['initial']} + {pool['adjustment']} = {pool['final']}")
         self.update_ui_state()
 
     def set_locked(self, locked):
@@ -16,8 +16,9 @@ class ExperienceComponent(BaseComponent):
         self.is_locked = False
         super().__init__(parent)
 
-        self.calculator.experience_updated.connect(self.update_display)
-        self.calculator.level_up.connect(self.update_display)
+        self.calculator.experience_updated.connect(self.request_update)
+        self.calculator.level_up.connect(self.request_update)
+        self.calculator.experience_batch_updated.connect(self.request_update)
         self.calculator.max_level_reached.connect(self.handle_max_level)
 
     def init_ui(self):
@@ -1,16 +1,20 @@
-from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QFrame, QScrollArea, QWidget
+from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QFrame, QScrollArea, QWidget,
+                             QSpinBox, QMessageBox)
 from PyQt5.QtGui import QColor
 from .base_component import BaseComponent
+from .component_utils import RenderCache, RANGE_STYLE, value_range
 
 class StatsComponent(BaseComponent):
     def __init__(self, calculator, parent=None):
         self.calculator = calculator
         self.stat_widgets = {}
         self.is_locked = True
+        self.render_cache = RenderCache()
         super().__init__(parent)
     
     def init_ui(self):
         layout = QVBoxLayout(self)
+        self.setStyleSheet(RANGE_STYLE)
 
         # Free and Train pools
         pool_layout = QHBoxLayout()
@@ -18,6 +22,13 @@ class StatsComponent(BaseComponent):
         self.train_pool_label = QLabel("Train Points: 0")
         pool_layout.addWidget(self.free_pool_label)
         pool_layout.addWidget(self.train_pool_label)
+        pool_layout.addStretch(1)
+        self.clear_allocation_button = QPushButton("Clear")
+        self.clear_allocation_button.clicked.connect(self.clear_allocation)
+        self.allocate_button = QPushButton("Allocate")
+        self.allocate_button.clicked.connect(self.allocate)
+        pool_layout.addWidget(self.clear_allocation_button)
+        pool_layout.addWidget(self.allocate_button)
         layout.addLayout(pool_layout)
 
         # Stats
@@ -38,7 +49,7 @@ class StatsComponent(BaseComponent):
 
             for stat in self.calculator.primary_stats[primary]:
                 stat_layout = QGridLayout()
-                stat_layout.addWidget(QLabel(f"<b>{stat}</b>"), 0, 0, 1, 4)
+                stat_layout.addWidget(QLabel(f"<b>{stat}</b>"), 0, 0, 1, 5)
                 
                 self.stat_widgets[stat] = {}
                 for i, category in enumerate(['auto', 'free', 'train']):
@@ -53,8 +64,12 @@ class StatsComponent(BaseComponent):
                         plus_button = QPushButton("+")
                         plus_button.clicked.connect(lambda _, s=stat, c=category: self.update_stat(s, c, 1))
                         stat_layout.addWidget(plus_button, i+1, 3)
+                        allocation_input = QSpinBox()
+                        allocation_input.setRange(-9999, 9999)
+                        stat_layout.addWidget(allocation_input, i+1, 4)
                         self.stat_widgets[stat][f"{category}_minus"] = minus_button
                         self.stat_widgets[stat][f"{category}_plus"] = plus_button
+                        self.stat_widgets[stat][f"{category}_allocation"] = allocation_input
 
                 weight_label = QLabel(f"Weight: {self.calculator.stats[stat]['weight']:.2f}")
                 stat_layout.addWidget(weight_label, 4, 0, 1, 2)
@@ -85,46 +100,58 @@ class StatsComponent(BaseComponent):
 
     def update_stat(self, stat, category, change):
         if self.calculator.update(stat, category, change):
-            self.update_display()
+            self.request_update()
+
+    def allocation_plan(self):
+        plan = {}
+        for stat, widgets in self.stat_widgets.items():
+            for category in ['free', 'train']:
+                change = widgets[f"{category}_allocation"].value()
+                if change:
+                    plan.setdefault(stat, {})[category] = change
+        return plan
+
+    def allocate(self):
+        plan = self.allocation_plan()
+        if not plan:
+            return
+        try:
+            self.calculator.allocate(plan)
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+        self.clear_allocation()
+        self.request_update()
+
+    def clear_allocation(self):
+        for widgets in self.stat_widgets.values():
+            for category in ['free', 'train']:
+                widgets[f"{category}_allocation"].setValue(0)
 
     def update_display(self):
         stats_data = self.calculator.get_stats()
+        render = self.render_cache
         for stat, widgets in self.stat_widgets.items():
+            values = stats_data['stats'][stat]
             for category in ['auto', 'free', 'train']:
-                widgets[category].setText(str(stats_data['stats'][stat][category]))
+                render.set_text(widgets[category], str(values[category]))
             
-            weight_value = stats_data['stats'][stat]['weight']
-            widgets['weight'].setText(f"Weight: {weight_value:.2f}")
-            if weight_value < 0.10:
-                widgets['weight'].setStyleSheet("color: maroon;")
-            elif weight_value > 0.40:
-                widgets['weight'].setStyleSheet("color: red;")
-            else:
-                widgets['weight'].setStyleSheet("")
+            weight_value = values['weight']
+            render.set_text(widgets['weight'], f"Weight: {weight_value:.2f}")
+            render.set_property(widgets['weight'], "range", value_range(weight_value, 0.10, 0.40))
             
-            constraint_value = stats_data['stats'][stat]['constraint']
-            widgets['constraint'].setText(f"Constraint: {constraint_value:.2f}%")
-            if constraint_value < 10:
-                widgets['constraint'].setStyleSheet("color: maroon;")
-            elif constraint_value > 40:
-                widgets['constraint'].setStyleSheet("color: red;")
-            else:
-                widgets['constraint'].setStyleSheet("")
+            constraint_value = values['constraint']
+            render.set_text(widgets['constraint'], f"Constraint: {constraint_value:.2f}%")
+            render.set_property(widgets['constraint'], "range", value_range(constraint_value, 10, 40))
             
-            widgets['total'].setText(f"Total: {stats_data['stats'][stat]['total']}")
-
-            for category in ['free', 'train']:
-                minus_button = widgets[f"{category}_minus"]
-                plus_button = widgets[f"{category}_plus"]
-                minus_button.setEnabled(stats_data['stats'][stat][category] > 0)
-                plus_button.setEnabled(getattr(self.calculator, f"{category}_points") > 0)
+            render.set_text(widgets['total'], f"Total: {values['total']}")
 
-        self.free_pool_label.setText(f"Free Points: {stats_data['free_points']}")
-        self.train_pool_label.setText(f"Train Points: {stats_data['train_points']}")
+        render.set_text(self.free_pool_label, f"Free Points: {stats_data['free_points']}")
+        render.set_text(self.train_pool_label, f"Train Points: {stats_data['train_points']}")
 
-        self.body_label.setText(f"Body: {stats_data['primary_totals']['Body']:.2f}")
-        self.spirit_label.setText(f"Spirit: {stats_data['primary_totals']['Spirit']:.2f}")
-        self.mind_label.setText(f"Mind: {stats_data['primary_totals']['Mind']:.2f}")
+        render.set_text(self.body_label, f"Body: {stats_data['primary_totals']['Body']:.2f}")
+        render.set_text(self.spirit_label, f"Spirit: {stats_data['primary_totals']['Spirit']:.2f}")
+        render.set_text(self.mind_label, f"Mind: {stats_data['primary_totals']['Mind']:.2f}")
         self.update_ui_state()
 
     def handle_level_up(self, new_level, primary_stat):
@@ -136,8 +163,12 @@ class StatsComponent(BaseComponent):
         self.update_ui_state()
 
     def update_ui_state(self):
+        render = self.render_cache
         for stat, widgets in self.stat_widgets.items():
             for category in ['free', 'train']:
-                widgets[f"{category}_minus"].setEnabled(not self.is_locked)
-                widgets[f"{category}_plus"].setEnabled(not self.is_locked)
+                render.set_enabled(widgets[f"{category}_minus"], not self.is_locked)
+                render.set_enabled(widgets[f"{category}_plus"], not self.is_locked)
+                render.set_enabled(widgets[f"{category}_allocation"], not self.is_locked)
+        render.set_enabled(self.allocate_button, not self.is_locked)
+        render.set_enabled(self.clear_allocation_button, not self.is_locked)
 
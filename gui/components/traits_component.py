@@ -6,19 +6,20 @@ from .base_component import BaseComponent
 from .component_utils import (ClickableLabel, create_progress_bar_style, 
                               update_exp_display, create_exp_input_layout, 
                               setup_exp_display)
-from backend.core.core_utils import format_number
+from backend.core.core_utils import QUALITY_GRADES, calculate_trait_level, format_number
 
 class TraitsComponent(BaseComponent):
-    def __init__(self, traits_calculator, experience_calculator, parent=None):
+    def __init__(self, traits_calculator, experience_calculator, character_graph, parent=None):
         self.traits_calculator = traits_calculator
         self.experience_calculator = experience_calculator
+        self.character_graph = character_graph
         self.show_exact_numbers = False
-        self.quality_grades = ["Mortal Grade", "Elite Grade", "Earth Grade", "Royal Grade", "Imperial Grade",
-                               "Saint Grade", "Sky Grade", "Ascended Grade", "Transcended Grade", "Eternal Grade"]
+        self.quality_grades = QUALITY_GRADES
         self.is_locked = True
         super().__init__(parent)
 
-        self.experience_calculator.experience_updated.connect(self.update_trait_display)
+        # Trait levels are derived in the character graph from each trait's cumulative exp
+        self.character_graph.values_changed.connect(self.on_graph_changed)
 
 
     def init_ui(self):
@@ -142,7 +143,7 @@ class TraitsComponent(BaseComponent):
         index = self.trait_list.row(selected_items[0])
         trait = self.traits_calculator.get_traits()[index]
         self.traits_calculator.remove_trait(index)
-        self.experience_calculator.remove_experience("trait", trait.name)
+        self.experience_calculator.remove_experience("trait", trait['name'])
         self.update_trait_list()
         self.clear_input_fields()
         self.clear_trait_display()  # New method to clear the display
@@ -164,7 +165,8 @@ class TraitsComponent(BaseComponent):
         if not selected_items:
             return
         index = self.trait_list.row(selected_items[0])
-        trait = self.traits_calculator.get_traits()[index]
+        # Copy the current values; the trait may be updated in place
+        trait = dict(self.traits_calculator.get_traits()[index])
         name = self.name_input.text()
         quality = self.quality_combo.currentText()
         quality_level = self.quality_level_spin.value()
@@ -173,9 +175,9 @@ class TraitsComponent(BaseComponent):
         self.traits_calculator.update_trait(index, name=name, quality_grade=quality, quality_level=quality_level, notes=notes)
         
         # Update experience if quality or level changed
-        if quality != trait.quality_grade or quality_level != trait.quality_level:
+        if quality != trait['quality_grade'] or quality_level != trait['quality_level']:
             new_exp = self.calculate_initial_exp(quality, quality_level)
-            self.experience_calculator.set_experience("trait", new_exp, trait.name)
+            self.experience_calculator.set_experience("trait", new_exp, trait['name'])
         
         self.update_trait_list()
         self.update_trait_display()
@@ -186,10 +188,10 @@ class TraitsComponent(BaseComponent):
             return
         index = self.trait_list.row(selected_items[0])
         trait = self.traits_calculator.get_traits()[index]
-        self.name_input.setText(trait.name)
-        self.quality_combo.setCurrentText(trait.quality_grade)
-        self.quality_level_spin.setValue(trait.quality_level)
-        self.notes_input.setPlainText(trait.notes)
+        self.name_input.setText(trait['name'])
+        self.quality_combo.setCurrentText(trait['quality_grade'])
+        self.quality_level_spin.setValue(trait['quality_level'])
+        self.notes_input.setPlainText(trait['notes'])
         self.update_trait_display()
 
     def clear_input_fields(self):
@@ -201,16 +203,11 @@ class TraitsComponent(BaseComponent):
     def update_trait_list(self):
         self.trait_list.clear()
         for trait in self.traits_calculator.get_traits():
-            exp_data = self.experience_calculator.get_experience("trait", trait['name'])
-            total_exp = exp_data['exp']
-            current_grade, current_level, _, _ = self.calculate_trait_level(total_exp)
+            current_grade, current_level, _, _ = self.trait_level(trait['name'])
             display_text = f"{trait['name']} ({current_grade}, Level {current_level})"
             self.trait_list.addItem(display_text)
 
-    def update_trait_display(self, exp_type=None, identifier=None, *args):
-        if exp_type is not None and exp_type != "trait":
-            return
-
+    def update_trait_display(self):
         selected_items = self.trait_list.selectedItems()
         if not selected_items:
             self.clear_trait_display()
@@ -225,10 +222,7 @@ class TraitsComponent(BaseComponent):
 
         trait = traits[index]
 
-        exp_data = self.experience_calculator.get_experience("trait", trait['name'])
-        total_exp = exp_data['exp']
-        
-        current_grade, current_level, current_exp, max_exp = self.calculate_trait_level(total_exp)
+        current_grade, current_level, current_exp, max_exp = self.trait_level(trait['name'])
         
         self.trait_level_label.setText(f"Level: {current_level} ({current_grade})")
         
@@ -261,15 +255,13 @@ class TraitsComponent(BaseComponent):
         total_levels = grade_index * 10 + level
         return sum(self.experience_calculator.calculate_max_exp(i) for i in range(1, total_levels))
 
-    def calculate_trait_level(self, total_exp):
-        accumulated_exp = 0
-        for grade_index, grade in enumerate(self.quality_grades):
-            for level in range(1, 11):
-                max_exp = self.experience_calculator.calculate_max_exp(grade_index * 10 + level)
-                if accumulated_exp + max_exp > total_exp:
-                    return grade, level, total_exp - accumulated_exp, max_exp
-                accumulated_exp += max_exp
-        return self.quality_grades[-1], 10, 0, self.experience_calculator.calculate_max_exp(100)  # Max level
+    def trait_level(self, trait_name):
+        # Traits without experience yet sit at the start of the first grade
+        return self.character_graph.trait_level(trait_name) or calculate_trait_level(0)
+
+    def on_graph_changed(self, changed):
+        if any(name.startswith("trait_level:") for name in changed):
+            self.update_trait_display()
 
     def toggle_number_format(self):
         self.show_exact_numbers = not self.show_exact_numbers
@@ -291,20 +283,13 @@ class TraitsComponent(BaseComponent):
                 input_widget.setStyleSheet("border: 2px solid red;")
                 return
             
-            current_exp = self.experience_calculator.get_experience("trait", trait.name)['exp']
-            new_total_exp = current_exp + amount
-            
-            # Calculate new grade and level
-            new_grade, new_level, _, _ = self.calculate_trait_level(new_total_exp)
+            current_exp = self.experience_calculator.get_experience("trait", trait['name'])['exp']
+            self.experience_calculator.set_experience("trait", current_exp + amount, trait['name'])
             
-            # Update trait
-            trait.quality_grade = new_grade
-            trait.quality_level = new_level
+            # The character graph has derived the new grade and level from the exp
+            new_grade, new_level, _, _ = self.trait_level(trait['name'])
             self.traits_calculator.update_trait(index, quality_grade=new_grade, quality_level=new_level)
             
-            # Update experience
-            self.experience_calculator.set_experience("trait", new_total_exp, trait.name)
-            
             input_widget.clear()
             input_widget.setStyleSheet("")
             self.update_trait_display()
@@ -329,22 +314,15 @@ class TraitsComponent(BaseComponent):
                 input_widget.setStyleSheet("border: 2px solid red;")
                 return
             
-            current_exp = self.experience_calculator.get_experience("trait", trait.name)['exp']
-            current_grade, current_level, _, max_exp = self.calculate_trait_level(current_exp)
+            current_exp = self.experience_calculator.get_experience("trait", trait['name'])['exp']
+            _, _, _, max_exp = self.trait_level(trait['name'])
             amount = int(round(max_exp * percent / 100))
-            new_total_exp = current_exp + amount
-            
-            # Calculate new grade and level
-            new_grade, new_level, _, _ = self.calculate_trait_level(new_total_exp)
+            self.experience_calculator.set_experience("trait", current_exp + amount, trait['name'])
             
-            # Update trait
-            trait.quality_grade = new_grade
-            trait.quality_level = new_level
+            # The character graph has derived the new grade and level from the exp
+            new_grade, new_level, _, _ = self.trait_level(trait['name'])
             self.traits_calculator.update_trait(index, quality_grade=new_grade, quality_level=new_level)
             
-            # Update experience
-            self.experience_calculator.set_experience("trait", new_total_exp, trait.name)
-            
             input_widget.clear()
             input_widget.setStyleSheet("")
             self.update_trait_display()
@@ -0,0 +1,86 @@
+import os
+from datetime import datetime
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, QTreeWidget,
+                             QTreeWidgetItem, QMessageBox)
+
+COLUMNS = [('count', "Calls"), ('total_ms', "Total ms"), ('mean_ms', "Mean ms"), ('p50_ms', "p50 ms"),
+           ('p90_ms', "p90 ms"), ('p99_ms', "p99 ms"), ('max_ms', "Max ms"), ('bytes_read', "Bytes read"),
+           ('bytes_written', "Bytes written")]
+
+
+class InstrumentationPanel(QDialog):
+    def __init__(self, instrumentation, dump_directory, parent=None):
+        super().__init__(parent)
+        self.instrumentation = instrumentation
+        self.dump_directory = dump_directory
+        self.setWindowTitle("Hot Path Statistics")
+        self.resize(900, 400)
+
+        layout = QVBoxLayout(self)
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Hot path"] + [title for _, title in COLUMNS])
+        self.tree.setRootIsDecorated(False)
+        self.tree.setSortingEnabled(True)
+        layout.addWidget(self.tree)
+
+        button_layout = QHBoxLayout()
+        self.recording_checkbox = QCheckBox("Recording")
+        self.recording_checkbox.setChecked(instrumentation.enabled)
+        self.recording_checkbox.toggled.connect(self.set_recording)
+        button_layout.addWidget(self.recording_checkbox)
+        button_layout.addStretch(1)
+        for title, slot in [("Refresh", self.refresh), ("Reset", self.reset), ("Dump JSON", self.dump)]:
+            button = QPushButton(title)
+            button.clicked.connect(slot)
+            button_layout.addWidget(button)
+        layout.addLayout(button_layout)
+
+        # Live while open; the counters themselves never touch the UI
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        self.tree.setSortingEnabled(False)
+        self.tree.clear()
+        for name, summary in self.instrumentation.snapshot().items():
+            item = QTreeWidgetItem([name] + [str(summary[key]) for key, _ in COLUMNS])
+            for column, (key, _) in enumerate(COLUMNS, start=1):
+                # Sort numerically rather than by the displayed text
+                item.setData(column, 0, summary[key])
+            self.tree.addTopLevelItem(item)
+        self.tree.setSortingEnabled(True)
+        for column in range(self.tree.columnCount()):
+            self.tree.resizeColumnToContents(column)
+
+    def set_recording(self, enabled):
+        self.instrumentation.enabled = enabled
+
+    def reset(self):
+        self.instrumentation.reset()
+        self.refresh()
+
+    def dump(self):
+        path = dump_instrumentation(self.instrumentation, self.dump_directory)
+        QMessageBox.information(self, "Hot Path Statistics", f"Saved to {path}")
+
+
+def timestamped_path(directory, prefix, extension):
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{prefix}-{datetime.now().strftime('%Y%m%d-%H%M%S')}{extension}")
+
+
+def dump_instrumentation(instrumentation, directory):
+    path = timestamped_path(directory, "instrumentation", ".json")
+    instrumentation.dump(path)
+    return path
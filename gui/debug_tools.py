@@ -0,0 +1,191 @@
+import os
+from collections import namedtuple
+from PyQt5.QtWidgets import QAction, QMessageBox
+from gui.action_monitor import ActionMonitor
+from gui.signal_tracer import signal_tracer
+from gui.latency_monitor import LatencyMonitor
+from gui.action_profiler import ActionProfiler
+from gui.session_recorder import session_recorder
+from backend.core.instrumentation import instrumentation
+from backend.core.structured_log import find_ring_buffer
+
+# Setting ``env_var`` to anything installs the tool and enables its menu actions
+# (``hint`` says what it is for when it is off); a path ending in
+# ``export_suffix`` also receives ``export`` when the window closes.
+# Methods are named on DebugTools.
+DebugTool = namedtuple('DebugTool', ['env_var', 'hint', 'install', 'menu', 'export_suffix', 'export'])
+
+DEBUG_TOOLS = [
+    DebugTool('LITRPG_INSTRUMENT', "record hot paths", 'install_instrumentation',
+              [("Hot Path Statistics...", 'show_instrumentation_panel'),
+               ("Dump Hot Path Statistics", 'dump_instrumentation')],
+              '.json', 'export_instrumentation'),
+    DebugTool('LITRPG_TRACE_SIGNALS', "trace signal cascades", 'install_signal_tracer',
+              [("Save Signal Trace", 'save_signal_trace')],
+              '.folded', 'export_signal_trace'),
+    DebugTool('LITRPG_LATENCY', "measure interaction latency", 'install_latency_monitor',
+              [("Export Interaction Latency", 'export_latency')],
+              '.json', 'export_latency_report'),
+    # A .jsonl path starts recording right away instead of exporting on exit
+    DebugTool('LITRPG_RECORD_SESSION', "record sessions", 'install_session_recorder',
+              [], None, None),
+]
+
+
+class DebugTools:
+    """
+    The main window's opt-in diagnostics: installs the tools selected through
+    ``DEBUG_TOOLS`` environment variables, builds the Debug menu and writes the
+    exit exports. ``LITRPG_PROFILE=1`` starts profiling actions right away and
+    ``=memory`` also tracks allocations; profiles go to a per-session directory
+    under ``<data>/debug/profiles``.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.destinations = {tool.env_var: os.environ[tool.env_var] for tool in DEBUG_TOOLS
+                             if os.environ.get(tool.env_var)}
+        self.action_monitor = ActionMonitor(window)
+        self.latency_monitor = LatencyMonitor(self.action_monitor, parent=window)
+        self.instrumentation_panel = None
+        # Runs before the calculators are built: slots connected earlier would bypass the patches
+        for tool in DEBUG_TOOLS:
+            if tool.env_var in self.destinations:
+                getattr(self, tool.install)()
+
+    def debug_directory(self):
+        return os.path.join(self.window.character_database.data_directory, "debug")
+
+    def install_instrumentation(self):
+        instrumentation.install()
+
+    def install_signal_tracer(self):
+        signal_tracer.install()
+        self.action_monitor.action_started.connect(
+            lambda widget, label, component: signal_tracer.start_action(label, component))
+        self.action_monitor.install()
+
+    def install_latency_monitor(self):
+        self.latency_monitor.install()
+
+    def install_session_recorder(self):
+        session_recorder.install()
+
+    def init_menu(self):
+        window = self.window
+        self.debug_menu = window.menuBar().addMenu("Debug")
+        for tool in DEBUG_TOOLS:
+            if not tool.menu:
+                continue
+            for label, handler in tool.menu:
+                action = QAction(label, window)
+                action.triggered.connect(getattr(self, handler))
+                self.debug_menu.addAction(action)
+                if tool.env_var not in self.destinations:
+                    action.setEnabled(False)
+                    action.setToolTip(self.start_hint(tool))
+            self.debug_menu.addSeparator()
+        self.debug_menu.setToolTipsVisible(True)
+
+        self.action_profiler = ActionProfiler(self.action_monitor, os.path.join(self.debug_directory(), "profiles"),
+                                              parent=window)
+        self.profile_action = QAction("Profile Actions", window, checkable=True)
+        self.profile_action.toggled.connect(self.action_profiler.set_enabled)
+        self.debug_menu.addAction(self.profile_action)
+        self.track_allocations_action = QAction("Track Allocations", window, checkable=True)
+        self.track_allocations_action.toggled.connect(self.action_profiler.set_track_allocations)
+        self.debug_menu.addAction(self.track_allocations_action)
+        profile_mode = os.environ.get("LITRPG_PROFILE")
+        if profile_mode:
+            self.track_allocations_action.setChecked(profile_mode == "memory")
+            self.profile_action.setChecked(True)
+
+        self.debug_menu.addSeparator()
+        self.record_session_action = QAction("Record Session", window, checkable=True)
+        self.record_session_action.toggled.connect(self.set_session_recording)
+        self.debug_menu.addAction(self.record_session_action)
+        session_destination = self.destinations.get('LITRPG_RECORD_SESSION')
+        if session_destination:
+            session_recorder.attach(window)
+            if session_destination.endswith('.jsonl'):
+                session_recorder.start(session_destination, window.character_database.data_directory)
+                self.record_session_action.setChecked(True)
+        else:
+            self.record_session_action.setEnabled(False)
+            self.record_session_action.setToolTip(
+                self.start_hint(next(tool for tool in DEBUG_TOOLS if tool.env_var == 'LITRPG_RECORD_SESSION')))
+
+        self.debug_menu.addSeparator()
+        self.dump_log_action = QAction("Dump Recent Log", window)
+        self.dump_log_action.triggered.connect(self.dump_recent_log)
+        self.debug_menu.addAction(self.dump_log_action)
+        if find_ring_buffer() is None:
+            self.dump_log_action.setEnabled(False)
+            self.dump_log_action.setToolTip("Logging is not routed into a buffer; start the app with app.py")
+
+    @staticmethod
+    def start_hint(tool):
+        return f"Start with {tool.env_var}=1 to {tool.hint}"
+
+    def shutdown(self):
+        for tool in DEBUG_TOOLS:
+            destination = self.destinations.get(tool.env_var)
+            if tool.export and destination and destination.endswith(tool.export_suffix):
+                getattr(self, tool.export)(destination)
+        self.action_profiler.set_enabled(False)
+
+    def export_instrumentation(self, path):
+        instrumentation.dump(path)
+
+    def export_signal_trace(self, path):
+        signal_tracer.save(path)
+
+    def export_latency_report(self, path):
+        self.latency_monitor.export(path)
+
+    def show_instrumentation_panel(self):
+        from gui.debug_panel import InstrumentationPanel
+        if self.instrumentation_panel is None:
+            self.instrumentation_panel = InstrumentationPanel(instrumentation, self.debug_directory(), self.window)
+        self.instrumentation_panel.show()
+        self.instrumentation_panel.raise_()
+
+    def dump_instrumentation(self):
+        from gui.debug_panel import dump_instrumentation
+        path = dump_instrumentation(instrumentation, self.debug_directory())
+        QMessageBox.information(self.window, "Hot Path Statistics", f"Saved to {path}")
+
+    def save_signal_trace(self):
+        from gui.debug_panel import timestamped_path
+        path = timestamped_path(self.debug_directory(), "signal-trace", ".folded")
+        report_path, report = signal_tracer.save(path)
+        duplicated = sum(1 for action in report if action['duplicates'])
+        QMessageBox.information(self.window, "Signal Trace",
+                                f"{len(report)} actions traced, {duplicated} with duplicate slot calls.\n"
+                                f"Flame graph stacks: {path}\nReport: {report_path}")
+
+    def export_latency(self):
+        from gui.debug_panel import timestamped_path
+        path = timestamped_path(self.debug_directory(), "latency", ".json")
+        report = self.latency_monitor.export(path)
+        lines = []
+        for action_type, summary in report['actions'].items():
+            budget = f" (budget {summary['budget_ms']} ms)" if 'budget_ms' in summary else ""
+            status = " OVER BUDGET" if not summary.get('within_budget', True) else ""
+            lines.append(f"{action_type}: p90 {summary['p90_ms']} ms over {summary['count']} actions{budget}{status}")
+        lines.append(f"Saved to {path}")
+        QMessageBox.information(self.window, "Interaction Latency", "\n".join(lines))
+
+    def set_session_recording(self, recording):
+        if not recording:
+            session_recorder.stop()
+        elif not session_recorder.recording:
+            from gui.debug_panel import timestamped_path
+            session_recorder.start(timestamped_path(self.debug_directory(), "session", ".jsonl"),
+                                   self.window.character_database.data_directory)
+
+    def dump_recent_log(self):
+        ring_buffer = find_ring_buffer()
+        path = ring_buffer.dump_to_directory(self.debug_directory())
+        if path:
+            QMessageBox.information(self.window, "Recent Log", f"{len(ring_buffer.records)} events saved to {path}")
@@ -0,0 +1,161 @@
+import json
+import time
+from collections import deque
+from PyQt5.QtCore import QObject, QEvent, QTimer
+from PyQt5.QtWidgets import QApplication
+
+# Component an input lands in -> action type
+ACTION_TYPES = {
+    'StatsComponent': 'stats',
+    'ArtsComponent': 'arts',
+    'CharacterProgressionComponent': 'progression',
+    'ExperienceComponent': 'experience',
+    'EnergyComponent': 'energy',
+    'TraitsComponent': 'traits',
+    'CheckpointCompareComponent': 'compare',
+}
+
+# p90 input-to-paint latency each panel has to stay within
+LATENCY_BUDGETS_MS = {
+    'stats': 50,
+    'arts': 100,
+    'progression': 250,
+}
+
+HISTOGRAM_BUCKETS_MS = [8, 16, 33, 50, 100, 250, 500, 1000]
+
+
+class LatencyHistogram:
+    def __init__(self, max_samples=2048):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.samples = deque(maxlen=max_samples)
+        self.over_budget = 0
+
+    def add(self, latency_ms, budget_ms=None):
+        for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if latency_ms <= bound:
+                break
+        else:
+            index = len(HISTOGRAM_BUCKETS_MS)
+        self.counts[index] += 1
+        self.samples.append(latency_ms)
+        if budget_ms is not None and latency_ms > budget_ms:
+            self.over_budget += 1
+
+    def percentile(self, fraction):
+        samples = sorted(self.samples)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def summary(self, budget_ms=None):
+        labels = [f"<={bound}" for bound in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}"]
+        summary = {
+            'count': sum(self.counts),
+            'p50_ms': round(self.percentile(0.50), 1),
+            'p90_ms': round(self.percentile(0.90), 1),
+            'p99_ms': round(self.percentile(0.99), 1),
+            'max_ms': round(max(self.samples), 1) if self.samples else 0.0,
+            'histogram': dict(zip(labels, self.counts)),
+        }
+        if budget_ms is not None:
+            summary['budget_ms'] = budget_ms
+            summary['over_budget'] = self.over_budget
+            summary['within_budget'] = summary['p90_ms'] <= budget_ms
+        return summary
+
+
+class LatencyMonitor(QObject):
+    """
+    Time from a user input to the last repaint it causes, per action type.
+
+    An action starts at each input reported by the ``ActionMonitor`` and ends
+    when its window has not repainted for ``settle_ms`` or the next input
+    arrives. The latency runs up to the end of the last paint in that window,
+    so deferred work such as the refresh scheduler's frame is included.
+    Actions that never repaint are not counted.
+    """
+
+    def __init__(self, action_monitor, budgets=None, settle_ms=250, parent=None):
+        super().__init__(parent)
+        self.action_monitor = action_monitor
+        self.budgets = dict(LATENCY_BUDGETS_MS if budgets is None else budgets)
+        self.histograms = {}
+        self.pending = None
+        self.paint_stamp_scheduled = False
+        self.installed = False
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(settle_ms)
+        self.settle_timer.timeout.connect(self.finish_action)
+
+    def install(self):
+        if self.installed:
+            return
+        self.action_monitor.action_started.connect(self.on_action_started)
+        self.action_monitor.install()
+        QApplication.instance().installEventFilter(self)
+        self.installed = True
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        self.finish_action()
+        self.action_monitor.action_started.disconnect(self.on_action_started)
+        QApplication.instance().removeEventFilter(self)
+        self.installed = False
+
+    def on_action_started(self, widget, label, component):
+        self.finish_action()
+        self.pending = {
+            'type': ACTION_TYPES.get(component, 'other'),
+            'window': widget.window(),
+            'start': time.perf_counter(),
+            'last_paint': None,
+        }
+        self.settle_timer.start()
+
+    def eventFilter(self, obj, event):
+        if (self.pending is not None and event.type() == QEvent.Paint and not self.paint_stamp_scheduled
+                and obj.isWidgetType() and obj.window() is self.pending['window']):
+            # Paints of one frame are delivered together; stamp once they are all done
+            self.paint_stamp_scheduled = True
+            QTimer.singleShot(0, self.stamp_paint)
+        return False
+
+    def stamp_paint(self):
+        self.paint_stamp_scheduled = False
+        if self.pending is not None:
+            self.pending['last_paint'] = time.perf_counter()
+            self.settle_timer.start()
+
+    def finish_action(self):
+        self.settle_timer.stop()
+        action, self.pending = self.pending, None
+        if action is None or action['last_paint'] is None:
+            return
+        action_type = action['type']
+        latency_ms = (action['last_paint'] - action['start']) * 1000
+        self.histograms.setdefault(action_type, LatencyHistogram()).add(latency_ms, self.budgets.get(action_type))
+
+    @property
+    def busy(self):
+        return self.pending is not None
+
+    def summary(self):
+        return {action_type: histogram.summary(self.budgets.get(action_type))
+                for action_type, histogram in sorted(self.histograms.items())}
+
+    def violations(self):
+        return {action_type: summary for action_type, summary in self.summary().items()
+                if not summary.get('within_budget', True)}
+
+    def reset(self):
+        self.finish_action()
+        self.histograms = {}
+
+    def export(self, path):
+        report = {'buckets_ms': HISTOGRAM_BUCKETS_MS, 'actions': self.summary()}
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
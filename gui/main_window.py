@@ -1,12 +1,19 @@
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QGroupBox, QMessageBox
+import os
+from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QGroupBox, QMessageBox, QAction, QInputDialog
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QKeySequence
 from backend.core.calculator_factory import CalculatorFactory
 from gui.ui_factory import UIFactory
+from gui.refresh_scheduler import RefreshScheduler
+from gui.debug_tools import DebugTools
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("DeepStats - LitRPG Character Manager")
         self.setGeometry(100, 100, 1200, 800)
+        self.refresh_scheduler = RefreshScheduler(parent=self)
+        self.debug_tools = DebugTools(self)
         self.init_calculators()
         self.init_ui()
 
@@ -16,7 +23,23 @@ class MainWindow(QMainWindow):
         self.experience_calculator = CalculatorFactory.get_calculator("experience", self.stats_calculator)
         self.arts_calculator = CalculatorFactory.get_calculator("arts", self.stats_calculator, self.experience_calculator)
         self.traits_calculator = CalculatorFactory.get_calculator("traits", self.experience_calculator)
-        self.character_database = CalculatorFactory.get_calculator("character_database", "data")
+        self.character_graph = CalculatorFactory.get_calculator("character_graph", self.stats_calculator,
+                                                                self.experience_calculator, self.arts_calculator)
+        self.energy_calculator.connect_graph(self.character_graph)
+        # LITRPG_STORAGE_MODE=raw saves only calculator inputs; derived values are recomputed on load
+        storage_mode = os.environ.get("LITRPG_STORAGE_MODE", "full")
+        try:
+            self.character_database = CalculatorFactory.get_calculator("character_database", "data", storage_mode)
+        except ValueError as e:
+            print(f"Error selecting storage mode: {str(e)}; using full storage")
+            self.character_database = CalculatorFactory.get_calculator("character_database", "data")
+        self.history = CalculatorFactory.get_calculator("history", self.stats_calculator, self.experience_calculator,
+                                                        self.arts_calculator, self.traits_calculator)
+        self.event_store = CalculatorFactory.get_calculator("event_store", self.character_database.data_directory)
+        self.event_recorder = CalculatorFactory.get_calculator("event_recorder", self.stats_calculator,
+                                                               self.experience_calculator, self.arts_calculator,
+                                                               self.traits_calculator, self.event_store)
+        self.event_recorder.attach()
 
     def init_ui(self):
         central_widget = QWidget()
@@ -57,16 +80,42 @@ class MainWindow(QMainWindow):
         
         self.tab_widget.addTab(profile_widget, "Profile")
 
-        # Other tabs
-        self.tab_widget.addTab(UIFactory.create_component("arts", self.arts_calculator, self.experience_calculator, self.stats_calculator), "Arts")
-        self.tab_widget.addTab(UIFactory.create_component("traits", self.traits_calculator, self.experience_calculator), "Traits")
+        # Other tabs are built the first time they are shown
+        self.tab_components = {}
+        self.lazy_tabs = {}
+        self.components_locked = False
+        self.add_lazy_tab("arts", "Arts", lambda: UIFactory.create_component(
+            "arts", self.arts_calculator, self.experience_calculator, self.stats_calculator, self.character_graph))
+        self.add_lazy_tab("traits", "Traits", lambda: UIFactory.create_component(
+            "traits", self.traits_calculator, self.experience_calculator, self.character_graph))
+        self.add_lazy_tab("compare", "Compare", lambda: UIFactory.create_component(
+            "checkpoint_compare", self.character_database))
+        self.tab_widget.currentChanged.connect(self.build_tab)
+
+        for component in [self.progression_component, self.experience_component, self.stats_component,
+                          self.energy_component]:
+            component.set_refresh_scheduler(self.refresh_scheduler)
+        # Tabs that were hidden during an update render as soon as they are shown; currentChanged
+        # arrives before the new page is visible, so flush on the next pass of the event loop
+        self.tab_widget.currentChanged.connect(lambda: QTimer.singleShot(0, self.refresh_scheduler.flush))
 
         # Connect signals
         self.progression_component.character_selected.connect(self.load_character_data)
         self.progression_component.checkpoint_selected.connect(self.load_checkpoint_data)
+        self.progression_component.character_removed.connect(self.remove_character_events)
         self.experience_calculator.character_level_up.connect(self.handle_level_up)
+        self.experience_calculator.character_levels_gained.connect(self.stats_calculator.handle_level_ups)
         self.stats_calculator.stats_updated.connect(self.update_components)
 
+        # Record undo history once each burst of calculator updates settles
+        self.stats_calculator.stats_updated.connect(self.history.schedule_record)
+        self.experience_calculator.experience_updated.connect(self.history.schedule_record)
+        self.experience_calculator.experience_batch_updated.connect(self.history.schedule_record)
+        self.arts_calculator.arts_updated.connect(self.history.schedule_record)
+        self.traits_calculator.traits_updated.connect(self.history.schedule_record)
+        self.init_history_actions()
+        self.debug_tools.init_menu()
+
         # Connect the lock state signal
         self.progression_component.lock_state_changed.connect(self.update_component_lock_states)
 
@@ -74,6 +123,77 @@ class MainWindow(QMainWindow):
         self.tab_widget.setEnabled(False)
         self.update_component_lock_states(False)
     
+    def add_lazy_tab(self, name, title, factory):
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        index = self.tab_widget.addTab(placeholder, title)
+        self.lazy_tabs[index] = (name, factory)
+
+    def build_tab(self, index):
+        if index not in self.lazy_tabs:
+            return
+        name, factory = self.lazy_tabs.pop(index)
+        component = factory()
+        self.tab_widget.widget(index).layout().addWidget(component)
+        self.tab_components[name] = component
+        component.set_refresh_scheduler(self.refresh_scheduler)
+        component.set_locked(self.components_locked)
+        component.request_update()
+
+    def init_history_actions(self):
+        edit_menu = self.menuBar().addMenu("Edit")
+        self.undo_action = QAction("Undo", self)
+        self.undo_action.setShortcut(QKeySequence.Undo)
+        self.undo_action.triggered.connect(self.undo)
+        edit_menu.addAction(self.undo_action)
+        self.redo_action = QAction("Redo", self)
+        self.redo_action.setShortcut(QKeySequence.Redo)
+        self.redo_action.triggered.connect(self.redo)
+        edit_menu.addAction(self.redo_action)
+        edit_menu.addSeparator()
+        self.travel_action = QAction("Go to Level...", self)
+        self.travel_action.triggered.connect(self.travel_to_level)
+        edit_menu.addAction(self.travel_action)
+        self.history.history_changed.connect(self.update_history_actions)
+        self.update_history_actions(False, False)
+
+    def update_history_actions(self, can_undo, can_redo):
+        self.undo_action.setEnabled(can_undo)
+        self.redo_action.setEnabled(can_redo)
+
+    def undo(self):
+        state = self.history.undo()
+        if state is not None:
+            self.restore_state(state)
+
+    def redo(self):
+        state = self.history.redo()
+        if state is not None:
+            self.restore_state(state)
+
+    def restore_state(self, state):
+        # load_arts/load_traits ignore empty data, so start from a clean slate
+        self.progression_component.reset_all_calculators()
+        self.update_all_components(state)
+        self.event_recorder.mark_state_replaced()
+
+    def travel_to_level(self):
+        if not self.event_recorder.character_name:
+            QMessageBox.warning(self, "Error", "Please select a character first.")
+            return
+        level, ok = QInputDialog.getInt(self, "Go to Level", "Level:",
+                                        self.experience_calculator.get_level("character"), 0,
+                                        self.experience_calculator.MAX_LEVEL)
+        if not ok:
+            return
+        try:
+            state = self.event_recorder.state_at_level(level)
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+        self.restore_state(state)
+
     def handle_level_up(self, new_level, primary_stat):
         self.stats_calculator.handle_level_up(new_level, primary_stat)
 
@@ -81,13 +201,23 @@ class MainWindow(QMainWindow):
         # Load the character's data and update all components
         character_data = self.character_database.load_character(character_name)
         self.update_all_components(character_data)
+        self.history.clear()
+        self.event_recorder.set_character(character_name)
         self.tab_widget.setEnabled(True)
         self.update_component_lock_states(False)  # Unlock UI when a character is loaded
 
 
+    def remove_character_events(self, character_name):
+        # A new character with the same name must not inherit the old event log
+        self.event_store.remove_character(character_name)
+        if self.event_recorder.character_name == character_name:
+            self.event_recorder.set_character(None)
+
     def load_checkpoint_data(self, checkpoint_data):
         # Update all components with the checkpoint data
         self.update_all_components(checkpoint_data)
+        self.history.clear()
+        self.event_recorder.mark_state_replaced()
 
     def update_all_components(self, data):
         self.stats_calculator.load_stats(data.get('stats', {}))
@@ -95,27 +225,31 @@ class MainWindow(QMainWindow):
         self.experience_calculator.load_experience(data.get('experience', {}))
         self.arts_calculator.load_arts(data.get('arts', {}))
         self.traits_calculator.load_traits(data.get('traits', []))
+        if 'initial_stat_index' in data:
+            self.experience_calculator.initial_stat_index = data['initial_stat_index']
         self.update_components()
+        # Loading replaces the art and trait lists, so rebuild the tabs that show them
+        for name in ["arts", "traits"]:
+            if name in self.tab_components:
+                self.tab_components[name].request_update()
 
     def update_components(self):
-        # Update individual components
-        self.stats_component.update_display()
-        self.energy_component.update_display()
-        self.experience_component.update_display()
-        
-        # Update the arts and traits components
-        self.tab_widget.widget(1).update_display()  # Arts tab
-        self.tab_widget.widget(2).update_display()  # Traits tab
+        # Components are redrawn by the refresh scheduler, at most once per frame; energy, arts
+        # and traits follow the character graph instead
+        self.stats_component.request_update()
+        self.experience_component.request_update()
         
         # Update the progression component if needed
-        self.progression_component.update_display()
+        self.progression_component.request_update()
 
     def update_component_lock_states(self, is_locked):
         self.stats_component.set_locked(is_locked)
         self.energy_component.set_locked(is_locked)
         self.experience_component.set_locked(is_locked)
-        self.tab_widget.widget(1).set_locked(is_locked)  # Arts tab
-        self.tab_widget.widget(2).set_locked(is_locked)  # Traits tab
+        self.components_locked = is_locked
+        for name in ["arts", "traits"]:
+            if name in self.tab_components:
+                self.tab_components[name].set_locked(is_locked)
 
         # Enable or disable tabs based on lock state
         self.tab_widget.setEnabled(is_locked)
@@ -126,6 +260,8 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             # Save current character data before exiting
             self.progression_component.save_current_character_data()
+            self.debug_tools.shutdown()
+            self.progression_component.checkpoint_cache.shutdown()
             event.accept()
         else:
             event.ignore()
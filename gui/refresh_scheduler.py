@@ -0,0 +1,39 @@
+import time
+from PyQt5.QtCore import QObject, QTimer
+
+
+class RefreshScheduler(QObject):
+    """
+    Coalesces component redraws into at most one pass per frame.
+
+    Components mark themselves dirty with ``request_update()``; a single-shot
+    timer then renders each dirty component once. Hidden components (tabs that
+    are not shown) stay dirty until ``flush()`` runs while they are visible.
+    """
+
+    def __init__(self, frame_interval=16, parent=None):
+        super().__init__(parent)
+        self.frame_interval = frame_interval
+        self.dirty = []
+        self.last_flush = 0.0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def mark_dirty(self, component):
+        if component not in self.dirty:
+            self.dirty.append(component)
+        if not self.timer.isActive():
+            # Render right away after an idle period, otherwise wait for the next frame
+            elapsed = (time.monotonic() - self.last_flush) * 1000
+            self.timer.start(max(0, int(self.frame_interval - elapsed)))
+
+    def flush(self):
+        self.timer.stop()
+        self.last_flush = time.monotonic()
+        pending, self.dirty = self.dirty, []
+        for component in pending:
+            if component.isVisible():
+                component.update_display()
+            else:
+                self.dirty.append(component)
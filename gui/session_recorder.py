@@ -0,0 +1,350 @@
+import functools
+import importlib
+import json
+import os
+import time
+from datetime import datetime
+from PyQt5.QtCore import Qt
+from backend.core.instrumentation import positional_limit
+
+SESSION_VERSION = 1
+
+PROGRESSION = 'gui.components.character_progression_component'
+
+
+def _selected_art(component, *args):
+    return {'art': component.selected_art}
+
+
+def _art_fields(component):
+    return {'type': component.type_combo.currentText(), 'quality': component.quality_combo.currentText(),
+            'quality_level': component.quality_level_spin.value(), 'notes': component.notes_input.toPlainText()}
+
+
+def _trait_fields(component):
+    return {'quality': component.quality_combo.currentText(), 'quality_level': component.quality_level_spin.value(),
+            'notes': component.notes_input.toPlainText()}
+
+
+def _selected_trait(component):
+    selected_items = component.trait_list.selectedItems()
+    if not selected_items:
+        return None
+    return component.traits_calculator.get_traits()[component.trait_list.row(selected_items[0])]['name']
+
+
+# action -> (module, class, method, encode); encode turns the call into the
+# parameters ``replay_action`` needs, before the method runs
+SESSION_ACTIONS = {
+    'select_character': (PROGRESSION, 'CharacterProgressionComponent', 'on_character_selected',
+                         lambda component, item: {'character': item.text()}),
+    'select_chapter': (PROGRESSION, 'CharacterProgressionComponent', 'on_chapter_selected',
+                       lambda component, item: {'chapter': item.text()}),
+    'select_checkpoint': (PROGRESSION, 'CharacterProgressionComponent', 'on_checkpoint_selected',
+                          lambda component, item: {'checkpoint': item.text()}),
+    'scrub_checkpoint': (PROGRESSION, 'CharacterProgressionComponent', 'apply_scrub',
+                         lambda component: {'index': component.pending_scrub_index}),
+    'set_locked': (PROGRESSION, 'CharacterProgressionComponent', 'toggle_lock',
+                   lambda component, state: {'locked': state == Qt.Checked}),
+    'add_chapter': (PROGRESSION, 'CharacterProgressionComponent', 'create_chapter',
+                    lambda component, chapter_number: {'chapter': chapter_number}),
+    'add_checkpoint': (PROGRESSION, 'CharacterProgressionComponent', 'create_checkpoint',
+                       lambda component, checkpoint_name: {'checkpoint': checkpoint_name}),
+    'save_checkpoint': (PROGRESSION, 'CharacterProgressionComponent', 'save_current_state',
+                        lambda component, auto_save=False: {'auto_save': bool(auto_save)}),
+    'update_stat': ('gui.components.stats_component', 'StatsComponent', 'update_stat',
+                    lambda component, stat, category, change: {'stat': stat, 'category': category,
+                                                                'change': change}),
+    'allocate': ('gui.components.stats_component', 'StatsComponent', 'allocate',
+                 lambda component: {'plan': component.allocation_plan()}),
+    'select_initial_stat': ('gui.components.experience_component', 'ExperienceComponent', 'on_initial_stat_selected',
+                            lambda component, button: {
+                                'index': component.initial_stat_buttons.buttons().index(button)}),
+    'add_character_experience': ('gui.components.experience_component', 'ExperienceComponent',
+                                 'add_character_experience',
+                                 lambda component, input_widget: {'amount': input_widget.text()}),
+    'add_character_experience_percent': ('gui.components.experience_component', 'ExperienceComponent',
+                                         'add_character_experience_percent',
+                                         lambda component, input_widget: {'percent': input_widget.text()}),
+    'select_art': ('gui.components.arts_component', 'ArtsComponent', 'on_art_selection_changed',
+                   lambda component: {'art': component.art_list.selectedItems()[0].text().split(' (')[0]}
+                   if component.art_list.selectedItems() else None),
+    'add_mastery_experience': ('gui.components.arts_component', 'ArtsComponent', 'add_mastery_experience',
+                               lambda component, input_widget: dict(_selected_art(component),
+                                                                    amount=input_widget.text())),
+    'add_mastery_experience_percent': ('gui.components.arts_component', 'ArtsComponent',
+                                       'add_mastery_experience_percent',
+                                       lambda component, input_widget: dict(_selected_art(component),
+                                                                            percent=input_widget.text())),
+    'add_art': ('gui.components.arts_component', 'ArtsComponent', 'add_art',
+                lambda component: dict(_art_fields(component), name=component.name_input.text())),
+    'update_art': ('gui.components.arts_component', 'ArtsComponent', 'update_current_art',
+                   lambda component: dict(_art_fields(component), art=component.selected_art)
+                   if component.selected_art else None),
+    'remove_art': ('gui.components.arts_component', 'ArtsComponent', 'remove_art',
+                   lambda component: {'art': component.art_list.selectedItems()[0].text().split(' (')[0]}
+                   if component.art_list.selectedItems() else None),
+    'add_trait': ('gui.components.traits_component', 'TraitsComponent', 'add_trait',
+                  lambda component: dict(_trait_fields(component), name=component.name_input.text())),
+    'update_trait': ('gui.components.traits_component', 'TraitsComponent', 'update_trait',
+                     lambda component: dict(_trait_fields(component), trait=_selected_trait(component),
+                                            name=component.name_input.text())
+                     if _selected_trait(component) else None),
+    'remove_trait': ('gui.components.traits_component', 'TraitsComponent', 'remove_trait',
+                     lambda component: {'trait': _selected_trait(component)} if _selected_trait(component) else None),
+    'select_trait': ('gui.components.traits_component', 'TraitsComponent', 'on_trait_selection_changed',
+                     lambda component: {'trait': _selected_trait(component)} if _selected_trait(component) else None),
+    'add_trait_experience': ('gui.components.traits_component', 'TraitsComponent', 'add_experience',
+                             lambda component, input_widget: {'trait': _selected_trait(component),
+                                                              'amount': input_widget.text()}),
+    'add_trait_experience_percent': ('gui.components.traits_component', 'TraitsComponent', 'add_experience_percent',
+                                     lambda component, input_widget: {'trait': _selected_trait(component),
+                                                                      'percent': input_widget.text()}),
+    'undo': ('gui.main_window', 'MainWindow', 'undo', lambda window: {}),
+    'redo': ('gui.main_window', 'MainWindow', 'redo', lambda window: {}),
+}
+
+
+class SessionRecorder:
+    """
+    Records component-level user actions to a JSON lines session file.
+
+    The first line is a header; every following line is one action with its
+    parameters and the seconds since recording started, e.g.
+    ``{"t": 1.52, "action": "select_checkpoint", "params": {"checkpoint": "cp3"}}``.
+    Only the outermost action is recorded, so a checkpoint selection that
+    autosaves is stored once. ``install()`` patches the component classes and
+    has to run before the main window is built; tab switches are recorded once
+    ``attach()`` has been given the window. Nothing is recorded while
+    ``replaying`` is set.
+    """
+
+    def __init__(self, actions=SESSION_ACTIONS):
+        self.actions = actions
+        self.originals = []
+        self.path = None
+        self.started = None
+        self.depth = 0
+        self.replaying = False
+
+    @property
+    def installed(self):
+        return bool(self.originals)
+
+    @property
+    def recording(self):
+        return self.path is not None
+
+    def install(self):
+        if self.installed:
+            return
+        for action, (module_name, class_name, method_name, encode) in self.actions.items():
+            cls = getattr(importlib.import_module(module_name), class_name)
+            original = cls.__dict__[method_name]
+            setattr(cls, method_name, self._wrap(action, original, encode))
+            self.originals.append((cls, method_name, original))
+
+    def uninstall(self):
+        self.stop()
+        for cls, method_name, original in reversed(self.originals):
+            setattr(cls, method_name, original)
+        self.originals = []
+
+    def attach(self, main_window):
+        main_window.tab_widget.currentChanged.connect(lambda index: self.record('switch_tab', {'index': index}))
+
+    def start(self, path, data_directory):
+        self.stop()
+        self.path = path
+        self.started = time.perf_counter()
+        header = {'session': SESSION_VERSION, 'recorded_at': datetime.now().isoformat(),
+                  'data_directory': os.path.abspath(data_directory)}
+        with open(path, 'w') as f:
+            f.write(json.dumps(header) + '\n')
+
+    def stop(self):
+        self.path = None
+
+    def record(self, action, params):
+        if not self.recording or self.replaying or self.depth or params is None:
+            return
+        entry = {'t': round(time.perf_counter() - self.started, 3), 'action': action, 'params': params}
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+
+    def _wrap(self, action, function, encode):
+        max_args = positional_limit(function, bound=True)
+
+        @functools.wraps(function)
+        def recorded(instance, *args, **kwargs):
+            if max_args is not None and len(args) > max_args:
+                args = args[:max_args]
+            if self.recording:
+                # A call that cannot be encoded is left out of the session; the action itself still runs
+                try:
+                    self.record(action, encode(instance, *args, **kwargs))
+                except Exception as e:
+                    print(f"Error recording {action}: {type(e).__name__}: {str(e)}")
+            self.depth += 1
+            try:
+                return function(instance, *args, **kwargs)
+            finally:
+                self.depth -= 1
+        return recorded
+
+
+def read_session(path):
+    with open(path) as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get('session') != SESSION_VERSION:
+        raise ValueError(f"{path} is not a version {SESSION_VERSION} session file")
+    return lines[0], lines[1:]
+
+
+def _component(window, name):
+    attributes = {'progression': 'progression_component', 'stats': 'stats_component',
+                  'experience': 'experience_component'}
+    if name in attributes:
+        return getattr(window, attributes[name])
+    if name not in window.tab_components:
+        index = next(index for index, (tab_name, _) in window.lazy_tabs.items() if tab_name == name)
+        window.build_tab(index)
+    return window.tab_components[name]
+
+
+def _find_item(list_widget, text, prefix=False):
+    for row in range(list_widget.count()):
+        item = list_widget.item(row)
+        if item.text() == text or (prefix and item.text().startswith(f"{text} (")):
+            return item
+    raise ValueError(f"No list entry {text!r}")
+
+
+def _select_art(arts, art_name):
+    if arts.selected_art != art_name or not arts.art_list.selectedItems():
+        arts.art_list.setCurrentItem(_find_item(arts.art_list, art_name, prefix=True))
+
+
+def _select_trait(traits, trait_name):
+    names = [trait['name'] for trait in traits.traits_calculator.get_traits()]
+    if trait_name not in names:
+        raise ValueError(f"No trait {trait_name!r}")
+    if _selected_trait(traits) != trait_name:
+        traits.trait_list.setCurrentRow(names.index(trait_name))
+
+
+def _set_locked(progression, locked):
+    if progression.lock_checkbox.isChecked() != locked:
+        progression.lock_checkbox.setChecked(locked)
+    else:
+        progression.toggle_lock(Qt.Checked if locked else Qt.Unchecked)
+
+
+def _scrub(progression, index):
+    progression.pending_scrub_index = index
+    progression.apply_scrub()
+
+
+def _allocate(stats, plan):
+    stats.clear_allocation()
+    for stat, changes in plan.items():
+        for category, change in changes.items():
+            stats.stat_widgets[stat][f"{category}_allocation"].setValue(change)
+    stats.allocate()
+
+
+def _fill(component, params):
+    # Signals stay blocked so filling in the form does not edit the selected entry on its own
+    widgets = [component.name_input, component.quality_combo, component.quality_level_spin, component.notes_input]
+    if hasattr(component, 'type_combo'):
+        widgets.append(component.type_combo)
+    for widget in widgets:
+        widget.blockSignals(True)
+    try:
+        if 'name' in params:
+            component.name_input.setText(params['name'])
+        if 'type' in params:
+            component.type_combo.setCurrentText(params['type'])
+        component.quality_combo.setCurrentText(params['quality'])
+        component.quality_level_spin.setValue(params['quality_level'])
+        component.notes_input.setPlainText(params['notes'])
+    finally:
+        for widget in widgets:
+            widget.blockSignals(False)
+    return component
+
+
+def _enter(input_widget, text):
+    input_widget.setText(text)
+    return input_widget
+
+
+REPLAYERS = {
+    'select_character': lambda window, params: _component(window, 'progression').on_character_selected(
+        _find_item(window.progression_component.character_list, params['character'])),
+    'select_chapter': lambda window, params: _component(window, 'progression').on_chapter_selected(
+        _find_item(window.progression_component.chapter_list, params['chapter'])),
+    'select_checkpoint': lambda window, params: _component(window, 'progression').on_checkpoint_selected(
+        _find_item(window.progression_component.checkpoint_list, params['checkpoint'])),
+    'scrub_checkpoint': lambda window, params: _scrub(_component(window, 'progression'), params['index']),
+    'set_locked': lambda window, params: _set_locked(_component(window, 'progression'), params['locked']),
+    'add_chapter': lambda window, params: _component(window, 'progression').create_chapter(params['chapter']),
+    'add_checkpoint': lambda window, params: _component(window, 'progression').create_checkpoint(
+        params['checkpoint']),
+    'save_checkpoint': lambda window, params: _component(window, 'progression').save_current_state(
+        auto_save=params['auto_save']),
+    'update_stat': lambda window, params: _component(window, 'stats').update_stat(
+        params['stat'], params['category'], params['change']),
+    'allocate': lambda window, params: _allocate(_component(window, 'stats'), params['plan']),
+    'select_initial_stat': lambda window, params: window.experience_component.on_initial_stat_selected(
+        window.experience_component.initial_stat_buttons.buttons()[params['index']]),
+    'add_character_experience': lambda window, params: window.experience_component.add_character_experience(
+        _enter(window.experience_component.char_exp_input, params['amount'])),
+    'add_character_experience_percent': lambda window, params:
+        window.experience_component.add_character_experience_percent(
+            _enter(window.experience_component.char_exp_percent_input, params['percent'])),
+    'select_art': lambda window, params: _select_art(_component(window, 'arts'), params['art']),
+    'add_mastery_experience': lambda window, params: (
+        _select_art(_component(window, 'arts'), params['art']),
+        window.tab_components['arts'].add_mastery_experience(
+            _enter(window.tab_components['arts'].mastery_exp_input, params['amount']))),
+    'add_mastery_experience_percent': lambda window, params: (
+        _select_art(_component(window, 'arts'), params['art']),
+        window.tab_components['arts'].add_mastery_experience_percent(
+            _enter(window.tab_components['arts'].mastery_exp_percent_input, params['percent']))),
+    'add_art': lambda window, params: _fill(_component(window, 'arts'), params).add_art(),
+    'update_art': lambda window, params: (
+        _select_art(_component(window, 'arts'), params['art']),
+        _fill(window.tab_components['arts'], params).update_current_art()),
+    'remove_art': lambda window, params: (
+        _select_art(_component(window, 'arts'), params['art']),
+        window.tab_components['arts'].remove_art()),
+    'add_trait': lambda window, params: _fill(_component(window, 'traits'), params).add_trait(),
+    'update_trait': lambda window, params: (
+        _select_trait(_component(window, 'traits'), params['trait']),
+        _fill(window.tab_components['traits'], params).update_trait()),
+    'remove_trait': lambda window, params: (
+        _select_trait(_component(window, 'traits'), params['trait']),
+        window.tab_components['traits'].remove_trait()),
+    'select_trait': lambda window, params: _select_trait(_component(window, 'traits'), params['trait']),
+    'add_trait_experience': lambda window, params: (
+        _select_trait(_component(window, 'traits'), params['trait']),
+        window.tab_components['traits'].add_experience(
+            _enter(window.tab_components['traits'].exp_input, params['amount']))),
+    'add_trait_experience_percent': lambda window, params: (
+        _select_trait(_component(window, 'traits'), params['trait']),
+        window.tab_components['traits'].add_experience_percent(
+            _enter(window.tab_components['traits'].exp_percent_input, params['percent']))),
+    'switch_tab': lambda window, params: window.tab_widget.setCurrentIndex(params['index']),
+    'undo': lambda window, params: window.undo(),
+    'redo': lambda window, params: window.redo(),
+}
+
+
+def replay_action(window, action, params):
+    if action not in REPLAYERS:
+        raise ValueError(f"Unknown session action: {action}")
+    REPLAYERS[action](window, params)
+
+
+session_recorder = SessionRecorder()
@@ -0,0 +1,256 @@
+import importlib
+import inspect
+import json
+import time
+import weakref
+from collections import Counter, deque
+from backend.core.instrumentation import positional_limit
+
+# (module, class, signal) for every traced signal
+TRACED_SIGNALS = [
+    ('backend.core.stats_calculator', 'StatsCalculator', 'stats_updated'),
+    ('backend.core.energy_calculator', 'EnergyCalculator', 'energy_updated'),
+    ('backend.core.experience_calculator', 'ExperienceCalculator', 'experience_updated'),
+    ('backend.core.experience_calculator', 'ExperienceCalculator', 'experience_batch_updated'),
+    ('backend.core.experience_calculator', 'ExperienceCalculator', 'character_level_up'),
+    ('backend.core.experience_calculator', 'ExperienceCalculator', 'character_levels_gained'),
+    ('backend.core.arts_calculator', 'ArtsCalculator', 'arts_updated'),
+    ('backend.core.traits_calculator', 'TraitsCalculator', 'traits_updated'),
+    ('backend.core.character_graph', 'CharacterGraph', 'values_changed'),
+    ('gui.components.character_progression_component', 'CharacterProgressionComponent', 'character_selected'),
+    ('gui.components.character_progression_component', 'CharacterProgressionComponent', 'checkpoint_selected'),
+    ('gui.components.character_progression_component', 'CharacterProgressionComponent', 'lock_state_changed'),
+]
+
+
+class TracedSignal:
+    """Stands in for a signal on the class so instances hand out traced bound signals."""
+
+    def __init__(self, tracer, name, signal):
+        self.tracer = tracer
+        self.name = name
+        self.signal = signal
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.signal
+        return TracedBoundSignal(self.tracer, self.name, self.signal.__get__(instance, owner))
+
+
+class TracedBoundSignal:
+    def __init__(self, tracer, name, bound):
+        self.tracer = tracer
+        self.name = name
+        self.bound = bound
+
+    def connect(self, slot, *args, **kwargs):
+        if isinstance(slot, TracedBoundSignal):
+            slot = slot.bound
+        elif callable(slot):
+            slot = self.tracer.wrap_slot(slot)
+        return self.bound.connect(slot, *args, **kwargs)
+
+    def disconnect(self, *args):
+        if args and isinstance(args[0], TracedBoundSignal):
+            args = (args[0].bound,)
+        elif args:
+            args = (self.tracer.wrapped_slots.get(_slot_key(args[0]), args[0]),)
+        return self.bound.disconnect(*args)
+
+    def emit(self, *args):
+        self.tracer.enter('signal', self.name)
+        try:
+            self.bound.emit(*args)
+        finally:
+            self.tracer.leave()
+
+    def __getattr__(self, name):
+        return getattr(self.bound, name)
+
+
+class SignalTracer:
+    """
+    Records, per user action, the tree of traced signal emissions and the slots
+    they ran, with timings.
+
+    ``install()`` replaces the signals in ``TRACED_SIGNALS`` on their classes, so
+    it has to run before anything connects to them. Actions are delimited by
+    ``start_action``, normally driven by an ``ActionMonitor``; everything that
+    happens until the next action, including deferred timer work, belongs to
+    the current one. A slot that runs more than once within an action is
+    reported as a duplicate.
+    """
+
+    def __init__(self, traced_signals=TRACED_SIGNALS, max_actions=200):
+        self.traced_signals = traced_signals
+        self.actions = deque(maxlen=max_actions)
+        self.originals = []
+        self.wrapped_slots = {}
+        self.enabled = False
+        self.stack = []
+        self.current = None
+        self.start_action("startup", "MainWindow")
+
+    @property
+    def installed(self):
+        return bool(self.originals)
+
+    def install(self):
+        if self.installed:
+            return
+        for module_name, class_name, signal_name in self.traced_signals:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            signal = cls.__dict__[signal_name]
+            setattr(cls, signal_name, TracedSignal(self, f"{class_name}.{signal_name}", signal))
+            self.originals.append((cls, signal_name, signal))
+        self.enabled = True
+
+    def uninstall(self):
+        for cls, signal_name, signal in reversed(self.originals):
+            setattr(cls, signal_name, signal)
+        self.originals = []
+        self.enabled = False
+
+    def wrap_slot(self, slot):
+        key = _slot_key(slot)
+        if key in self.wrapped_slots and self.wrapped_slots[key].target() is not None:
+            return self.wrapped_slots[key]
+        name = _slot_name(slot)
+        max_args = _max_args(slot)
+        # Bound methods are held weakly, like Qt does, so receivers can still be deleted
+        target = weakref.WeakMethod(slot) if inspect.ismethod(slot) else (lambda: slot)
+
+        def traced(*args):
+            function = target()
+            if function is None:
+                return None
+            if max_args is not None and len(args) > max_args:
+                args = args[:max_args]
+            if not self.enabled:
+                return function(*args)
+            self.enter('slot', name)
+            try:
+                return function(*args)
+            finally:
+                self.leave()
+
+        traced.target = target
+        self.wrapped_slots[key] = traced
+        return traced
+
+    def start_action(self, label, component):
+        self.finish_action()
+        self.current = {'label': label, 'component': component, 'children': []}
+
+    def finish_action(self):
+        if self.current is not None and self.current['children']:
+            self.actions.append(self.current)
+        self.current = None
+
+    def enter(self, kind, name):
+        if not self.enabled or self.current is None:
+            self.stack.append(None)
+            return
+        node = {'kind': kind, 'name': name, 'children': []}
+        parent = self.stack[-1] if self.stack and self.stack[-1] is not None else self.current
+        parent['children'].append(node)
+        self.stack.append(node)
+        node['start'] = time.perf_counter()
+
+    def leave(self):
+        node = self.stack.pop()
+        if node is not None:
+            node['duration'] = time.perf_counter() - node.pop('start')
+
+    def recorded_actions(self):
+        # The current action keeps recording; it is included as it stands
+        actions = list(self.actions)
+        if self.current is not None and self.current['children']:
+            actions.append(self.current)
+        return actions
+
+    def report(self):
+        report = []
+        for action in self.recorded_actions():
+            slot_calls = Counter()
+            _count_slots(action['children'], slot_calls)
+            report.append({
+                'action': action['label'],
+                'component': action['component'],
+                'duration_ms': round(sum(_duration(node) for node in action['children']) * 1000, 3),
+                'duplicates': {name: count for name, count in slot_calls.items() if count > 1},
+                'tree': [_node_report(node) for node in action['children']],
+            })
+        return report
+
+    def folded_stacks(self):
+        """Lines of ``frame;frame;frame self-time-in-microseconds`` for flame graph tools."""
+        totals = Counter()
+        for action in self.recorded_actions():
+            _fold(action['children'], [_frame(action['label'])], totals)
+        return [f"{stack} {value}" for stack, value in totals.items()]
+
+    def save(self, path):
+        """Write ``path`` as folded stacks and a JSON report with the same name next to it."""
+        with open(path, 'w') as f:
+            f.write('\n'.join(self.folded_stacks()) + '\n')
+        report_path = path.rsplit('.', 1)[0] + '.json'
+        report = self.report()
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report_path, report
+
+
+def _slot_key(slot):
+    # Bound methods are created on every attribute access but compare equal
+    if inspect.ismethod(slot):
+        return (id(slot.__self__), slot.__func__)
+    return slot
+
+
+def _slot_name(slot):
+    if inspect.ismethod(slot):
+        return f"{type(slot.__self__).__name__}.{slot.__func__.__name__}"
+    return getattr(slot, '__qualname__', repr(slot))
+
+
+def _max_args(slot):
+    if inspect.ismethod(slot):
+        return positional_limit(slot.__func__, bound=True)
+    return positional_limit(slot)
+
+
+def _count_slots(nodes, counter):
+    for node in nodes:
+        if node['kind'] == 'slot':
+            counter[node['name']] += 1
+        _count_slots(node['children'], counter)
+
+
+def _duration(node):
+    # Nodes still on the stack have no duration yet
+    return node.get('duration', 0.0)
+
+
+def _node_report(node):
+    return {
+        'kind': node['kind'],
+        'name': node['name'],
+        'duration_ms': round(_duration(node) * 1000, 3),
+        'children': [_node_report(child) for child in node['children']],
+    }
+
+
+def _frame(name):
+    return name.replace(';', ',').replace(' ', '_').replace('\n', '_')
+
+
+def _fold(nodes, stack, totals):
+    for node in nodes:
+        frames = stack + [_frame(node['name'])]
+        own = _duration(node) - sum(_duration(child) for child in node['children'])
+        totals[';'.join(frames)] += max(0, int(own * 1_000_000))
+        _fold(node['children'], frames, totals)
+
+
+signal_tracer = SignalTracer()
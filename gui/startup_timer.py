@@ -0,0 +1,57 @@
+import json
+import sys
+import time
+from PyQt5.QtCore import QObject, QEvent, QTimer
+from PyQt5.QtWidgets import QApplication
+
+STARTUP_PHASES = ['imports', 'window_construction', 'first_paint', 'first_character_loaded']
+
+
+class StartupTimer(QObject):
+    """
+    Time from process start to each startup phase, in milliseconds.
+
+    ``imports`` and ``window_construction`` are marked by the caller; the first
+    paint and the first loaded character are detected from the running window.
+    """
+
+    def __init__(self, start, on_complete=None):
+        super().__init__()
+        self.start = start
+        self.marks = {}
+        self.on_complete = on_complete
+
+    def mark(self, phase):
+        if phase not in self.marks:
+            self.marks[phase] = (time.perf_counter() - self.start) * 1000
+        if all(phase in self.marks for phase in STARTUP_PHASES) and self.on_complete is not None:
+            on_complete, self.on_complete = self.on_complete, None
+            on_complete(self.report())
+
+    def watch(self, main_window):
+        QApplication.instance().installEventFilter(self)
+        main_window.progression_component.character_selected.connect(self.on_character_selected)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            QApplication.instance().removeEventFilter(self)
+            self.mark('first_paint')
+        return False
+
+    def on_character_selected(self, character_name):
+        # The progression component finishes loading after the signal returns
+        QTimer.singleShot(0, lambda: self.mark('first_character_loaded'))
+
+    def report(self):
+        return {phase: round(self.marks[phase], 1) for phase in STARTUP_PHASES if phase in self.marks}
+
+
+def print_report(report, destination="1"):
+    if destination.endswith('.json'):
+        with open(destination, 'w') as f:
+            json.dump(report, f, indent=2)
+        return
+    print("Startup timing (ms since start):", file=sys.stderr)
+    for phase in STARTUP_PHASES:
+        value = report.get(phase)
+        print(f"  {phase:<24}{'-' if value is None else f'{value:8.1f}'}", file=sys.stderr)
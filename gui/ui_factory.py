@@ -1,27 +1,30 @@
-from .components.stats_component import StatsComponent
-from .components.energy_component import EnergyComponent
-from .components.experience_component import ExperienceComponent
-from .components.arts_component import ArtsComponent
-from .components.traits_component import TraitsComponent
-from .components.character_progression_component import CharacterProgressionComponent
-
 class UIFactory:
     @staticmethod
     def create_component(component_type, *args, **kwargs):
+        # Component modules are imported on first use so startup only pays for what is shown
         if component_type == "stats":
+            from .components.stats_component import StatsComponent
             return StatsComponent(*args, **kwargs)
         elif component_type == "energy":
+            from .components.energy_component import EnergyComponent
             return EnergyComponent(*args, **kwargs)
         elif component_type == "arts":
-            if len(args) >= 3:
-                return ArtsComponent(args[0], args[1], args[2])
+            if len(args) >= 4:
+                from .components.arts_component import ArtsComponent
+                return ArtsComponent(args[0], args[1], args[2], args[3])
             else:
-                raise ValueError("ArtsComponent requires arts_calculator, experience_calculator, and stats_calculator")
+                raise ValueError("ArtsComponent requires arts_calculator, experience_calculator, stats_calculator, and character_graph")
         elif component_type == "experience":
+            from .components.experience_component import ExperienceComponent
             return ExperienceComponent(*args, **kwargs)
         elif component_type == "traits":
+            from .components.traits_component import TraitsComponent
             return TraitsComponent(*args, **kwargs)
         elif component_type == "character_progression":
+            from .components.character_progression_component import CharacterProgressionComponent
             return CharacterProgressionComponent(*args, **kwargs)
+        elif component_type == "checkpoint_compare":
+            from .components.checkpoint_compare_component import CheckpointCompareComponent
+            return CheckpointCompareComponent(*args, **kwargs)
         else:
             raise ValueError(f"Unknown component type: {component_type}")
@@ -0,0 +1,117 @@
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.core.calculation_service import CalculationService
+
+# Batches larger than this are rejected rather than tying up every worker
+MAX_BATCH_SIZE = 1000
+
+
+class CalculationRequestHandler(BaseHTTPRequestHandler):
+    """
+    ``POST /compute`` with one request object, or ``{"batch": [request, ...]}``.
+
+    Responses are JSON: the computed results, ``{"results": [...]}`` for a
+    batch (failed entries hold ``{"error": message}``), or ``{"error": message}``
+    with status 400. ``GET /health`` reports the pool size.
+    """
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; with Nagle's algorithm every keep-alive reply waits for a delayed ACK
+    disable_nagle_algorithm = True
+    server_version = "LitRPGCalculation/1.0"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_json(200, {'status': 'ok', 'workers': self.server.service.workers})
+        else:
+            self.send_json(404, {'error': f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/compute":
+            self.send_json(404, {'error': f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'null')
+        except ValueError as e:
+            self.send_json(400, {'error': f"Invalid JSON: {str(e)}"})
+            return
+
+        service = self.server.service
+        if isinstance(request, dict) and 'batch' in request:
+            batch = request['batch']
+            if not isinstance(batch, list) or len(batch) > MAX_BATCH_SIZE:
+                self.send_json(400, {'error': f"'batch' must be a list of at most {MAX_BATCH_SIZE} requests"})
+                return
+            try:
+                results = service.compute_batch(batch)
+            except Exception as e:
+                self.send_json(500, {'error': f"Internal error: {type(e).__name__}: {str(e)}"})
+                return
+            self.send_json(200, {'results': results})
+            return
+        try:
+            result = service.compute(request)
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            # Anything else is a bug; still answer so keep-alive clients are not left hanging
+            self.send_json(500, {'error': f"Internal error: {type(e).__name__}: {str(e)}"})
+            return
+        self.send_json(200, result)
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class CalculationServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections when many clients connect at once
+    request_queue_size = 128
+
+
+def create_server(host="127.0.0.1", port=8765, data_directory=None, workers=2, verbose=False):
+    service = CalculationService(data_directory, workers)
+    service.start()
+    server = CalculationServer((host, port), CalculationRequestHandler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve character calculations as JSON over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument("--data", default="data", help="data directory for requests by character name")
+    parser.add_argument("--workers", type=int, default=2, help="calculator contexts in the pool")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.data if os.path.isdir(args.data) else None,
+                           max(1, args.workers), args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} with {args.workers} workers", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
+
+
+if __name__ == "__main__":
+    main()